@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Pontos de inserção nomeados, resolvidos a partir da estrutura do arquivo
+
+Em vez de regexes preguiçosas e multilinha (que podem retroceder muito em
+páginas grandes e casar no lugar errado sem avisar), cada âncora é
+calculada sobre o índice de tokens/JSX do arquivo e devolve um offset
+exato. Todas as âncoras de um conteúdo são resolvidas de uma vez e ficam em
+cache, então vários patches no mesmo buffer não retokenizam à toa.
+
+Uso em um passo de patch:
+    offset = anchor_offset(content, "after_duration_field")
+    if offset is None:
+        return None
+    return splice(content, offset, snippet)
+"""
+import re
+from bisect import bisect_left
+from functools import lru_cache
+
+import profiling
+from tsx_lexer import PUNCT
+from tsx_index import build_index
+
+# nome -> função(índice) que devolve o offset (ou None)
+ANCHORS = {}
+
+USE_STATE_INIT_RE = re.compile(r"[^=]*=\s*useState\b")
+
+
+def anchor(name):
+    """Decorador que registra o resolvedor de uma âncora"""
+    def decorator(func):
+        ANCHORS[name] = func
+        return func
+    return decorator
+
+
+@lru_cache(maxsize=16)
+def resolve_anchors(content):
+    """Resolve todas as âncoras registradas para o conteúdo (uma tokenização)"""
+    index = build_index(content)
+    offsets = {}
+    for name, resolver in ANCHORS.items():
+        with profiling.span(f"anchor:{name}") as span:
+            offsets[name] = resolver(index)
+            span.matches = offsets[name] is not None
+    return offsets
+
+
+def anchor_offset(content, name):
+    """Offset da âncora ``name`` no conteúdo, ou ``None`` se a estrutura não existe"""
+    if name not in ANCHORS:
+        raise KeyError(f"Âncora desconhecida: {name}")
+    return resolve_anchors(content)[name]
+
+
+def splice(content, offset, snippet):
+    """Insere ``snippet`` em ``offset``"""
+    return content[:offset] + snippet + content[offset:]
+
+
+def insert_at_anchor(content, name, snippet):
+    """Insere ``snippet`` na âncora; ``None`` se a âncora não foi encontrada"""
+    offset = anchor_offset(content, name)
+    if offset is None:
+        return None
+    return splice(content, offset, snippet)
+
+
+# ---------------------------------------------------------------------------
+# Auxiliares
+# ---------------------------------------------------------------------------
+
+def _default_component(index):
+    """Componente exportado por padrão (ou o primeiro componente do arquivo)"""
+    text = index.text
+    for symbol in index.components:
+        if text.startswith("export default", symbol.start):
+            return symbol
+    return index.components[0] if index.components else None
+
+
+def _line_end(text, offset):
+    """Fim da linha que contém ``offset`` (antes do \\n)"""
+    end = text.find("\n", offset)
+    return len(text) if end < 0 else end
+
+
+def _find_element(index, predicate):
+    for element in index.lexer.elements:
+        if predicate(element):
+            return element
+    return None
+
+
+def _ancestor(element, name):
+    parent = element.parent
+    while parent is not None and parent.name != name:
+        parent = parent.parent
+    return parent
+
+
+def _enclosing_expression_end(index, element):
+    """Fim (após o "}") do ``{...}`` JSX que envolve o elemento, ex.: ``{cond && (<a/>)}``"""
+    tokens = index.lexer.tokens
+    pairs = index.lexer.pairs
+    starts = [t.start for t in tokens]
+    i = bisect_left(starts, element.start) - 1
+    while i >= 0:
+        tok = tokens[i]
+        if tok.kind == PUNCT and tok.value == "{" and tok.depth < element.depth:
+            close = pairs.get(tok.start)
+            if close is not None and close >= element.end:
+                return close + 1
+            return None
+        i -= 1
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Âncoras
+# ---------------------------------------------------------------------------
+
+@anchor("after_last_import")
+def after_last_import(index):
+    """Fim da linha do último import"""
+    imports = [s for s in index.symbols if s.kind == "import"]
+    return _line_end(index.text, imports[-1].end - 1) if imports else None
+
+
+@anchor("after_last_use_state")
+def after_last_use_state(index):
+    """Fim da linha do último ``useState`` no corpo do componente principal"""
+    component = _default_component(index)
+    if component is None:
+        return None
+    text = index.text
+    states = [s for s in index.component_symbols(component.name)
+              if s.kind == "hook" and USE_STATE_INIT_RE.match(text, s.start, s.end)]
+    return _line_end(text, states[-1].end - 1) if states else None
+
+
+@anchor("after_duration_field")
+def after_duration_field(index):
+    """Logo após o ``</div>`` que envolve o input de duração da aula"""
+    element = _find_element(
+        index, lambda e: isinstance(e.attrs.get("placeholder"), str)
+        and e.attrs["placeholder"].startswith("Duração"))
+    container = _ancestor(element, "div") if element else None
+    return container.end if container and container.end is not None else None
+
+
+@anchor("after_certificate_link")
+def after_certificate_link(index):
+    """Logo após o ``{... && (<a href=/certificates/...>)}`` do cabeçalho do curso"""
+    element = _find_element(
+        index, lambda e: e.name == "a" and "certificates" in index.text[e.start:e.tag_end or e.start])
+    if element is None or element.end is None:
+        return None
+    return _enclosing_expression_end(index, element)
@@ -6,7 +6,11 @@ import { ArrowLeft, Plus, Trash2, Upload } from 'lucide-react';
 import { courseService } from '@/services/courseService';
 import toast from 'react-hot-toast';
 import Link from 'next/link';
-import QuizEditor from '@/components/QuizEditor';
+import dynamic from 'next/dynamic';
+
+const QuizEditor = dynamic(() => import('@/components/QuizEditor'), {
+  loading: () => <p className="py-4 text-center text-gray-600">Carregando editor do questionário...</p>,
+});
 
 export default function EditCoursePage({ params }: { params: { id: string } }) {
   const router = useRouter();
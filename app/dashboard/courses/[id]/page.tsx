@@ -9,7 +9,11 @@ import { certificateService } from '@/services/certificateService';
 import toast from 'react-hot-toast';
 import Link from 'next/link';
 import { Course, Progress, Module, Lesson } from '@/types';
-import QuizPlayer from '@/components/QuizPlayer';
+import dynamic from 'next/dynamic';
+
+const QuizPlayer = dynamic(() => import('@/components/QuizPlayer'), {
+  loading: () => <p className="py-4 text-center text-gray-600">Carregando questionário...</p>,
+});
 
 export default function CourseViewPage({ params }: { params: { id: string } }) {
   const router = useRouter();
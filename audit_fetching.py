@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""Audita como as páginas buscam dados: chamadas a ``services/*`` e endpoints da API
+
+Lê os serviços (``export const xService = { ... }``) e, para cada método,
+as chamadas ``api.get/post/put/patch/delete`` que ele faz no cliente de
+``lib/api.ts`` (com ``${id}`` virando ``:id``). Depois mapeia as chamadas
+``xService.metodo(...)`` em app/ e components/: onde ficam, se rodam ao
+abrir a página (dentro de ``useEffect`` ou de funções chamadas por ele), se
+são aguardadas em série, em ``Promise.all`` ou dentro de laço.
+
+Cada rota (``page.tsx`` + layouts, mais os componentes que ela carrega,
+pelo grafo do import_graph) mostra as requisições feitas ao abrir e três
+tipos de aviso:
+
+- awaits em série: leituras independentes aguardadas uma depois da outra
+  (a segunda não usa o resultado da primeira) - dá para usar ``Promise.all``;
+- busca duplicada: a mesma leitura repetida na mesma função, ou o mesmo
+  endpoint buscado por mais de um arquivo da rota ao abrir;
+- N+1: chamada dentro de ``for``/``while`` ou de ``map``/``forEach``,
+  uma requisição por item (mesmo em ``Promise.all`` continuam N).
+
+Uso:
+    python audit_fetching.py                     # todas as rotas
+    python audit_fetching.py /dashboard/courses  # rotas com esse prefixo
+    python audit_fetching.py --json > fetching.json
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from bisect import bisect_left
+
+from codemod import FRONTEND_DIR, discover_files, read_file
+from import_graph import ImportGraph, display_path
+from tsx_index import build_index
+from tsx_lexer import IDENT, PUNCT
+
+API_MODULE = "@/lib/api"
+SERVICES_DIR = "services"
+SERVICE_PREFIX = "@/services/"
+SCAN_DIRS = ("app", "components")
+SUFFIXES = (".tsx", ".ts")
+BOM = "\ufeff"
+
+HTTP_VERBS = frozenset({"get", "post", "put", "patch", "delete", "head"})
+READ_VERBS = frozenset({"get", "head"})
+EFFECT_HOOKS = frozenset({"useEffect", "useLayoutEffect"})
+PARALLEL_CALLS = frozenset({"all", "allSettled", "race", "any"})
+LOOP_KEYWORDS = frozenset({"for", "while", "do"})
+ITERATION_METHODS = frozenset({"map", "forEach", "flatMap", "filter", "reduce", "some", "every", "find"})
+DECLARATION_KEYWORDS = frozenset({"const", "let", "var"})
+
+TEMPLATE_PARAM_RE = re.compile(r"\$\{([^}]*)\}")
+LAST_NAME_RE = re.compile(r"([A-Za-z_$][\w$]*)\W*$")
+
+# Tipos de aviso
+SERIAL = "serial"
+DUPLICATE = "duplicate"
+N_PLUS_ONE = "n+1"
+
+ISSUE_ICONS = {SERIAL: "⏳", DUPLICATE: "♻️ ", N_PLUS_ONE: "🔁"}
+
+
+class Endpoint:
+    """Requisição feita por um método de serviço (``GET /courses/:id``)"""
+    __slots__ = ("verb", "path")
+
+    def __init__(self, verb, path):
+        self.verb = verb
+        self.path = path
+
+    @property
+    def read(self):
+        return self.verb in READ_VERBS
+
+    def __str__(self):
+        return f"{self.verb.upper()} {self.path}"
+
+
+def endpoint_path(argument):
+    """Primeiro argumento de ``api.get(...)`` como caminho (``${id}`` -> ``:id``)"""
+    argument = argument.strip()
+    if len(argument) < 2 or argument[0] not in "'\"`" or argument[-1] != argument[0]:
+        return f"<{argument}>"
+
+    def param(match):
+        name = LAST_NAME_RE.search(match.group(1).strip())
+        return ":" + (name.group(1) if name else "param")
+
+    return TEMPLATE_PARAM_RE.sub(param, argument[1:-1])
+
+
+def _is(tok, kind, values):
+    return tok.kind == kind and tok.value in values
+
+
+def _argument_texts(text, tokens, open_index, pairs):
+    """Textos dos argumentos da chamada cujo ``(`` está em ``tokens[open_index]``"""
+    open_tok = tokens[open_index]
+    close = pairs.get(open_tok.start)
+    if close is None:
+        return []
+    arguments = []
+    start = open_tok.end
+    k = open_index + 1
+    while k < len(tokens) and tokens[k].start < close:
+        tok = tokens[k]
+        if tok.depth == open_tok.depth + 1 and _is(tok, PUNCT, (",",)):
+            arguments.append(text[start:tok.start].strip())
+            start = tok.end
+        k += 1
+    last = text[start:close].strip()
+    if last:
+        arguments.append(last)
+    return arguments
+
+
+def _api_calls(text, tokens, pairs, api_names, start, end):
+    """Chamadas ``api.<verbo>(...)`` entre ``start`` e ``end``"""
+    endpoints = []
+    for i, tok in enumerate(tokens):
+        if tok.start < start:
+            continue
+        if tok.start >= end or i + 3 >= len(tokens):
+            break
+        if not (tok.kind == IDENT and tok.value in api_names
+                and _is(tokens[i + 1], PUNCT, (".", "?.")) and _is(tokens[i + 2], IDENT, HTTP_VERBS)):
+            continue
+        verb = tokens[i + 2]
+        # pula o genérico (api.get<ApiResponse<...>>) até o "(" na profundidade do verbo
+        k = i + 3
+        while k < len(tokens) and not (tokens[k].depth == verb.depth and _is(tokens[k], PUNCT, ("(",))):
+            if tokens[k].depth < verb.depth or (tokens[k].depth == verb.depth and _is(tokens[k], PUNCT, (";",))):
+                break
+            k += 1
+        if k < len(tokens) and _is(tokens[k], PUNCT, ("(",)):
+            arguments = _argument_texts(text, tokens, k, pairs)
+            endpoints.append(Endpoint(verb.value, endpoint_path(arguments[0]) if arguments else "<?>"))
+    return endpoints
+
+
+def parse_service(text):
+    """``{serviço: {método: [Endpoint]}}`` dos objetos exportados por um arquivo de serviço"""
+    index = build_index(text, jsx=False)
+    lexer = index.lexer
+    tokens = lexer.tokens
+    api_names = {s.name for s in index.symbols if s.kind == "import" and s.source == API_MODULE}
+    services = {}
+    if not api_names:
+        return services
+    for i, tok in enumerate(tokens[:-3]):
+        if not (_is(tok, IDENT, DECLARATION_KEYWORDS) and tok.depth == 0 and tokens[i + 1].kind == IDENT
+                and _is(tokens[i + 2], PUNCT, ("=",)) and _is(tokens[i + 3], PUNCT, ("{",))):
+            continue
+        body = tokens[i + 3]
+        close = lexer.pairs.get(body.start, len(text))
+        # métodos: "nome(" (abreviado) ou "nome:" no primeiro nível do objeto
+        starts = []
+        for k in range(i + 4, len(tokens) - 1):
+            cur = tokens[k]
+            if cur.start >= close:
+                break
+            previous = tokens[k - 2] if _is(tokens[k - 1], IDENT, ("async",)) else tokens[k - 1]
+            if cur.depth == body.depth + 1 and cur.kind == IDENT and _is(tokens[k + 1], PUNCT, ("(", ":")) \
+                    and _is(previous, PUNCT, ("{", ",")):
+                starts.append((cur.value, cur.start))
+        methods = services[tokens[i + 1].value] = {}
+        for n, (name, start) in enumerate(starts):
+            end = starts[n + 1][1] if n + 1 < len(starts) else close
+            methods[name] = _api_calls(text, tokens, lexer.pairs, api_names, start, end)
+    return services
+
+
+def load_services(root=FRONTEND_DIR):
+    """Serviços de ``services/`` -> ``({serviço: {método: [Endpoint]}}, {serviço: arquivo})``"""
+    services = {}
+    files = {}
+    for path in discover_files(root, (SERVICES_DIR,), (".ts",)):
+        for name, methods in parse_service(read_file(path).lstrip(BOM)).items():
+            services[name] = methods
+            files[name] = path
+    return services, files
+
+
+class FetchCall:
+    """Chamada ``serviço.método(...)`` num arquivo de app/ ou components/"""
+    __slots__ = ("service", "method", "arguments", "start", "end", "line", "depth", "context",
+                 "context_start", "awaited", "parallel", "group", "loop", "on_mount", "bindings", "endpoints")
+
+    def __init__(self, service, method, arguments, start, end, line, depth, endpoints):
+        self.service = service
+        self.method = method
+        self.arguments = arguments
+        self.start = start
+        self.end = end
+        self.line = line
+        self.depth = depth
+        self.endpoints = endpoints
+        self.context = None         # função (ou hook) que contém a chamada
+        self.context_start = None
+        self.awaited = False
+        self.parallel = False       # dentro de Promise.all/allSettled/...
+        self.group = None           # offset do Promise.all que a contém
+        self.loop = None            # (linha, descrição) do laço que a contém
+        self.on_mount = False       # roda ao abrir a página
+        self.bindings = set()       # nomes que recebem o resultado
+
+    @property
+    def name(self):
+        return f"{self.service}.{self.method}"
+
+    @property
+    def key(self):
+        return f"{self.name}({', '.join(' '.join(a.split()) for a in self.arguments)})"
+
+    @property
+    def read(self):
+        """Só faz leituras (GET) - ``False`` se o método não foi encontrado nos serviços"""
+        return bool(self.endpoints) and all(e.read for e in self.endpoints)
+
+    def as_dict(self):
+        return {"call": self.key, "line": self.line, "context": self.context,
+                "endpoints": [str(e) for e in self.endpoints], "awaited": self.awaited,
+                "parallel": self.parallel, "loop": self.loop[1] if self.loop else None,
+                "on_mount": self.on_mount}
+
+
+class Issue:
+    """Aviso de um arquivo ou de uma rota"""
+    __slots__ = ("kind", "path", "line", "message", "calls")
+
+    def __init__(self, kind, path, line, message, calls):
+        self.kind = kind
+        self.path = path
+        self.line = line
+        self.message = message
+        self.calls = calls
+
+    def as_dict(self):
+        return {"kind": self.kind, "file": display_path(self.path), "line": self.line,
+                "message": self.message, "calls": [c.key for c in self.calls]}
+
+
+def _bracket_ranges(tokens, pairs, test):
+    """``(início, fim, linha do token)`` do ``(`` que segue cada token aceito por ``test``"""
+    ranges = []
+    for i, tok in enumerate(tokens[:-1]):
+        label = test(tokens, i)
+        if label and _is(tokens[i + 1], PUNCT, ("(",)):
+            close = pairs.get(tokens[i + 1].start)
+            if close is not None:
+                ranges.append((tokens[i + 1].start, close, tok.start, label))
+    return ranges
+
+
+def _parallel_call(tokens, i):
+    return i >= 2 and _is(tokens[i], IDENT, PARALLEL_CALLS) and _is(tokens[i - 1], PUNCT, (".",)) \
+        and _is(tokens[i - 2], IDENT, ("Promise",))
+
+
+def _effect_call(tokens, i):
+    return _is(tokens[i], IDENT, EFFECT_HOOKS) and not (i and _is(tokens[i - 1], PUNCT, (".", "?.")))
+
+
+def _iteration_call(tokens, i):
+    if i and _is(tokens[i], IDENT, ITERATION_METHODS) and _is(tokens[i - 1], PUNCT, (".", "?.")):
+        return f".{tokens[i].value}()"
+    return None
+
+
+def _loop_ranges(lexer):
+    """Corpos de ``for``/``while``/``do`` e callbacks de ``map``/``forEach``/...: (início, fim, offset, rótulo)"""
+    tokens = lexer.tokens
+    pairs = lexer.pairs
+    ranges = _bracket_ranges(tokens, pairs, _iteration_call)
+    for i, tok in enumerate(tokens[:-1]):
+        if not (tok.kind == IDENT and tok.value in LOOP_KEYWORDS) or (i and _is(tokens[i - 1], PUNCT, (".",))):
+            continue
+        k = i + 1
+        if tok.value != "do":
+            if not _is(tokens[k], PUNCT, ("(",)) or tokens[k].start not in pairs:
+                continue
+            close = pairs[tokens[k].start]
+            while k < len(tokens) and tokens[k].start <= close:
+                k += 1
+            if k >= len(tokens):
+                continue
+        body = tokens[k]
+        if _is(body, PUNCT, ("{",)):
+            end = pairs.get(body.start, len(lexer.text))
+        else:
+            end = next((t.start for t in tokens[k:] if t.depth <= tok.depth and _is(t, PUNCT, (";", "}"))),
+                       len(lexer.text))
+        ranges.append((tokens[i].start, end, tok.start, tok.value))
+    return ranges
+
+
+def _innermost(ranges, offset):
+    found = None
+    for entry in ranges:
+        if entry[0] <= offset < entry[1] and (found is None or entry[0] >= found[0]):
+            found = entry
+    return found
+
+
+def _bindings(tokens, i):
+    """Nomes que recebem o resultado da expressão que começa em ``tokens[i]`` (``const x = await ...``)"""
+    k = i - 1
+    if k >= 0 and _is(tokens[k], IDENT, ("await",)):
+        k -= 1
+    if k < 0 or not _is(tokens[k], PUNCT, ("=",)):
+        return set()
+    names = set()
+    depth = tokens[k].depth
+    k -= 1
+    while k >= 0 and tokens[k].depth >= depth:
+        cur = tokens[k]
+        if cur.depth == depth and (_is(cur, IDENT, DECLARATION_KEYWORDS) or _is(cur, PUNCT, (";", "{", "}"))):
+            break
+        if cur.kind == IDENT:
+            names.add(cur.value)
+        k -= 1
+    return names
+
+
+class FileAudit:
+    """Chamadas a serviços de um arquivo e os avisos só dele"""
+
+    def __init__(self, path, content, services):
+        self.path = path
+        self.index = build_index(content, jsx=path.endswith("x"))
+        self.calls = []
+        self.issues = []
+        self._find_calls(services)
+        if self.calls:
+            self._mark_mount()
+            self._check_serial()
+            self._check_duplicates()
+            self._check_loops()
+
+    @property
+    def mount_calls(self):
+        return [c for c in self.calls if c.on_mount]
+
+    def _find_calls(self, services):
+        index = self.index
+        lexer = index.lexer
+        tokens = lexer.tokens
+        imported = {name: s for s in index.symbols if s.kind == "import" and s.source.startswith(SERVICE_PREFIX)
+                    for name in s.names if name in services}
+        if not imported:
+            return
+        parallel = _bracket_ranges(tokens, lexer.pairs, _parallel_call)
+        loops = _loop_ranges(lexer)
+        effects = _bracket_ranges(tokens, lexer.pairs, _effect_call)
+        for i, tok in enumerate(tokens[:-3]):
+            if not (tok.kind == IDENT and tok.value in imported and _is(tokens[i + 1], PUNCT, (".", "?."))
+                    and tokens[i + 2].kind == IDENT and _is(tokens[i + 3], PUNCT, ("(",))):
+                continue
+            if i and _is(tokens[i - 1], PUNCT, (".", "?.")):
+                continue
+            method = tokens[i + 2].value
+            close = lexer.pairs.get(tokens[i + 3].start, tokens[i + 3].end)
+            call = FetchCall(tok.value, method, _argument_texts(index.text, tokens, i + 3, lexer.pairs),
+                             tok.start, close + 1, index.lines.line_of(tok.start), tok.depth,
+                             services[tok.value].get(method, []))
+            call.awaited = i > 0 and _is(tokens[i - 1], IDENT, ("await",))
+            call.bindings = _bindings(tokens, i)
+            group = _innermost(parallel, tok.start)
+            if group is not None:
+                call.parallel = True
+                call.group = group[0]
+                # o resultado é o de "await Promise.all([...])"
+                k = next(n for n in range(i, -1, -1) if tokens[n].start == group[2]) - 2
+                call.awaited = k > 0 and _is(tokens[k - 1], IDENT, ("await",))
+                call.bindings = _bindings(tokens, k)
+            loop = _innermost(loops, tok.start)
+            if loop is not None:
+                call.loop = (index.lines.line_of(loop[2]), loop[3])
+            effect = _innermost(effects, tok.start)
+            symbol = index.symbol_at(tok.start)
+            if effect is not None and (symbol is None or symbol.start < effect[0]):
+                call.context = "useEffect"
+                call.context_start = effect[0]
+            elif symbol is not None:
+                call.context = symbol.name
+                call.context_start = symbol.start
+            self.calls.append(call)
+        self._effects = effects
+
+    def _mark_mount(self):
+        """Chamadas dentro de ``useEffect`` e das funções do componente chamadas a partir dele"""
+        index = self.index
+        tokens = index.lexer.tokens
+        functions = {s.name: s for s in index.symbols if s.kind == "function"}
+        pending = [(start, end) for start, end, _, _ in self._effects]
+        seen = set()
+        mounted = []
+        while pending:
+            start, end = pending.pop()
+            mounted.append((start, end))
+            for i, tok in enumerate(tokens[:-1]):
+                if tok.start < start or tok.start >= end:
+                    continue
+                symbol = functions.get(tok.value) if tok.kind == IDENT else None
+                if symbol is not None and symbol.name not in seen and _is(tokens[i + 1], PUNCT, ("(",)) \
+                        and not (i and _is(tokens[i - 1], PUNCT, (".", "?."))):
+                    seen.add(symbol.name)
+                    pending.append((symbol.start, symbol.end))
+        for call in self.calls:
+            call.on_mount = any(start <= call.start < end for start, end in mounted)
+
+    def _issue(self, kind, calls, message):
+        self.issues.append(Issue(kind, self.path, calls[0].line, message, calls))
+
+    def _check_serial(self):
+        """Leituras aguardadas uma depois da outra sem que uma use o resultado das anteriores"""
+        tokens = self.index.lexer.tokens
+        starts = [t.start for t in tokens]
+        serial = [c for c in self.calls if c.awaited and not c.parallel and c.loop is None and c.read]
+        run = []
+        declared = set()
+        for call in serial + [None]:
+            between = self._declared_between(run[-1], call, tokens, starts) if run and call else None
+            if between is not None:
+                declared |= between
+                used = {t.value for t in tokens if call.start <= t.start < call.end and t.kind == IDENT}
+                if not used & declared:
+                    run.append(call)
+                    continue
+            if len(run) > 1:
+                names = ", ".join(c.name for c in run)
+                self._issue(SERIAL, run, f"{len(run)} leituras independentes aguardadas em série em "
+                                         f"{run[0].context} ({names}): use Promise.all")
+            run = [call] if call is not None else []
+            declared = set()
+
+    def _declared_between(self, first, second, tokens, starts):
+        """Nomes declarados de ``first`` até ``second`` (incluindo o resultado de ``first``);
+        ``None`` se não são awaits vizinhos no mesmo bloco"""
+        if first.context_start != second.context_start or first.depth != second.depth:
+            return None
+        declared = set(first.bindings)
+        for k in range(bisect_left(starts, first.end), len(tokens)):
+            tok = tokens[k]
+            if tok.start >= second.start:
+                break
+            # bloco fechado ou outro await entre as duas: não são vizinhas
+            if tok.depth < first.depth or (_is(tok, IDENT, ("await",)) and tokens[k + 1].start != second.start):
+                return None
+            if _is(tok, IDENT, DECLARATION_KEYWORDS):
+                declared |= _bindings(tokens, self._assignment_value(tokens, k))
+        return declared
+
+    @staticmethod
+    def _assignment_value(tokens, k):
+        """Índice do primeiro token do valor de ``const ... = valor`` que começa em ``tokens[k]``"""
+        depth = tokens[k].depth
+        for n in range(k + 1, len(tokens)):
+            if tokens[n].depth == depth and _is(tokens[n], PUNCT, ("=",)):
+                return n + 1
+            if tokens[n].depth < depth or (tokens[n].depth == depth and _is(tokens[n], PUNCT, (";",))):
+                break
+        return k
+
+    def _check_duplicates(self):
+        """A mesma leitura repetida na mesma função ou mais de uma vez ao abrir a página"""
+        groups = {}
+        for call in self.calls:
+            if call.read:
+                groups.setdefault(call.key, []).append(call)
+        for key, calls in groups.items():
+            if len(calls) < 2:
+                continue
+            mount = [c for c in calls if c.on_mount]
+            if len(mount) > 1:
+                self._issue(DUPLICATE, mount, f"{key} roda {len(mount)}x ao abrir "
+                                              f"(L{', L'.join(str(c.line) for c in mount)})")
+                continue
+            by_context = {}
+            for call in calls:
+                by_context.setdefault(call.context_start, []).append(call)
+            for repeated in by_context.values():
+                if len(repeated) > 1:
+                    self._issue(DUPLICATE, repeated, f"{key} repetida {len(repeated)}x em {repeated[0].context} "
+                                                     f"(L{', L'.join(str(c.line) for c in repeated)})")
+
+    def _check_loops(self):
+        for call in self.calls:
+            if call.loop is None:
+                continue
+            line, label = call.loop
+            how = "em paralelo (Promise.all), mas" if call.parallel else "em série,"
+            self._issue(N_PLUS_ONE, [call], f"{call.name} dentro de {label} (L{line}): {how} "
+                                            f"uma requisição por item - prefira um endpoint em lote")
+
+
+class RouteAudit:
+    """Requisições de uma rota ao abrir: layouts, página e componentes carregados por ela"""
+
+    def __init__(self, route, page, layouts, files, lazy):
+        self.route = route
+        self.page = page
+        self.layouts = layouts
+        self.files = files          # [FileAudit] com chamadas, na ordem layouts -> página -> componentes
+        self.lazy = lazy            # caminhos carregados sob demanda
+        self.issues = self._check_shared_endpoints()
+
+    @property
+    def mount_calls(self):
+        """Chamadas ao abrir, fora dos componentes sob demanda (que só montam quando usados)"""
+        return [c for audit in self.files if audit.path not in self.lazy for c in audit.mount_calls]
+
+    @property
+    def lazy_calls(self):
+        """Chamadas feitas ao montar os componentes sob demanda"""
+        return [c for audit in self.files if audit.path in self.lazy for c in audit.mount_calls]
+
+    def _check_shared_endpoints(self):
+        """O mesmo endpoint lido ao abrir por mais de um arquivo da rota"""
+        by_endpoint = {}
+        for audit in self.files:
+            if audit.path in self.lazy:
+                continue
+            for call in audit.mount_calls:
+                for endpoint in call.endpoints:
+                    if endpoint.read:
+                        by_endpoint.setdefault(str(endpoint), {}).setdefault(audit.path, call)
+        issues = []
+        for endpoint, owners in by_endpoint.items():
+            if len(owners) > 1:
+                calls = list(owners.values())
+                where = ", ".join(f"{display_path(p)}:{c.line}" for p, c in owners.items())
+                issues.append(Issue(DUPLICATE, self.page, calls[0].line,
+                                    f"{endpoint} buscado ao abrir por {len(owners)} arquivos ({where})", calls))
+        return issues
+
+    def as_dict(self):
+        return {
+            "route": self.route,
+            "page": display_path(self.page),
+            "layouts": [display_path(p) for p in self.layouts],
+            "mount_requests": [str(e) for c in self.mount_calls for e in c.endpoints],
+            "lazy_requests": [str(e) for c in self.lazy_calls for e in c.endpoints],
+            "files": {display_path(a.path): [c.as_dict() for c in a.calls] for a in self.files},
+            "issues": [i.as_dict() for i in self.issues],
+        }
+
+
+def audit_tree(root=FRONTEND_DIR):
+    """``(serviços, {caminho: FileAudit}, [RouteAudit])`` da árvore"""
+    services, _ = load_services(root)
+    audits = {}
+    for path in map(os.path.normpath, discover_files(root, SCAN_DIRS, SUFFIXES)):
+        audit = FileAudit(path, read_file(path).lstrip(BOM), services)
+        if audit.calls:
+            audits[path] = audit
+    graph = ImportGraph(root).build()
+    routes = []
+    for route, page, layouts in graph.routes():
+        report = graph.route_report(route, page, layouts)
+        lazy = set(report.lazy)
+        order = layouts + [page] + [p for p in report.first_load if p not in layouts and p != page] \
+            + sorted(lazy)
+        files = [audits[p] for p in dict.fromkeys(order) if p in audits]
+        routes.append(RouteAudit(route, page, layouts, files, lazy))
+    return services, audits, routes
+
+
+def describe(call):
+    flags = [call.context or "módulo"]
+    if call.on_mount:
+        flags.append("ao abrir")
+    if call.parallel:
+        flags.append("Promise.all")
+    elif call.awaited:
+        flags.append("await")
+    if call.loop:
+        flags.append(f"laço L{call.loop[0]}")
+    endpoints = ", ".join(str(e) for e in call.endpoints) or "método não encontrado nos serviços"
+    return f"L{call.line} {call.key} -> {endpoints}  [{', '.join(flags)}]"
+
+
+def _requests_line(label, calls):
+    requests = {}
+    for endpoint in (str(e) for c in calls for e in c.endpoints):
+        requests[endpoint] = requests.get(endpoint, 0) + 1
+    listed = ", ".join(f"{e} x{n}" if n > 1 else e for e, n in requests.items())
+    return f"   {label}: {sum(requests.values())} requisição(ões)" + (f" - {listed}" if listed else "")
+
+
+def print_route(route):
+    print(f"🧭 {route.route}  ({display_path(route.page)}"
+          f"{f' + {len(route.layouts)} layout(s)' if route.layouts else ''})")
+    print(_requests_line("ao abrir", route.mount_calls))
+    if route.lazy_calls:
+        print(_requests_line("sob demanda", route.lazy_calls))
+    for audit in route.files:
+        suffix = " (sob demanda)" if audit.path in route.lazy else ""
+        print(f"   {display_path(audit.path)}{suffix}")
+        for call in audit.calls:
+            print(f"     {describe(call)}")
+    for issue in route.issues:
+        print(f"   {ISSUE_ICONS[issue.kind]} {issue.message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("routes", nargs="*", help="prefixos de rota a mostrar (padrão: todas)")
+    parser.add_argument("--root", default=FRONTEND_DIR, help="raiz do frontend")
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    args = parser.parse_args()
+
+    services, audits, routes = audit_tree(args.root)
+    routes = [r for r in routes if not args.routes or any(r.route.startswith(p) for p in args.routes)]
+    shown = {a.path for r in routes for a in r.files}
+    issues = [i for path, a in audits.items() if path in shown or not args.routes for i in a.issues]
+    issues += [i for r in routes for i in r.issues]
+
+    if args.json:
+        json.dump({
+            "services": {name: {method: [str(e) for e in endpoints] for method, endpoints in methods.items()}
+                         for name, methods in services.items()},
+            "routes": [r.as_dict() for r in routes],
+            "issues": [i.as_dict() for i in issues],
+        }, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return 1 if issues else 0
+
+    for route in routes:
+        print_route(route)
+        print()
+    for audit in audits.values():
+        for issue in audit.issues:
+            if audit.path in shown or not args.routes:
+                print(f"{ISSUE_ICONS[issue.kind]} {display_path(issue.path)}:{issue.line} {issue.message}")
+    calls = sum(len(a.calls) for a in audits.values())
+    methods = sum(len(m) for m in services.values())
+    print(f"📊 {len(services)} serviço(s) com {methods} método(s); {calls} chamada(s) em {len(audits)} arquivo(s), "
+          f"{len(routes)} rota(s); {len(issues)} aviso(s)")
+    return 1 if issues else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""Benchmark dos passos de patch e dos verificadores em árvores TSX sintéticas
+
+Gera páginas no formato das nossas (imports, estados, handlers, JSX com o
+input de duração e o link do certificado) com 1k, 10k e 100k linhas, ainda
+sem os patches do questionário, e árvores com milhares de arquivos. Mede
+cada passo de patch, o tokenizador, o índice, o check_syntax e o runner
+paralelo, e grava tudo em JSON.
+
+Uso:
+    python bench_patches.py                          # tamanhos padrão
+    python bench_patches.py --lines 1000 10000 --trees 500 -o bench.json
+    python bench_patches.py --baseline bench.json    # falha se algo ficou mais lento
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from anchors import resolve_anchors
+from check_syntax import check_text, function_summary
+from codemod import apply_steps, discover_files, load_patches, steps_for
+from patch_runner import SUMMARY, run_parallel
+from quiz_patches import EDIT_PAGE, VIEW_PAGE
+from tsx_index import TsxIndex
+from tsx_lexer import tokenize
+
+DEFAULT_LINES = (1000, 10000, 100000)
+DEFAULT_TREES = (100, 1000, 3000)
+BENCH_FORMAT = 1
+
+# ---------------------------------------------------------------------------
+# Geração das páginas sintéticas
+# ---------------------------------------------------------------------------
+
+VIEW_HEAD = """'use client';
+
+import { useState, useEffect } from 'react';
+import { useRouter } from 'next/navigation';
+import Link from 'next/link';
+import toast from 'react-hot-toast';
+import { Award, CheckCircle } from 'lucide-react';
+import { courseService } from '@/services/courseService';
+import { progressService } from '@/services/progressService';
+import { Course, Progress, Module, Lesson } from '@/types';
+"""
+
+VIEW_COMPONENT_START = """
+export default function CourseViewPage({ params }: { params: { id: string } }) {
+  const router = useRouter();
+  const [course, setCourse] = useState<Course | null>(null);
+  const [progress, setProgress] = useState<Progress | null>(null);
+  const [selectedModule, setSelectedModule] = useState(0);
+  const [selectedLesson, setSelectedLesson] = useState(0);
+  const [completing, setCompleting] = useState(false);
+
+  useEffect(() => {
+    loadCourseAndProgress();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
+
+  const loadCourseAndProgress = async () => {
+    try {
+      const [courseData, progressData] = await Promise.all([
+        courseService.getCourse(params.id),
+        progressService.getCourseProgress(params.id),
+      ]);
+      setCourse(courseData);
+      setProgress(progressData);
+    } catch (error) {
+      toast.error('Erro ao carregar curso');
+      router.push('/dashboard/courses');
+    }
+  };
+
+  const handleCompleteLesson = async () => {
+    if (!course?.modules || completing) return;
+
+    const courseModule = course.modules[selectedModule];
+    const lesson = courseModule.lessons[selectedLesson];
+
+    if (!courseModule._id || !lesson._id) return;
+
+    setCompleting(true);
+    try {
+      await progressService.completeLesson(course._id, courseModule._id, lesson._id);
+      toast.success('Aula concluída!');
+      loadCourseAndProgress();
+    } finally {
+      setCompleting(false);
+    }
+  };
+"""
+
+VIEW_RENDER_START = """
+  if (!course) {
+    return <div className="text-center py-12">Carregando...</div>;
+  }
+
+  // Se não houver módulos, criar um módulo virtual com as lessons
+  const effectiveModules = course.modules && course.modules.length > 0
+    ? course.modules
+    : course.lessons && course.lessons.length > 0
+    ? [{ _id: 'default', title: course.title, description: '', order: 1, lessons: course.lessons }]
+    : [];
+
+  const currentModule = effectiveModules[selectedModule];
+  const currentLesson = currentModule?.lessons[selectedLesson];
+
+  return (
+    <div className="space-y-6">
+      <div className="card">
+        <div className="flex items-center justify-between">
+          <h1 className="text-2xl font-bold">{course.title}</h1>
+          <div className="flex gap-2">
+            {progress?.certificateIssued && progress?.certificateUrl && (
+              <a
+                href={`/certificates/${progress._id}`}
+                target="_blank"
+                className="btn-primary flex items-center gap-2"
+              >
+                <Award size={18} />
+                Ver Certificado
+              </a>
+            )}
+          </div>
+        </div>
+      </div>
+"""
+
+VIEW_RENDER_END = """    </div>
+  );
+}
+"""
+
+EDIT_HEAD = """'use client';
+
+import { useState, useEffect } from 'react';
+import { useRouter } from 'next/navigation';
+import { courseService } from '@/services/courseService';
+import toast from 'react-hot-toast';
+import Link from 'next/link';
+"""
+
+EDIT_COMPONENT_START = """
+export default function EditCoursePage({ params }: { params: { id: string } }) {
+  const router = useRouter();
+  const [loading, setLoading] = useState(true);
+  const [formData, setFormData] = useState<{
+    title: string;
+    lessons: { title: string; description: string; videoUrl: string; duration: number; order: number }[];
+  }>({ title: '', lessons: [] });
+
+  useEffect(() => {
+    courseService.getCourse(params.id).then((course) => {
+      setFormData({
+        title: course.title,
+        lessons: (course.lessons || []).map((lesson) => ({
+          title: lesson.title,
+          description: lesson.description || '',
+          videoUrl: lesson.videoUrl || '',
+          duration: lesson.duration || 0,
+          order: lesson.order || 0,
+        })),
+      });
+      setLoading(false);
+    });
+  }, [params.id]);
+
+  const updateLesson = (index: number, field: string, value: string | number) => {
+    const newLessons = [...formData.lessons];
+    newLessons[index] = { ...newLessons[index], [field]: value };
+    setFormData({ ...formData, lessons: newLessons });
+  };
+"""
+
+EDIT_RENDER_START = """
+  if (loading) {
+    return <div className="text-center py-12">Carregando...</div>;
+  }
+
+  return (
+    <div className="space-y-6">
+      <form className="card space-y-4">
+        {formData.lessons.map((lesson, index) => (
+          <div key={index} className="border rounded-lg p-4">
+            <div className="grid grid-cols-2 gap-4">
+              <input
+                type="text"
+                value={lesson.videoUrl}
+                onChange={(e) => updateLesson(index, 'videoUrl', e.target.value)}
+                className="input"
+                placeholder="URL do vídeo (YouTube, Vimeo)"
+              />
+
+              <input
+                type="number"
+                required
+                min="1"
+                value={lesson.duration}
+                onChange={(e) => updateLesson(index, 'duration', Number(e.target.value))}
+                className="input"
+                placeholder="Duração (minutos)"
+              />
+            </div>
+          </div>
+        ))}
+      </form>
+"""
+
+EDIT_RENDER_END = VIEW_RENDER_END
+
+
+def _helper_component(i):
+    return f"""
+function StatCard{i}({{ label, value }}: {{ label: string; value: number }}) {{
+  const percent = Math.round((value / 100) * 100);
+  return (
+    <div className="card flex items-center justify-between">
+      <span className="text-sm text-gray-600">{{label}}</span>
+      <strong className={{percent > 50 ? 'text-green-600' : 'text-gray-900'}}>{{percent}}%</strong>
+    </div>
+  );
+}}
+"""
+
+
+def _handler(i):
+    return f"""
+  const handleAction{i} = async (id: string) => {{
+    try {{
+      const data = await courseService.getCourse(`${{id}}-{i}`);
+      if (!data || data.lessons?.length === 0) return;
+      toast.success('Ação {i} concluída');
+    }} catch (error) {{
+      console.error('Erro na ação {i}:', error);
+    }}
+  }};
+"""
+
+
+def _jsx_section(i):
+    return f"""
+      <section className="card">
+        <h2 className="text-lg font-semibold">Seção {i}</h2>
+        {{currentLesson && (
+          <button onClick={{() => handleAction{i}(currentLesson._id!)}} className="btn-secondary">
+            Executar {i} {{'{{'}} {{currentLesson.title}}
+          </button>
+        )}}
+        <StatCard{i} label="Progresso {i}" value={{{i} % 100}} />
+      </section>
+"""
+
+
+def _edit_jsx_section(i):
+    return f"""
+      <section className="card">
+        <h2 className="text-lg font-semibold">Seção {i}</h2>
+        <button type="button" onClick={{() => handleAction{i}(params.id)}} className="btn-secondary">
+          Executar {i}
+        </button>
+        <StatCard{i} label="Aulas {i}" value={{formData.lessons.length + {i}}} />
+      </section>
+"""
+
+
+def synth_page(kind, lines):
+    """Página sintética (``"view"`` ou ``"edit"``) com ~``lines`` linhas, ainda sem patches"""
+    if kind == "view":
+        parts = (VIEW_HEAD, VIEW_COMPONENT_START, VIEW_RENDER_START, VIEW_RENDER_END, _jsx_section)
+    else:
+        parts = (EDIT_HEAD, EDIT_COMPONENT_START, EDIT_RENDER_START, EDIT_RENDER_END, _edit_jsx_section)
+    head, component_start, render_start, render_end, section = parts
+    base = sum(p.count("\n") for p in (head, component_start, render_start, render_end))
+    unit = sum(s.count("\n") for s in (_helper_component(0), _handler(0), section(0)))
+    count = max(1, (lines - base) // unit)
+    return "".join([
+        head,
+        *(_helper_component(i) for i in range(count)),
+        component_start,
+        *(_handler(i) for i in range(count)),
+        render_start,
+        *(section(i) for i in range(count)),
+        render_end,
+    ])
+
+
+def synth_tree(root, files, lines_per_file=300):
+    """Árvore app/ + components/ com ``files`` arquivos, incluindo as duas páginas alvo"""
+    pages = {VIEW_PAGE: synth_page("view", 500), EDIT_PAGE: synth_page("edit", 320)}
+    filler = synth_page("view", lines_per_file)
+    for i in range(max(0, files - len(pages))):
+        if i % 4 == 3:
+            pages[f"components/Widget{i}.tsx"] = filler
+        else:
+            pages[f"app/dashboard/section{i // 50}/page{i}/page.tsx"] = filler
+    for rel_path, content in pages.items():
+        path = os.path.join(root, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+    return len(pages)
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def measure(func, repeat):
+    """Roda ``func`` ``repeat`` vezes; devolve (mínimo, mediana, último resultado)"""
+    times = []
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times), value
+
+
+def _record(results, group, name, size, repeat, func, **extra):
+    best, median, value = measure(func, repeat)
+    entry = {"group": group, "name": name, "size": size, "min_s": round(best, 6),
+             "median_s": round(median, 6), "repeat": repeat, **extra}
+    results.append(entry)
+    print(f"   {name:<40} {best * 1000:10.2f} ms  (mediana {median * 1000:.2f} ms)")
+    return value
+
+
+def _step_bench(step, content):
+    def run():
+        resolve_anchors.cache_clear()
+        return step.func(content)
+    return run
+
+
+def bench_file_sizes(sizes, repeat, steps):
+    """Cada passo e cada verificador sobre páginas de ``sizes`` linhas"""
+    results = []
+    for lines in sizes:
+        for kind, rel_path in (("view", VIEW_PAGE), ("edit", EDIT_PAGE)):
+            content = synth_page(kind, lines)
+            size = content.count("\n")
+            print(f"\n📄 {rel_path} sintética: {size} linhas, {len(content)} bytes")
+            group = f"file:{kind}"
+            for step in steps_for(rel_path, steps):
+                new_content = _record(results, group, f"step:{step.name}", size, repeat,
+                                      _step_bench(step, content))
+                status = ("not_found" if new_content is None
+                          else "unchanged" if new_content == content else "changed")
+                results[-1]["status"] = status
+
+            def all_steps():
+                resolve_anchors.cache_clear()
+                return apply_steps(content, steps_for(rel_path, steps))
+            _record(results, group, "apply_steps", size, repeat, all_steps)
+            lexer = _record(results, group, "check:tokenize", size, repeat,
+                            lambda: tokenize(content))
+            _record(results, group, "check:check_syntax", size, repeat,
+                    lambda: check_text(content))
+            _record(results, group, "check:function_summary", size, repeat,
+                    lambda: function_summary(lexer, lexer.errors))
+            index = _record(results, group, "check:build_index", size, repeat,
+                            lambda: TsxIndex(tokenize(content)))
+            _record(results, group, "check:used_before_definition", size, repeat,
+                    lambda: [index.used_before_definition(s.name) for s in index.symbols])
+    return results
+
+
+def bench_trees(sizes, repeat, jobs):
+    """Descoberta, check_syntax e runner paralelo (sem gravar) em árvores com ``sizes`` arquivos"""
+    results = []
+    for files in sizes:
+        root = tempfile.mkdtemp(prefix="bench-tree-")
+        try:
+            count = synth_tree(root, files)
+            print(f"\n🌳 árvore sintética: {count} arquivos")
+            group = "tree"
+            paths = _record(results, group, "discover_files", count, repeat,
+                            lambda: discover_files(root))
+
+            def check_all():
+                errors = 0
+                for path in paths:
+                    with open(path, "r", encoding="utf-8", newline="") as f:
+                        errors += len(check_text(f.read())[1])
+                return errors
+            _record(results, group, "check_syntax:tree", count, repeat, check_all)
+            _record(results, group, "run_parallel:dry_run", count, repeat,
+                    lambda: run_parallel(root, jobs=jobs, mode=SUMMARY), jobs=jobs or os.cpu_count())
+            _record(results, group, "run_parallel:dry_run:j1", count, repeat,
+                    lambda: run_parallel(root, jobs=1, mode=SUMMARY), jobs=1)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, tolerance):
+    """Compara com um JSON anterior; devolve as medições que pioraram além da tolerância"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {(r["group"], r["name"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get((result["group"], result["name"], result["size"]))
+        if not old or old["min_s"] <= 0:
+            continue
+        ratio = result["min_s"] / old["min_s"]
+        # medições muito curtas são ruído; ignora diferenças abaixo de 1 ms
+        if ratio > 1 + tolerance and result["min_s"] - old["min_s"] > 0.001:
+            regressions.append((result, old, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="*", default=list(DEFAULT_LINES),
+                        help="tamanhos das páginas sintéticas (linhas)")
+    parser.add_argument("--trees", type=int, nargs="*", default=list(DEFAULT_TREES),
+                        help="tamanhos das árvores sintéticas (arquivos)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="repetições de cada medição")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="processos do runner paralelo")
+    parser.add_argument("-o", "--output", default="bench-results.json", help="arquivo JSON de saída")
+    parser.add_argument("--baseline", help="JSON anterior para detectar regressões")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="piora relativa aceita em relação ao baseline (padrão: 0.25)")
+    args = parser.parse_args()
+
+    steps = load_patches()
+    started = time.time()
+    results = bench_file_sizes(args.lines, args.repeat, steps)
+    results += bench_trees(args.trees, args.repeat, args.jobs)
+
+    report = {
+        "format": BENCH_FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"\n💾 {len(results)} medição(ões) em {args.output} ({time.time() - started:.1f}s)")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for result, old, ratio in regressions:
+            print(f"❌ {result['group']} {result['name']} ({result['size']}): "
+                  f"{old['min_s'] * 1000:.2f} ms -> {result['min_s'] * 1000:.2f} ms ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print("✅ nenhuma regressão em relação ao baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
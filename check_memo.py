@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""Aponta valores derivados recalculados a cada render que deveriam estar em ``useMemo``
+
+Olha as declarações do corpo de cada componente (o mesmo índice do
+check_page): arrays/objetos montados com ``map``/``filter``/``reduce``/
+``sort``/spread ou com ternários, e literais usados dentro de hooks
+(``useEffect``/``useMemo``/``useCallback``), cuja identidade muda a cada
+render. Para cada um mostra as dependências inferidas (estado, props e
+outros valores do componente que ele lê). Literais que não dependem de
+nada do componente podem simplesmente ir para o módulo.
+
+Variáveis locais de handlers (como ``femininos``/``masculinos`` dentro de
+``preencherConfirmados`` na página de escala) só existem quando o handler
+roda e não contam. Como no caso do ``effectiveModules``, um ``useMemo``
+depois de um ``return`` antecipado quebraria a ordem dos hooks: com
+``--fix`` só são envolvidos os valores declarados antes de qualquer
+``return``; os demais são apontados para mover.
+
+Uso:
+    python check_memo.py                 # app/ e components/
+    python check_memo.py --fix app/dashboard/users/page.tsx
+"""
+import argparse
+import os
+import sys
+import time
+from bisect import bisect_left
+
+import profiling
+from check_syntax import collect_paths
+from codemod import Transaction, read_file
+from tsx_index import build_index
+from tsx_lexer import IDENT, PUNCT, STRING
+
+# Métodos que criam um array/objeto novo a cada chamada
+DERIVING_METHODS = frozenset({"map", "filter", "reduce", "reduceRight", "sort", "flatMap", "slice",
+                              "concat", "toSorted", "toReversed"})
+DERIVING_STATICS = {"Object": {"keys", "values", "entries", "fromEntries", "assign"},
+                    "Array": {"from", "of"}}
+HOOKS_WITH_DEPS = frozenset({"useEffect", "useLayoutEffect", "useMemo", "useCallback"})
+REACT_MODULE = "react"
+
+# Tipos de achado
+DERIVED = "derived"          # map/filter/... recalculado a cada render
+CONDITIONAL = "conditional"  # ternário que escolhe entre arrays/objetos
+UNSTABLE = "unstable"        # literal com dependências usado dentro de hook
+CONSTANT = "constant"        # literal sem dependências: pode ir para o módulo
+
+KIND_LABELS = {
+    DERIVED: "recalculado a cada render",
+    CONDITIONAL: "ternário cria um array/objeto novo a cada render",
+    UNSTABLE: "literal recriado a cada render e usado em hook",
+    CONSTANT: "literal constante recriado a cada render",
+}
+
+
+class Finding:
+    """Valor do corpo de um componente que merece ``useMemo`` (ou ir para o módulo)"""
+    __slots__ = ("symbol", "kind", "detail", "deps", "unstable_deps", "hooks", "early_return", "init_start")
+
+    def __init__(self, symbol, kind, detail, deps, unstable_deps, hooks, early_return, init_start):
+        self.symbol = symbol
+        self.kind = kind
+        self.detail = detail              # ex.: "filter", "sort", "? :"
+        self.deps = deps                  # dependências inferidas, em ordem de uso
+        self.unstable_deps = unstable_deps  # funções do componente (novas a cada render)
+        self.hooks = hooks                # linhas dos hooks que usam o valor
+        self.early_return = early_return  # offset do return antecipado anterior, se houver
+        self.init_start = init_start      # offset do inicializador (depois do "=")
+
+    @property
+    def fixable(self):
+        return self.kind != CONSTANT and self.early_return is None
+
+
+def _token_range(starts, start, end):
+    """Índices dos tokens em [start, end)"""
+    return bisect_left(starts, start), bisect_left(starts, end)
+
+
+def _initializer(tokens, first, last):
+    """Índice do primeiro token depois do ``=`` da declaração (ou ``None``)"""
+    depth = tokens[first].depth
+    for i in range(first, last):
+        tok = tokens[i]
+        if tok.kind == PUNCT and tok.value == "=" and tok.depth == depth:
+            return i + 1
+    return None
+
+
+def _local_bindings(tokens, first, last):
+    """Nomes ligados dentro do inicializador (parâmetros de arrow e declarações)"""
+    names = set()
+    for i in range(first, last):
+        tok = tokens[i]
+        if tok.kind == PUNCT and tok.value == "=>":
+            prev = tokens[i - 1]
+            if prev.kind == IDENT:
+                names.add(prev.value)
+            elif prev.kind == PUNCT and prev.value == ")":
+                k = i - 2
+                while k > first and not (tokens[k].kind == PUNCT and tokens[k].value == "("
+                                         and tokens[k].depth == prev.depth):
+                    if tokens[k].kind == IDENT:
+                        names.add(tokens[k].value)
+                    k -= 1
+        elif tok.kind == IDENT and tok.value in ("const", "let", "var") and i + 1 < last \
+                and tokens[i + 1].kind == IDENT:
+            names.add(tokens[i + 1].value)
+    return names
+
+
+def _classify(tokens, first, last):
+    """``(tipo, detalhe)`` do inicializador em ``tokens[first:last]``, ou ``(None, None)``"""
+    depth = tokens[first].depth
+    head = tokens[first]
+    for i in range(first, last):
+        tok = tokens[i]
+        if tok.kind != IDENT:
+            continue
+        prev = tokens[i - 1]
+        nxt = tokens[i + 1] if i + 1 < last else None
+        is_call = nxt is not None and nxt.kind == PUNCT and nxt.value == "("
+        if is_call and tok.value in DERIVING_METHODS and prev.kind == PUNCT and prev.value in (".", "?."):
+            return DERIVED, tok.value
+        if is_call and prev.kind == PUNCT and prev.value == "." and i >= 2 \
+                and tok.value in DERIVING_STATICS.get(tokens[i - 2].value, ()):
+            return DERIVED, f"{tokens[i - 2].value}.{tok.value}"
+    if head.kind == PUNCT and head.value == "[" and first + 1 < last \
+            and tokens[first + 1].kind == PUNCT and tokens[first + 1].value == "...":
+        return DERIVED, "spread"
+    for i in range(first, last):
+        tok = tokens[i]
+        if tok.kind == PUNCT and tok.value == "?" and tok.depth == depth:
+            branches = tokens[i + 1:last]
+            if any(t.kind == PUNCT and t.value in ("[", "{") and t.depth == depth for t in branches):
+                return CONDITIONAL, "? :"
+    if head.kind == PUNCT and head.value in ("[", "{"):
+        return CONSTANT, "[]" if head.value == "[" else "{}"
+    return None, None
+
+
+def _component_params(index, component, starts):
+    """Nomes dos parâmetros (props) do componente"""
+    tokens = index.lexer.tokens
+    first, last = _token_range(starts, component.start, component.body_start or component.end)
+    names = set()
+    paren = None
+    for i in range(first, last):
+        tok = tokens[i]
+        if paren is None:
+            if tok.kind == PUNCT and tok.value == "(":
+                paren = tok.depth
+            continue
+        if tok.depth <= paren:
+            break
+        # tipos depois do ":" do parâmetro não são nomes
+        if tok.kind == PUNCT and tok.value == ":" and tok.depth == paren + 1:
+            break
+        if tok.kind == IDENT:
+            names.add(tok.value)
+    return names
+
+
+def _hook_lines(index, component, name):
+    """Linhas dos hooks com deps (useEffect...) do componente que leem ``name``"""
+    tokens = index.lexer.tokens
+    pairs = index.lexer.pairs
+    lines = []
+    for i, tok in enumerate(tokens):
+        if tok.start < component.start:
+            continue
+        if tok.start >= component.end:
+            break
+        if tok.kind == IDENT and tok.value in HOOKS_WITH_DEPS and i + 1 < len(tokens) \
+                and tokens[i + 1].value == "(":
+            close = pairs.get(tokens[i + 1].start)
+            if close is not None and index.references_between(name, tokens[i + 1].start, close):
+                lines.append(index.lines.line_of(tok.start))
+    return lines
+
+
+def find_findings(index):
+    """Achados de todos os componentes do arquivo, em ordem"""
+    tokens = index.lexer.tokens
+    starts = [t.start for t in tokens]
+    findings = []
+    for component in index.components:
+        symbols = index.component_symbols(component.name)
+        local = {}
+        for symbol in symbols:
+            for name in symbol.names:
+                local[name] = symbol
+        params = _component_params(index, component, starts)
+        for symbol in symbols:
+            if symbol.kind != "value" or len(symbol.names) != 1:
+                continue
+            first, last = _token_range(starts, symbol.start, symbol.end)
+            init = _initializer(tokens, first, last)
+            if init is None:
+                continue
+            if tokens[last - 1].kind == PUNCT and tokens[last - 1].value == ";":
+                last -= 1
+            kind, detail = _classify(tokens, init, last)
+            if kind is None:
+                continue
+            bound = _local_bindings(tokens, init, last)
+            deps = []
+            unstable = []
+            for i in range(init, last):
+                tok = tokens[i]
+                prev = tokens[i - 1]
+                if tok.kind != IDENT or tok.value in bound or tok.value in deps \
+                        or prev.kind == PUNCT and prev.value in (".", "?."):
+                    continue
+                owner = local.get(tok.value)
+                if owner is not None and owner is not symbol:
+                    if owner.kind == "hook" and tok.value.startswith("set") and tok.value != owner.name:
+                        continue   # setter do useState é estável
+                    deps.append(tok.value)
+                    if owner.kind == "function":
+                        unstable.append(tok.value)
+                elif owner is None and tok.value in params:
+                    deps.append(tok.value)
+            hooks = _hook_lines(index, component, symbol.name)
+            if kind == CONSTANT:
+                if deps:
+                    if not hooks:
+                        continue
+                    kind = UNSTABLE
+            findings.append(Finding(symbol, kind, detail, deps, unstable, hooks,
+                                    index.defined_after_early_return(symbol.name, component.name),
+                                    tokens[init].start))
+    return findings
+
+
+def wrap_in_use_memo(content, findings):
+    """Envolve os achados corrigíveis em ``useMemo`` e garante o import; devolve ``(conteúdo, quantos)``"""
+    fixable = [f for f in findings if f.fixable]
+    if not fixable:
+        return content, 0
+    for finding in sorted(fixable, key=lambda f: f.init_start, reverse=True):
+        end = finding.symbol.end
+        if content[end - 1] == ";":
+            end -= 1
+        expression = content[finding.init_start:end].rstrip()
+        rest = content[finding.init_start + len(expression):]
+        if expression.startswith("{"):
+            expression = f"({expression})"
+        deps = ", ".join(finding.deps)
+        content = content[:finding.init_start] + f"useMemo(() => {expression}, [{deps}])" + rest
+    return ensure_use_memo_import(content), len(fixable)
+
+
+def ensure_use_memo_import(content):
+    """Adiciona ``useMemo`` ao import de 'react' (ou cria o import)"""
+    index = build_index(content)
+    react_imports = [s for s in index.symbols if s.kind == "import" and s.source == REACT_MODULE]
+    if any("useMemo" in s.names for s in react_imports):
+        return content
+    for symbol in react_imports:
+        statement = content[symbol.start:symbol.end]
+        close = statement.find("}")
+        if close >= 0:
+            before = statement[:close].rstrip()
+            separator = " " if before.endswith(",") else ", "
+            statement = before + separator + "useMemo " + statement[close:]
+        elif statement.startswith(f"import {symbol.name} from"):
+            # import React from 'react' -> import React, { useMemo } from 'react'
+            statement = statement.replace(" from", ", { useMemo } from", 1)
+        else:
+            continue
+        return content[:symbol.start] + statement + content[symbol.end:]
+    imports = [s for s in index.symbols if s.kind == "import"]
+    line = "import { useMemo } from 'react';\n"
+    if imports:
+        after = imports[-1].end
+    else:
+        # diretivas ('use client') precisam continuar no topo
+        tokens = index.lexer.tokens
+        after = tokens[0].end if tokens and tokens[0].kind == STRING else 0
+        if not after:
+            return line + content
+    at = content.find("\n", after)
+    at = len(content) if at < 0 else at + 1
+    return content[:at] + line + content[at:]
+
+
+def display_path(path):
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def print_findings(path, index, findings):
+    print(f"📄 {display_path(path)}")
+    for finding in findings:
+        symbol = finding.symbol
+        where = f"linha {symbol.first_line} {symbol.name} ({finding.detail})"
+        if finding.kind == CONSTANT:
+            print(f"   💡 {where}: {KIND_LABELS[CONSTANT]}; mova para o módulo")
+            continue
+        deps = ", ".join(finding.deps)
+        print(f"   🔁 {where}: {KIND_LABELS[finding.kind]}; deps inferidas [{deps}]")
+        if finding.hooks:
+            print(f"      usado em hook(s) na(s) linha(s) {', '.join(map(str, finding.hooks))}")
+        if finding.unstable_deps:
+            print(f"      ⚠️  depende de função recriada a cada render ({', '.join(finding.unstable_deps)}): "
+                  f"use useCallback nela ou mova a lógica para o useMemo")
+        if finding.early_return is not None:
+            line = index.lines.line_of(finding.early_return)
+            print(f"      ⚠️  declarado depois do return antecipado da linha {line}: mova para antes "
+                  f"(um useMemo ali quebraria a ordem dos hooks)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="arquivos ou pastas (padrão: app/ e components/)")
+    parser.add_argument("--fix", action="store_true",
+                        help="envolve em useMemo os valores declarados antes de qualquer return")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    paths = [p for p in collect_paths(args.paths) if p.endswith(".tsx")]
+    total = hoist = fixed = 0
+    with profiling.from_args(args), Transaction() as tx:
+        for path in paths:
+            content = read_file(path)
+            index = build_index(content)
+            findings = find_findings(index)
+            if not findings:
+                continue
+            print_findings(path, index, findings)
+            total += sum(1 for f in findings if f.kind != CONSTANT)
+            hoist += sum(1 for f in findings if f.kind == CONSTANT)
+            if args.fix:
+                new_content, count = wrap_in_use_memo(content, findings)
+                if count:
+                    tx.stage(path, new_content, content)
+                    fixed += count
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"\n📊 {len(paths)} arquivo(s) em {elapsed:.0f} ms: {total} valor(es) sem useMemo, "
+          f"{hoist} literal(is) constante(s)" + (f"; {fixed} envolvido(s) em useMemo" if args.fix else ""))
+    return 1 if total - fixed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
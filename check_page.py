@@ -1,17 +1,78 @@
+#!/usr/bin/env python3
+"""Mostra onde cada nome é definido e usado, apontando usos antes da definição
+
+Uso:
+    python check_page.py                          # effectiveModules na página do curso
+    python check_page.py arquivo.tsx nome [nome...]
+"""
 import sys
 
-file_path = r'app\dashboard\courses\[id]\page.tsx'
+from tsx_index import index_file
+
+DEFAULT_FILE = "app/dashboard/courses/[id]/page.tsx"
+DEFAULT_NAMES = ["effectiveModules"]
+
+
+def report(index, name):
+    """Imprime definição, usos e problemas de ordem de um nome; devolve o número de problemas"""
+    symbol = index.definition(name)
+    if symbol is None:
+        print(f"⚠️  {name}: definição não encontrada")
+        return 1
+
+    where = f"no componente {symbol.scope}" if symbol.scope else "no módulo"
+    print(f"📍 {name} ({symbol.kind}) definido {where}, linhas {symbol.first_line}-{symbol.last_line}")
+    uses = index.references(name)
+    print(f"   {len(uses)} uso(s): linhas {', '.join(str(r.line) for r in uses) or '-'}")
+
+    problems = 0
+    for ref in index.used_before_definition(name):
+        if ref.deferred:
+            print(f"   ℹ️  linha {ref.line}: usado antes da definição dentro de função (roda depois)")
+        else:
+            print(f"   ❌ linha {ref.line}: usado antes da definição durante o render")
+            problems += 1
+
+    # Só hooks quebram com return antecipado (a ordem das chamadas muda entre renders)
+    early_return = index.defined_after_early_return(name)
+    if early_return is not None and symbol.kind == "hook":
+        line = index.lines.line_of(early_return)
+        print(f"   ❌ hook definido depois do return antecipado da linha {line}")
+        problems += 1
+    return problems
+
+
+def find_problems(index):
+    """Problemas de ordem em todos os corpos de componente: ``[(linha, mensagem)]``"""
+    problems = []
+    for symbol in index.symbols:
+        # no módulo, os usos ficam dentro de funções que rodam depois
+        if symbol.scope is None:
+            continue
+        for name in symbol.names:
+            if index.definition(name, symbol.scope) is not symbol:
+                continue
+            for ref in index.used_before_definition(name, symbol.scope):
+                if not ref.deferred:
+                    problems.append((ref.line, f"{name} usado antes da definição durante o render"))
+            early_return = index.defined_after_early_return(name, symbol.scope)
+            if early_return is not None and symbol.kind == "hook":
+                line = index.lines.line_of(early_return)
+                problems.append((symbol.first_line,
+                                 f"hook {name} definido depois do return antecipado da linha {line}"))
+    return sorted(problems)
+
+
+def main():
+    args = sys.argv[1:]
+    path = args[0] if args else DEFAULT_FILE
+    names = args[1:] or DEFAULT_NAMES
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+    index = index_file(path)
+    print(f"Total lines: {len(index.text.splitlines())}\n")
+    problems = sum(report(index, name) for name in names)
+    return 1 if problems else 0
 
-print(f"Total lines: {len(lines)}")
-print(f"\nLine 210-215:")
-for i in range(209, min(215, len(lines))):
-    print(f"{i+1}: {lines[i]}", end='')
 
-# Buscar effectiveModules usado antes de ser definido
-print(f"\n\nSearching for effectiveModules usage:")
-for i, line in enumerate(lines):
-    if 'effectiveModules' in line:
-        print(f"Line {i+1}: {line.strip()}")
+if __name__ == "__main__":
+    sys.exit(main())
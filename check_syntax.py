@@ -1,35 +1,119 @@
-import re
-
-with open(r'app\dashboard\courses\[id]\page.tsx', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Contar abertura e fechamento
-open_braces = content.count('{')
-close_braces = content.count('}')
-open_parens = content.count('(')
-close_parens = content.count(')')
-open_brackets = content.count('[')
-close_brackets = content.count(']')
-
-print(f"{{ = {open_braces}")
-print(f"}} = {close_braces}")
-print(f"Diferença: {open_braces - close_braces}")
-print()
-print(f"( = {open_parens}")
-print(f") = {close_parens}")
-print(f"Diferença: {open_parens - close_parens}")
-print()
-print(f"[ = {open_brackets}")
-print(f"] = {close_brackets}")
-print(f"Diferença: {open_brackets - close_brackets}")
-
-# Verificar a função handleCompleteLesson
-match = re.search(r'const handleCompleteLesson = async \(\) => \{(.+?)^\s*\};', content, re.DOTALL | re.MULTILINE)
-if match:
-    func_content = match.group(0)
-    func_open = func_content.count('{')
-    func_close = func_content.count('}')
-    print(f"\nhandleCompleteLesson:")
-    print(f"{{ = {func_open}, }} = {func_close}, Diff = {func_open - func_close}")
-else:
-    print("\nhandleCompleteLesson não encontrada com regex")
+#!/usr/bin/env python3
+"""Verifica o balanceamento de { ( [, templates e tags JSX nos .tsx/.ts do frontend
+
+Substitui a contagem ingênua de chaves (que errava com chaves em strings,
+comentários e texto JSX) e a busca de funções linha a linha: cada arquivo é
+tokenizado uma única vez, em tempo linear.
+
+Uso:
+    python check_syntax.py                  # app/ e components/ inteiros
+    python check_syntax.py caminho.tsx ...  # arquivos ou pastas específicos
+    python check_syntax.py --functions ...  # resumo de balanceamento por função
+"""
+import argparse
+import os
+import sys
+
+import profiling
+from codemod import discover_files, read_file
+from tsx_lexer import HINT, Diagnostic, declarations, tokenize
+
+DEFAULT_DIRS = ("app", "components")
+SUFFIXES = (".tsx", ".ts")
+
+
+def collect_paths(targets, root="."):
+    """Expande pastas em arquivos .tsx/.ts (ordem estável)"""
+    if not targets:
+        return discover_files(root, DEFAULT_DIRS, SUFFIXES)
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            paths.extend(discover_files(target, (".",), SUFFIXES))
+        else:
+            paths.append(target)
+    return paths
+
+
+def check_text(text, jsx=True):
+    """Tokeniza e devolve ``(lexer, erros, dicas)``"""
+    with profiling.span("check:check_syntax", len(text)) as span:
+        lexer = tokenize(text, jsx=jsx)
+        errors = lexer.errors
+        hints = lexer.indentation_hints() if errors else []
+        span.matches = len(errors)
+    return lexer, errors, hints
+
+
+def function_summary(lexer, errors):
+    """Balanceamento de cada função/hook: ``[(nome, linha_ini, linha_fim, ok, primeiro_erro)]``"""
+    summary = []
+    for decl in declarations(lexer):
+        first_line = lexer.lines.line_of(decl.start)
+        last_line = lexer.lines.line_of(max(decl.start, decl.end - 1))
+        # hooks de uma linha (useState, useRouter...) não interessam aqui
+        if decl.kind != "function" and not (decl.kind == "hook" and last_line > first_line):
+            continue
+        inside = [e for e in errors if decl.start <= e.offset < decl.end]
+        if not inside and errors and decl.body_start is not None:
+            # Corpo "engoliu" código de fora: fecha com indentação diferente
+            message = lexer.indentation_mismatch(decl.body_start)
+            if message:
+                inside = [Diagnostic(decl.body_start, HINT, message)]
+        summary.append((decl.name, first_line, last_line, not inside, inside[0] if inside else None))
+    return summary
+
+
+def check_file(path, show_functions=False):
+    """Imprime os diagnósticos do arquivo; devolve o número de erros"""
+    text = read_file(path)
+    lexer, errors, hints = check_text(text, jsx=not path.endswith(".ts"))
+    print_report(path, lexer, errors, hints, show_functions)
+    return len(errors)
+
+
+def print_report(path, lexer, errors, hints, show_functions=False):
+    """Imprime os diagnósticos de um arquivo já tokenizado"""
+    display = os.path.normpath(path).replace(os.sep, "/")
+
+    if not errors:
+        print(f"✅ {display}")
+    else:
+        first = errors[0]
+        line, col = lexer.position(first.offset)
+        print(f"❌ {display}:{line}:{col}: {first.message}")
+        for error in errors[1:]:
+            line, col = lexer.position(error.offset)
+            print(f"   {line}:{col}: {error.message}")
+        for hint in hints:
+            print(f"   💡 {hint.message}")
+
+    if show_functions:
+        for name, first_line, last_line, ok, error in function_summary(lexer, errors):
+            if ok:
+                print(f"   ✅ {name}: linhas {first_line}-{last_line}")
+            else:
+                line, col = lexer.position(error.offset)
+                print(f"   ❌ {name}: linhas {first_line}-{last_line} - {line}:{col}: {error.message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="arquivos ou pastas (padrão: app/ e components/)")
+    parser.add_argument("-f", "--functions", action="store_true",
+                        help="mostra o balanceamento de cada função")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    paths = collect_paths(args.paths)
+    with profiling.from_args(args):
+        total = sum(check_file(path, args.functions) for path in paths)
+    if total:
+        print(f"\n❌ {total} erro(s) em {len(paths)} arquivo(s)")
+        return 1
+    print(f"\n✅ {len(paths)} arquivo(s) balanceado(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
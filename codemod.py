@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""Motor de codemods: carrega cada arquivo uma vez e aplica os patches registrados em memória"""
+import difflib
+import hashlib
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass, field
+
+import profiling
+
+FRONTEND_DIR = "."
+
+# Resultado de cada passo de patch
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+
+STATUS_LABELS = {
+    CHANGED: "✅ alterado",
+    UNCHANGED: "ℹ️  sem alterações",
+    NOT_FOUND: "⚠️  padrão não encontrado",
+}
+
+
+@dataclass
+class PatchStep:
+    """Um passo de patch registrado.
+
+    ``func`` recebe o conteúdo atual (em memória) e devolve o novo conteúdo,
+    o mesmo conteúdo quando o patch já está aplicado, ou ``None`` quando o
+    ponto de inserção não foi encontrado.
+    """
+    name: str
+    targets: tuple
+    func: object
+    version: int = 1
+    description: str = ""
+    _patterns: list = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        self._patterns = [compile_target(t) for t in self.targets]
+
+    def matches(self, rel_path):
+        """Indica se o passo se aplica ao caminho relativo (formato posix)"""
+        return any(p.fullmatch(rel_path) for p in self._patterns)
+
+
+@dataclass
+class FileResult:
+    """Resultado da aplicação do conjunto de patches em um arquivo"""
+    path: str
+    steps: list
+    changed: bool
+    digest: str = ""
+    diff: str = ""            # diff unificado (só no modo de prévia)
+    hunks: int = 0
+    added: int = 0
+    removed: int = 0
+    content: str = None       # conteúdo novo ainda não gravado (gravação feita por outro processo)
+
+    @property
+    def status(self):
+        if self.changed:
+            return CHANGED
+        if any(status == NOT_FOUND for _, status in self.steps):
+            return NOT_FOUND
+        return UNCHANGED
+
+
+# Passos registrados, na ordem em que devem ser aplicados
+PATCHES = []
+
+
+def compile_target(target):
+    """Converte um alvo ('app/**/page.tsx') em regex.
+
+    Só ``**`` e ``*`` são curingas; colchetes como em ``[id]`` são literais,
+    já que fazem parte das rotas dinâmicas do Next.js.
+    """
+    regex = ""
+    i = 0
+    while i < len(target):
+        if target.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif target.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif target[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        else:
+            regex += re.escape(target[i])
+            i += 1
+    return re.compile(regex)
+
+
+def patch(name, targets, version=1, description=""):
+    """Decorador que registra uma função como passo de patch.
+
+    Suba ``version`` sempre que a lógica do passo mudar.
+    """
+    if isinstance(targets, str):
+        targets = (targets,)
+
+    def decorator(func):
+        PATCHES.append(PatchStep(name, tuple(targets), func, version,
+                                 description or (func.__doc__ or "").strip()))
+        return func
+    return decorator
+
+
+def read_file(path):
+    """Lê conteúdo do arquivo (preservando as quebras de linha)"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def write_file(path, content):
+    """Escreve conteúdo no arquivo (preservando as quebras de linha)"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+
+
+class PatchFailed(Exception):
+    """Um passo não encontrou seu padrão num lote que exige todos os passos"""
+
+
+class Transaction:
+    """Gravação em lote de vários arquivos: tudo ou nada.
+
+    ``stage`` só guarda o conteúdo novo. ``commit`` grava cada arquivo num
+    temporário na mesma pasta, faz fsync de todos de uma vez e então troca os
+    originais com ``os.replace`` (atômico). Se qualquer etapa falhar, os
+    arquivos já trocados voltam ao conteúdo anterior. Arquivos cujos bytes não
+    mudaram não são regravados (o mtime fica igual, e o dev server do Next.js
+    não recompila à toa).
+
+        with Transaction() as tx:
+            tx.stage(path, content)
+        # saiu do bloco sem exceção: commit; com exceção: nada é gravado
+    """
+
+    def __init__(self):
+        self.staged = {}          # caminho -> bytes novos
+        self.written = []         # caminhos efetivamente trocados no último commit
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.staged.clear()
+        return False
+
+    def stage(self, path, content, original=None):
+        """Agenda a gravação de ``content``; ignora se os bytes forem iguais aos do disco"""
+        data = content.encode("utf-8")
+        if original is not None:
+            if content == original:
+                return False
+        else:
+            try:
+                with open(path, "rb") as f:
+                    if f.read() == data:
+                        return False
+            except FileNotFoundError:
+                pass
+        self.staged[path] = data
+        return True
+
+    def commit(self):
+        """Grava todos os arquivos agendados; desfaz tudo se algo falhar"""
+        with profiling.span("io:commit", sum(len(data) for data in self.staged.values())) as span:
+            replaced = self._commit()
+            span.matches = len(replaced)
+        self.written = replaced
+        self.staged = {}
+        return replaced
+
+    def _commit(self):
+        temps = {}
+        backups = {}
+        replaced = []
+        try:
+            # 1. temporários na mesma pasta (o rename precisa ficar no mesmo sistema de arquivos)
+            files = []
+            for path, data in self.staged.items():
+                directory = os.path.dirname(path) or "."
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.",
+                                                suffix=".tmp")
+                temps[path] = tmp_path
+                f = os.fdopen(fd, "wb")
+                files.append(f)
+                f.write(data)
+                if os.path.exists(path):
+                    os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+            # 2. fsync em lote
+            for f in files:
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+            files = []
+            # 3. backup (hardlink, sem copiar) e troca atômica
+            for path, tmp_path in temps.items():
+                if os.path.exists(path):
+                    backups[path] = _backup(path)
+                os.replace(tmp_path, path)
+                replaced.append(path)
+            _fsync_dirs(replaced)
+        except BaseException:
+            for f in files:
+                f.close()
+            for path in reversed(replaced):
+                if path in backups:
+                    os.replace(backups.pop(path), path)
+                else:
+                    os.remove(path)
+            _fsync_dirs(replaced)
+            raise
+        finally:
+            for tmp_path in temps.values():
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            for backup in backups.values():
+                os.remove(backup)
+        return replaced
+
+
+def _backup(path):
+    """Cria um hardlink (ou cópia, se o sistema não suportar) do arquivo original"""
+    fd, backup = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                  prefix=f".{os.path.basename(path)}.", suffix=".bak")
+    os.close(fd)
+    os.remove(backup)
+    try:
+        os.link(path, backup)
+    except OSError:
+        import shutil
+        shutil.copy2(path, backup)
+    return backup
+
+
+def _fsync_dirs(paths):
+    """fsync das pastas, para que os renames sobrevivam a uma queda de energia"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    for directory in {os.path.dirname(p) or "." for p in paths}:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def content_digest(content):
+    """sha256 do conteúdo (str lida com newline='' ou bytes crus)"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def to_rel_path(path, root=FRONTEND_DIR):
+    """Caminho relativo à raiz do frontend, sempre com '/'"""
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def steps_for(rel_path, steps=None):
+    """Filtra os passos (na ordem de registro) que se aplicam ao arquivo"""
+    return [s for s in (PATCHES if steps is None else steps) if s.matches(rel_path)]
+
+
+def apply_steps(content, steps):
+    """Aplica os passos em sequência sobre o buffer em memória"""
+    results = []
+    for step in steps:
+        with profiling.span(f"step:{step.name}", len(content)) as span:
+            new_content = step.func(content)
+            span.matches = new_content is not None and new_content != content
+        if new_content is None:
+            results.append((step.name, NOT_FOUND))
+        elif new_content == content:
+            results.append((step.name, UNCHANGED))
+        else:
+            results.append((step.name, CHANGED))
+            content = new_content
+    return content, results
+
+
+def compute_file(path, steps):
+    """Aplica os passos só em memória; o conteúdo novo fica em ``result.content`` se mudou"""
+    original = read_file(path)
+    content, results = apply_steps(original, steps)
+    result = FileResult(path, results, content != original, content_digest(content))
+    if result.changed:
+        result.content = content
+    return result
+
+
+def patch_file(path, steps, write=True, transaction=None):
+    """Uma leitura, todos os passos em memória e no máximo uma escrita.
+
+    Com ``transaction`` a escrita só é agendada (veja ``Transaction``).
+    """
+    original = read_file(path)
+    content, results = apply_steps(original, steps)
+    changed = content != original
+    if changed and write:
+        if transaction is not None:
+            transaction.stage(path, content, original)
+        else:
+            write_file(path, content)
+    return FileResult(path, results, changed, content_digest(content))
+
+
+def diff_lines(original, content, rel_path):
+    """Gera o diff unificado linha a linha (sem montar o diff inteiro na memória)"""
+    return difflib.unified_diff(
+        original.splitlines(keepends=True), content.splitlines(keepends=True),
+        fromfile=f"a/{rel_path}", tofile=f"b/{rel_path}")
+
+
+def preview_file(path, steps, rel_path, summary=False):
+    """Aplica os passos só em memória e devolve o resultado com o diff (ou só as contagens)"""
+    original = read_file(path)
+    content, results = apply_steps(original, steps)
+    result = FileResult(path, results, content != original, content_digest(content))
+    if not result.changed:
+        return result
+    chunks = []
+    for line in diff_lines(original, content, rel_path):
+        if line.startswith("@@"):
+            result.hunks += 1
+        elif line.startswith("+") and not line.startswith("+++"):
+            result.added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            result.removed += 1
+        if not summary:
+            chunks.append(line if line.endswith("\n") else line + "\n\\ No newline at end of file\n")
+    result.diff = "".join(chunks)
+    return result
+
+
+def apply_patch_set(paths, steps=None, root=FRONTEND_DIR, write=True, cache=None, strict=False):
+    """Aplica o conjunto de patches a cada arquivo, agrupando os passos por arquivo.
+
+    As gravações formam uma única ``Transaction``: se algum arquivo falhar
+    (exceção num passo ou, com ``strict``, um padrão não encontrado), nenhum
+    arquivo é alterado. Com ``cache`` (um ``patch_cache.PatchCache``),
+    arquivos inalterados desde a última execução são pulados.
+    """
+    results = []
+    recorded = []
+    with Transaction() as transaction:
+        for path in paths:
+            rel_path = to_rel_path(path, root)
+            file_steps = steps_for(rel_path, steps)
+            if not file_steps:
+                continue
+            cached = cache.lookup(path, rel_path, file_steps) if cache else None
+            if cached:
+                results.append(cached)
+                continue
+            result = patch_file(path, file_steps, write=write, transaction=transaction)
+            if strict and result.status == NOT_FOUND:
+                missing = [name for name, status in result.steps if status == NOT_FOUND]
+                raise PatchFailed(f"{rel_path}: padrão não encontrado em {', '.join(missing)}")
+            recorded.append((result, rel_path, file_steps))
+            results.append(result)
+    # o manifesto só registra depois que os arquivos foram de fato trocados
+    if cache and write:
+        for result, rel_path, file_steps in recorded:
+            cache.record(result, rel_path, file_steps)
+        cache.save()
+    return results
+
+
+def discover_files(root=FRONTEND_DIR, bases=("app", "components"), suffixes=(".tsx",)):
+    """Lista (em ordem estável) os arquivos com os sufixos dados sob as pastas base"""
+    found = []
+    for base in bases:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, base)):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(suffixes):
+                    found.append(os.path.join(dirpath, filename))
+    return found
+
+
+def target_files(steps=None, root=FRONTEND_DIR):
+    """Arquivos existentes que são alvo de algum passo"""
+    steps = PATCHES if steps is None else steps
+    return [p for p in discover_files(root) if steps_for(to_rel_path(p, root), steps)]
+
+
+def load_patches(step_names=None):
+    """Importa os módulos de patch e devolve os passos registrados (ou só os nomeados)"""
+    import quiz_patches  # noqa: F401 - registra os passos
+    # Via "python codemod.py" este módulo é __main__; o registro fica em "codemod"
+    from codemod import PATCHES as registered
+
+    if not step_names:
+        return list(registered)
+    unknown = set(step_names) - {s.name for s in registered}
+    if unknown:
+        raise KeyError(f"Passos desconhecidos: {', '.join(sorted(unknown))}")
+    return [s for s in registered if s.name in step_names]
+
+
+def print_results(results):
+    """Imprime o resultado por arquivo e por passo"""
+    for result in results:
+        print(f"{STATUS_LABELS[result.status]}: {to_rel_path(result.path)}")
+        for name, status in result.steps:
+            print(f"   - {name}: {STATUS_LABELS[status]}")
+
+
+def run(step_names=None, root=FRONTEND_DIR, use_cache=True, paths=None):
+    """Executa os passos (todos, ou apenas os nomeados) sobre a árvore.
+
+    ``paths`` (relativos à raiz) limita a execução a esses arquivos, para os
+    scripts de uma página só; passos com alvo amplo (``app/**/*.tsx``) não
+    passam então pelo resto da árvore.
+    """
+    from patch_cache import PatchCache
+
+    try:
+        steps = load_patches(step_names)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return []
+
+    cache = PatchCache(root) if use_cache else None
+    if paths is None:
+        files = target_files(steps, root)
+    else:
+        files = [os.path.join(root, p) for p in paths if os.path.isfile(os.path.join(root, p))]
+    results = apply_patch_set(files, steps, root, cache=cache)
+    print_results(results)
+    return results
+
+
+def main():
+    print("🚀 Aplicando patches...\n")
+    results = run(sys.argv[1:] or None)
+    changed = sum(1 for r in results if r.changed)
+    print(f"\n✅ {changed} de {len(results)} arquivo(s) alterado(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""Encontra trechos quase duplicados entre os .tsx/.ts do frontend
+
+Cada arquivo é tokenizado (sem comentários nem espaços) e vira uma
+sequência de códigos de token; os k-gramas dessa sequência recebem um hash
+rolante e o *winnowing* guarda só o menor hash de cada janela, com a
+posição. Esses fingerprints vão para um índice invertido (hash ->
+ocorrências), então só pares de arquivos que compartilham algum
+fingerprint são comparados — nada de diff de todos contra todos. Cada
+ocorrência em comum é estendida token a token até onde os dois lados são
+iguais, e blocos próximos (separados por uma pequena edição) são unidos
+numa região quase duplicada.
+
+Cópias ``.backup`` entram na varredura e aparecem marcadas no relatório.
+
+Uso:
+    python find_duplicates.py                    # app/, components/, lib/, services/, types/
+    python find_duplicates.py --loose            # ignora nomes de variáveis e literais
+    python find_duplicates.py --min-lines 20 app/dashboard
+    python find_duplicates.py --json > duplicados.json
+    python find_duplicates.py --self-check       # confere a detecção em cópias sintéticas
+"""
+import argparse
+import json
+import os
+import sys
+import zlib
+from collections import defaultdict
+
+from codemod import discover_files, read_file
+from tsx_lexer import IDENT, JSX_TEXT, NUMBER, REGEX, STRING, TEMPLATE, tokenize
+
+SCAN_DIRS = ("app", "components", "lib", "services", "types")
+SUFFIXES = (".tsx", ".ts", ".tsx.backup", ".ts.backup")
+BACKUP_SUFFIX = ".backup"
+
+SHINGLE = 20          # tokens por k-grama
+WINDOW = 8            # janela do winnowing (garante um fingerprint a cada WINDOW k-gramas)
+MIN_TOKENS = 60
+MIN_LINES = 8
+MAX_GAP = 12          # tokens diferentes tolerados entre dois blocos iguais da mesma região
+MAX_OCCURRENCES = 40  # acima disso, cada cópia do k-grama só é pareada com a primeira
+SELF_CHECK_COPIES = 45
+
+HASH_BASE = 1_000_003
+HASH_MOD = (1 << 61) - 1
+
+# Palavras que continuam distintas no modo --loose
+KEYWORDS = frozenset({
+    "async", "await", "break", "case", "catch", "class", "const", "continue", "default",
+    "delete", "do", "else", "export", "extends", "false", "finally", "for", "from", "function",
+    "if", "import", "in", "instanceof", "interface", "let", "new", "null", "of", "return",
+    "switch", "this", "throw", "true", "try", "type", "typeof", "undefined", "var", "void",
+    "while", "yield",
+})
+LITERALS = frozenset({NUMBER, STRING, TEMPLATE, REGEX, JSX_TEXT})
+
+
+def token_key(tok, loose=False):
+    """Texto que representa o token na comparação (``None`` = ignorar)"""
+    value = tok.value
+    if tok.kind == JSX_TEXT:
+        value = " ".join(value.split())
+        if not value:
+            return None
+    if loose:
+        if tok.kind in LITERALS:
+            return tok.kind
+        if tok.kind == IDENT and value not in KEYWORDS:
+            return IDENT
+    return f"{tok.kind}:{value}"
+
+
+class SourceFile:
+    """Tokens de um arquivo já reduzidos a códigos, com offsets para achar as linhas"""
+    __slots__ = ("path", "lines", "codes", "starts", "ends")
+
+    def __init__(self, path, lexer, loose=False):
+        self.path = path
+        self.lines = lexer.lines
+        self.codes = []
+        self.starts = []
+        self.ends = []
+        for tok in lexer.tokens:
+            key = token_key(tok, loose)
+            if key is None:
+                continue
+            self.codes.append(zlib.crc32(key.encode("utf-8")))
+            self.starts.append(tok.start)
+            self.ends.append(tok.end)
+
+    @property
+    def backup(self):
+        return self.path.endswith(BACKUP_SUFFIX)
+
+    def line_range(self, start, end):
+        """Linhas (1-based, inclusivas) dos tokens [start, end)"""
+        return self.lines.line_of(self.starts[start]), self.lines.line_of(self.ends[end - 1] - 1)
+
+
+def shingle_hashes(codes, k=SHINGLE):
+    """Hash rolante de cada k-grama (posição i = tokens [i, i + k))"""
+    if len(codes) < k:
+        return []
+    top = pow(HASH_BASE, k - 1, HASH_MOD)
+    h = 0
+    for code in codes[:k]:
+        h = (h * HASH_BASE + code) % HASH_MOD
+    hashes = [h]
+    for i in range(k, len(codes)):
+        h = ((h - codes[i - k] * top) * HASH_BASE + codes[i]) % HASH_MOD
+        hashes.append(h)
+    return hashes
+
+
+def winnow(hashes, window=WINDOW):
+    """Winnowing: ``[(hash, posição)]`` com o menor hash de cada janela (o mais à direita no empate)"""
+    if not hashes:
+        return []
+    if len(hashes) <= window:
+        pos = min(range(len(hashes)), key=lambda i: (hashes[i], -i))
+        return [(hashes[pos], pos)]
+    selected = []
+    candidates = []   # posições com hashes estritamente crescentes (fila monotônica)
+    head = 0
+    last = -1
+    for i, h in enumerate(hashes):
+        while len(candidates) > head and hashes[candidates[-1]] >= h:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[head] <= i - window:
+            head += 1
+        if i >= window - 1 and candidates[head] != last:
+            last = candidates[head]
+            selected.append((hashes[last], last))
+        if head > 1024:
+            del candidates[:head]
+            head = 0
+    return selected
+
+
+class Region:
+    """Trecho igual (ou quase) em dois arquivos: tokens [a_start, a_end) e [b_start, b_end)"""
+    __slots__ = ("a", "b", "a_start", "a_end", "b_start", "b_end", "matched")
+
+    def __init__(self, a, b, a_start, a_end, b_start, b_end):
+        self.a = a
+        self.b = b
+        self.a_start = a_start
+        self.a_end = a_end
+        self.b_start = b_start
+        self.b_end = b_end
+        self.matched = a_end - a_start
+
+    @property
+    def tokens(self):
+        return min(self.a_end - self.a_start, self.b_end - self.b_start)
+
+    @property
+    def similarity(self):
+        return min(1.0, self.matched / max(self.a_end - self.a_start, self.b_end - self.b_start))
+
+    def lines(self):
+        return self.a.line_range(self.a_start, self.a_end), self.b.line_range(self.b_start, self.b_end)
+
+
+class DuplicateFinder:
+    """Índice invertido de fingerprints de todos os arquivos"""
+
+    def __init__(self, shingle=SHINGLE, window=WINDOW, loose=False, max_occurrences=MAX_OCCURRENCES):
+        self.shingle = shingle
+        self.window = window
+        self.loose = loose
+        self.max_occurrences = max_occurrences
+        self.files = []
+        self.index = defaultdict(list)   # hash -> [(nº do arquivo, posição do token)]
+
+    def add(self, path, text):
+        lexer = tokenize(text, jsx=".tsx" in os.path.basename(path))
+        source = SourceFile(path, lexer, self.loose)
+        number = len(self.files)
+        self.files.append(source)
+        for h, pos in winnow(shingle_hashes(source.codes, self.shingle), self.window):
+            self.index[h].append((number, pos))
+        return source
+
+    @property
+    def token_count(self):
+        return sum(len(f.codes) for f in self.files)
+
+    def candidate_pairs(self):
+        """Ocorrências em comum agrupadas por par de arquivos: ``{(fa, fb): {(pa, pb)}}``"""
+        pairs = defaultdict(set)
+        for occurrences in self.index.values():
+            if len(occurrences) < 2:
+                continue
+            for first, second in self._occurrence_pairs(occurrences):
+                (fa, pa), (fb, pb) = sorted((first, second))
+                if fa == fb and pb - pa < self.shingle:
+                    continue   # k-gramas sobrepostos do mesmo trecho repetitivo
+                pairs[fa, fb].add((pa, pb))
+        return pairs
+
+    def _occurrence_pairs(self, occurrences):
+        """Pares de ocorrências de um hash a estender.
+
+        Até ``max_occurrences`` vale todos contra todos. Acima disso (o mesmo
+        trecho copiado em dezenas de arquivos, ou boilerplate como imports) o
+        número de pares seria quadrático: as ocorrências são agrupadas pelos
+        tokens do k-grama e cada uma só é pareada com a primeira do grupo.
+        """
+        if len(occurrences) <= self.max_occurrences:
+            for i, first in enumerate(occurrences):
+                for second in occurrences[i + 1:]:
+                    yield first, second
+            return
+        groups = defaultdict(list)
+        for number, pos in occurrences:
+            groups[tuple(self.files[number].codes[pos:pos + self.shingle])].append((number, pos))
+        for group in groups.values():
+            for second in group[1:]:
+                yield group[0], second
+
+    def _extend(self, fa, fb, pa, pb):
+        """Estende o k-grama em comum enquanto os tokens forem iguais"""
+        a = self.files[fa].codes
+        b = self.files[fb].codes
+        if a[pa:pa + self.shingle] != b[pb:pb + self.shingle]:
+            return None   # colisão de hash
+        # no mesmo arquivo, o trecho de cima não pode invadir o de baixo
+        same = fa == fb
+        start_a, start_b = pa, pb
+        end_a, end_b = pa + self.shingle, pb + self.shingle
+        while start_a > 0 and a[start_a - 1] == b[start_b - 1] and (not same or start_b > end_a):
+            start_a -= 1
+            start_b -= 1
+        limit_a = start_b if same else len(a)
+        while end_a < limit_a and end_b < len(b) and a[end_a] == b[end_b]:
+            end_a += 1
+            end_b += 1
+        return start_a, end_a, start_b, end_b
+
+    def regions(self, min_tokens=MIN_TOKENS, min_lines=MIN_LINES, max_gap=MAX_GAP):
+        """Regiões quase duplicadas acima dos limites, das maiores para as menores"""
+        found = []
+        for (fa, fb), seeds in self.candidate_pairs().items():
+            a, b = self.files[fa], self.files[fb]
+            exact = []
+            covered = defaultdict(int)   # diagonal (pb - pa) -> fim já coberto em a
+            for pa, pb in sorted(seeds, key=lambda s: (s[1] - s[0], s[0])):
+                if pa < covered[pb - pa]:
+                    continue
+                span = self._extend(fa, fb, pa, pb)
+                if span is None:
+                    continue
+                covered[pb - pa] = span[1]
+                exact.append(Region(a, b, *span))
+            for region in merge_regions(exact, max_gap):
+                if region.tokens < min_tokens:
+                    continue
+                (a1, a2), (b1, b2) = region.lines()
+                if min(a2 - a1, b2 - b1) + 1 >= min_lines:
+                    found.append(region)
+        found.sort(key=lambda r: (-r.tokens, r.a.path, r.a_start))
+        return found
+
+
+def merge_regions(exact, max_gap=MAX_GAP):
+    """Une blocos iguais separados por até ``max_gap`` tokens diferentes nos dois lados"""
+    merged = []
+    for region in sorted(exact, key=lambda r: (r.a_start, r.b_start)):
+        for current in reversed(merged[-8:]):
+            if current.a_end - max_gap <= region.a_start <= current.a_end + max_gap \
+                    and current.b_end - max_gap <= region.b_start <= current.b_end + max_gap:
+                current.matched += region.matched
+                current.a_end = max(current.a_end, region.a_end)
+                current.b_end = max(current.b_end, region.b_end)
+                break
+        else:
+            merged.append(region)
+    # descarta regiões contidas em outra maior do mesmo par
+    merged.sort(key=lambda r: (r.a_start, -(r.a_end - r.a_start)))
+    result = []
+    for region in merged:
+        if any(o.a_start <= region.a_start and region.a_end <= o.a_end
+               and o.b_start <= region.b_start and region.b_end <= o.b_end for o in result[-8:]):
+            continue
+        result.append(region)
+    return result
+
+
+def read_source(path):
+    """Conteúdo do arquivo; cópias antigas às vezes estão em Latin-1"""
+    try:
+        return read_file(path)
+    except UnicodeDecodeError:
+        with open(path, "r", encoding="latin-1", newline="") as f:
+            return f.read()
+
+
+def display_path(path):
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def collect_paths(targets, root=".", backups=True):
+    suffixes = SUFFIXES if backups else tuple(s for s in SUFFIXES if not s.endswith(BACKUP_SUFFIX))
+    if not targets:
+        return discover_files(root, SCAN_DIRS, suffixes)
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            paths.extend(discover_files(target, (".",), suffixes))
+        else:
+            paths.append(target)
+    return paths
+
+
+SELF_CHECK_PAGE = """'use client';
+
+import { useState } from 'react';
+
+export default function Page() {
+  const [title, setTitle] = useState('');
+  const [saving, setSaving] = useState(false);
+
+  async function handleSubmit(e: React.FormEvent) {
+    e.preventDefault();
+    setSaving(true);
+    try {
+      await fetch('/api/courses', { method: 'POST', body: JSON.stringify({ title }) });
+    } finally {
+      setSaving(false);
+    }
+  }
+
+  return (
+    <form onSubmit={handleSubmit} className="space-y-4">
+      <input value={title} onChange={(e) => setTitle(e.target.value)} className="w-full border" />
+      <button type="submit" disabled={saving}>{saving ? 'Salvando...' : 'Salvar'}</button>
+    </form>
+  );
+}
+"""
+
+
+def self_check(copies=SELF_CHECK_COPIES):
+    """Mesma página copiada ``copies`` vezes (mais que ``MAX_OCCURRENCES``): toda cópia tem de aparecer"""
+    finder = DuplicateFinder()
+    for i in range(copies):
+        finder.add(f"app/copia{i}/page.tsx", SELF_CHECK_PAGE)
+    reported = set()
+    for region in finder.regions():
+        reported.update((region.a.path, region.b.path))
+    return copies - len(reported)
+
+
+def region_dict(region):
+    (a1, a2), (b1, b2) = region.lines()
+    return {
+        "a": {"path": display_path(region.a.path), "lines": [a1, a2]},
+        "b": {"path": display_path(region.b.path), "lines": [b1, b2]},
+        "tokens": region.tokens,
+        "similarity": round(region.similarity, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="arquivos ou pastas (padrão: " + ", ".join(SCAN_DIRS) + ")")
+    parser.add_argument("--min-tokens", type=int, default=MIN_TOKENS,
+                        help=f"tamanho mínimo da região em tokens (padrão: {MIN_TOKENS})")
+    parser.add_argument("--min-lines", type=int, default=MIN_LINES,
+                        help=f"tamanho mínimo da região em linhas (padrão: {MIN_LINES})")
+    parser.add_argument("-k", "--shingle", type=int, default=SHINGLE,
+                        help=f"tokens por k-grama (padrão: {SHINGLE})")
+    parser.add_argument("-w", "--window", type=int, default=WINDOW,
+                        help=f"janela do winnowing (padrão: {WINDOW})")
+    parser.add_argument("--gap", type=int, default=MAX_GAP,
+                        help=f"tokens diferentes tolerados dentro de uma região (padrão: {MAX_GAP})")
+    parser.add_argument("--loose", action="store_true",
+                        help="trata identificadores e literais como iguais (acha cópias renomeadas)")
+    parser.add_argument("--no-backups", action="store_true", help="ignora arquivos .backup")
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    parser.add_argument("--self-check", action="store_true",
+                        help=f"confere se {SELF_CHECK_COPIES} cópias idênticas de uma página são todas encontradas")
+    args = parser.parse_args()
+
+    if args.self_check:
+        missing = self_check()
+        if missing:
+            print(f"❌ {missing} de {SELF_CHECK_COPIES} cópia(s) idêntica(s) não apareceram no relatório")
+            return 1
+        print(f"✅ {SELF_CHECK_COPIES} cópias idênticas encontradas")
+        return 0
+
+    finder = DuplicateFinder(args.shingle, args.window, args.loose)
+    for path in collect_paths(args.paths, backups=not args.no_backups):
+        try:
+            finder.add(path, read_source(path))
+        except OSError as e:
+            print(f"⚠️  {display_path(path)}: {e}", file=sys.stderr)
+    regions = finder.regions(args.min_tokens, args.min_lines, args.gap)
+
+    if args.json:
+        json.dump([region_dict(r) for r in regions], sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return 0
+
+    shipped_lines = 0
+    for region in regions:
+        (a1, a2), (b1, b2) = region.lines()
+        tags = " (backup)" if region.a.backup or region.b.backup else ""
+        print(f"🔁 {display_path(region.a.path)}:{a1}-{a2} ≈ {display_path(region.b.path)}:{b1}-{b2}"
+              f"  ({min(a2 - a1, b2 - b1) + 1} linhas, {region.tokens} tokens, "
+              f"{region.similarity:.0%} iguais){tags}")
+        if not tags:
+            shipped_lines += b2 - b1 + 1
+    print(f"\n📊 {len(finder.files)} arquivo(s), {finder.token_count} tokens, "
+          f"{len(finder.index)} fingerprints; {len(regions)} região(ões) duplicada(s)")
+    if regions:
+        print(f"   ~{shipped_lines} linha(s) repetida(s) fora de backups (candidatas a componente comum)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
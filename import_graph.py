@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""Grafo de imports do frontend e peso estimado do primeiro carregamento de cada rota
+
+Lê os imports de app/, components/, services/, lib/ e types/ (via
+tokenizador), resolve o alias ``@/`` pelos ``paths`` do tsconfig.json e
+monta o grafo. Cada rota é a ``page.tsx`` mais os ``layout.tsx`` acima
+dela; a partir deles o grafo é percorrido respeitando a fronteira
+``'use client'`` (módulos só alcançados por server components não vão
+para o navegador) e separando o que é carregado sob demanda
+(``next/dynamic`` / ``import()``). Para cada rota sai o peso do código
+local (bytes de fonte) e dos pacotes npm (estimativa min+gzip), com aviso
+quando axios, outro pacote pesado ou código de canvas entram no primeiro
+carregamento.
+
+O resultado da leitura de cada arquivo fica em ``.import-graph-cache.json``
+(mtime/tamanho); só arquivos alterados são tokenizados de novo.
+
+Uso:
+    python import_graph.py                      # todas as rotas
+    python import_graph.py /dashboard/courses   # rotas com esse prefixo
+    python import_graph.py --json > rotas.json
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+
+from codemod import FRONTEND_DIR, discover_files, read_file
+from tsx_lexer import IDENT, JSX_OPEN, PUNCT, STRING, tokenize
+
+SCAN_DIRS = ("app", "components", "services", "lib", "types")
+SUFFIXES = (".tsx", ".ts", ".jsx", ".js")
+RESOLVE_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+PAGE_FILES = ("page.tsx", "page.ts", "page.jsx", "page.js")
+LAYOUT_FILES = ("layout.tsx", "layout.ts", "layout.jsx", "layout.js")
+BOM = "\ufeff"
+
+CACHE_FILE = ".import-graph-cache.json"
+CACHE_FORMAT = 1
+
+# Tipos de aresta
+STATIC = "static"
+DYNAMIC = "dynamic"       # import('...') / next/dynamic: chunk sob demanda
+
+# Runtime compartilhado por todas as rotas (não entra na conta de cada uma)
+FRAMEWORK_PACKAGES = frozenset({"react", "react-dom", "next"})
+# Estimativa min+gzip dos pacotes usados (bytes)
+PACKAGE_BYTES = {
+    "axios": 13_500,
+    "react-hot-toast": 4_800,
+    "react-hook-form": 9_500,
+    "tailwind-merge": 6_800,
+    "zustand": 1_200,
+    "clsx": 300,
+    "date-fns": 2_000,
+}
+# Pacotes de ícones são tree-shaken: custo por ícone importado
+ICON_PACKAGES = frozenset({"lucide-react", "react-icons"})
+ICON_BYTES = 400
+HEAVY_PACKAGES = frozenset({"axios"})
+HEAVY_BYTES = 10_000
+
+
+class ModuleInfo:
+    """O que importa de um arquivo para o grafo (é isso que vai para o cache)"""
+    __slots__ = ("path", "size", "client", "runtime", "canvas", "imports")
+
+    def __init__(self, path, size, client, runtime, canvas, imports):
+        self.path = path
+        self.size = size
+        self.client = client        # começa com 'use client'
+        self.runtime = runtime      # tem código além de tipos/interfaces
+        self.canvas = canvas        # usa <canvas> / getContext
+        self.imports = imports      # [(especificador, STATIC|DYNAMIC, nomes importados)]
+
+    def as_dict(self):
+        return {"size": self.size, "client": self.client, "runtime": self.runtime,
+                "canvas": self.canvas, "imports": [list(i) for i in self.imports]}
+
+    @classmethod
+    def from_dict(cls, path, data):
+        return cls(path, data["size"], data["client"], data["runtime"], data["canvas"],
+                   [tuple(i) for i in data["imports"]])
+
+
+def unquote(token):
+    return token.value[1:-1]
+
+
+def _import_clause(tokens, i, depth):
+    """Nomes importados e se o ``import ... from`` é só de tipos; devolve ``(nomes, só_tipos, índice da string)``"""
+    j = i + 1
+    type_only = tokens[j].kind == IDENT and tokens[j].value == "type" \
+        and not (tokens[j + 1].kind == IDENT and tokens[j + 1].value == "from") \
+        and not (tokens[j + 1].kind == PUNCT and tokens[j + 1].value == ",")
+    names = []
+    runtime_names = 0
+    while j < len(tokens) and not (tokens[j].kind == STRING and tokens[j].depth == depth):
+        tok = tokens[j]
+        if tok.kind == PUNCT and tok.value == ";":
+            return names, True, None
+        if tok.kind == IDENT and tok.value not in ("type", "from", "as", "import"):
+            prev = tokens[j - 1]
+            if not (prev.kind == IDENT and prev.value == "as"):
+                names.append(tok.value)
+                if not (prev.kind == IDENT and prev.value == "type"):
+                    runtime_names += 1
+        j += 1
+    if j == len(tokens):
+        return names, True, None
+    return names, type_only or bool(names and not runtime_names), j
+
+
+def parse_module(path, text, jsx=True):
+    """Lê imports, diretiva e uso de canvas de um arquivo"""
+    text = text.lstrip(BOM)
+    tokens = tokenize(text, jsx=jsx).tokens
+    client = bool(tokens) and tokens[0].kind == STRING and unquote(tokens[0]) == "use client"
+    imports = []
+    runtime = False
+    canvas = False
+    for i, tok in enumerate(tokens):
+        if tok.kind == JSX_OPEN and tok.value == "canvas":
+            canvas = True
+            continue
+        if tok.kind != IDENT:
+            continue
+        value = tok.value
+        nxt = tokens[i + 1] if i + 1 < len(tokens) else None
+        if value == "getContext":
+            canvas = True
+        elif value in ("import", "require") and nxt is not None and nxt.kind == PUNCT and nxt.value == "(":
+            arg = tokens[i + 2] if i + 2 < len(tokens) else None
+            if arg is not None and arg.kind == STRING:
+                imports.append((unquote(arg), DYNAMIC if value == "import" else STATIC, []))
+        elif value == "import" and tok.depth == 0 and nxt is not None:
+            if nxt.kind == STRING:                          # import './globals.css'
+                imports.append((unquote(nxt), STATIC, []))
+                continue
+            names, type_only, at = _import_clause(tokens, i, tok.depth)
+            if at is not None and not type_only:
+                imports.append((unquote(tokens[at]), STATIC, names))
+        elif value == "export" and tok.depth == 0 and nxt is not None:
+            if nxt.kind == PUNCT and nxt.value in ("{", "*"):
+                names, type_only, at = _import_clause(tokens, i, tok.depth)
+                if at is not None and not type_only and tokens[at - 1].value == "from":
+                    imports.append((unquote(tokens[at]), STATIC, names))
+                    runtime = True
+            elif not (nxt.kind == IDENT and nxt.value in ("interface", "type", "declare")):
+                runtime = True
+        elif tok.depth == 0 and value in ("const", "let", "var", "function", "class", "enum"):
+            runtime = True
+    return ModuleInfo(path, len(text.encode("utf-8")), client, runtime, canvas, imports)
+
+
+def read_tsconfig(root=FRONTEND_DIR):
+    """``compilerOptions`` do tsconfig.json (aceita comentários e vírgulas sobrando)"""
+    path = os.path.join(root, "tsconfig.json")
+    try:
+        text = read_file(path).lstrip(BOM)
+    except OSError:
+        return {}
+    try:
+        data = json.loads(text)
+    except ValueError:
+        # JSONC: o tokenizador já descarta comentários; sobram as vírgulas finais
+        tokens = tokenize(text, jsx=False).tokens
+        kept = [t.value for n, t in enumerate(tokens)
+                if not (t.value == "," and n + 1 < len(tokens) and tokens[n + 1].value in ("}", "]"))]
+        data = json.loads(" ".join(kept))
+    return data.get("compilerOptions", {})
+
+
+class Resolver:
+    """Resolve especificadores para arquivos do projeto (alias do tsconfig e caminhos relativos)"""
+
+    def __init__(self, root=FRONTEND_DIR, options=None):
+        options = read_tsconfig(root) if options is None else options
+        self.root = root
+        self.base = os.path.normpath(os.path.join(root, options.get("baseUrl", ".")))
+        self.aliases = []
+        for pattern, targets in options.get("paths", {}).items():
+            prefix, star, suffix = pattern.partition("*")
+            self.aliases.append((prefix, suffix if star else None, targets))
+        # prefixo mais longo primeiro, como o TypeScript
+        self.aliases.sort(key=lambda a: -len(a[0]))
+
+    def _file(self, candidate):
+        if os.path.isfile(candidate):
+            return candidate
+        for ext in RESOLVE_EXTENSIONS:
+            if os.path.isfile(candidate + ext):
+                return candidate + ext
+        for ext in RESOLVE_EXTENSIONS:
+            index = os.path.join(candidate, "index" + ext)
+            if os.path.isfile(index):
+                return index
+        return None
+
+    def resolve(self, spec, importer):
+        """``("file", caminho)``, ``("package", nome)`` ou ``("missing", spec)``"""
+        if spec.startswith("."):
+            found = self._file(os.path.normpath(os.path.join(os.path.dirname(importer), spec)))
+            return ("file", found) if found else ("missing", spec)
+        for prefix, suffix, targets in self.aliases:
+            if suffix is None:
+                if spec != prefix:
+                    continue
+                rest = ""
+            elif spec.startswith(prefix) and spec.endswith(suffix):
+                rest = spec[len(prefix):len(spec) - len(suffix)]
+            else:
+                continue
+            for target in targets:
+                found = self._file(os.path.normpath(os.path.join(self.base, target.replace("*", rest))))
+                if found:
+                    return "file", found
+            return "missing", spec
+        parts = spec.split("/")
+        return "package", "/".join(parts[:2]) if spec.startswith("@") else parts[0]
+
+
+class GraphCache:
+    """Manifesto ``caminho -> {mtime_ns, size, ModuleInfo}`` dos arquivos já lidos"""
+
+    def __init__(self, root=FRONTEND_DIR, filename=CACHE_FILE, enabled=True):
+        self.path = os.path.join(root, filename)
+        self.root = root
+        self.enabled = enabled
+        self.files = {}
+        self.dirty = False
+        self.hits = 0
+        self.parsed = 0
+        if enabled:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") == CACHE_FORMAT:
+            self.files = data.get("files", {})
+
+    def save(self):
+        """Grava o manifesto de forma atômica e sem os arquivos que sumiram"""
+        if not (self.enabled and self.dirty):
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": CACHE_FORMAT, "files": self.files}, f,
+                      ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def module(self, path):
+        """``ModuleInfo`` do arquivo, do cache se mtime/tamanho não mudaram"""
+        rel_path = os.path.relpath(path, self.root).replace(os.sep, "/")
+        st = os.stat(path)
+        entry = self.files.get(rel_path)
+        if entry and (entry["mtime_ns"], entry["st_size"]) == (st.st_mtime_ns, st.st_size):
+            self.hits += 1
+            return ModuleInfo.from_dict(path, entry["module"])
+        info = parse_module(path, read_file(path), jsx=not path.endswith(".ts"))
+        self.parsed += 1
+        self.files[rel_path] = {"mtime_ns": st.st_mtime_ns, "st_size": st.st_size, "module": info.as_dict()}
+        self.dirty = True
+        return info
+
+    def prune(self, paths):
+        keep = {os.path.relpath(p, self.root).replace(os.sep, "/") for p in paths}
+        for rel_path in set(self.files) - keep:
+            del self.files[rel_path]
+            self.dirty = True
+
+
+class ImportGraph:
+    """Módulos do projeto e as arestas já resolvidas"""
+
+    def __init__(self, root=FRONTEND_DIR, cache=None):
+        self.root = root
+        self.resolver = Resolver(root)
+        self.cache = cache if cache is not None else GraphCache(root, enabled=False)
+        self.modules = {}
+        self.edges = {}       # caminho -> [(destino, tipo, nomes)]; destino = caminho ou "pkg:nome"
+        self.missing = []     # (importador, especificador)
+
+    def build(self, paths=None):
+        paths = discover_files(self.root, SCAN_DIRS, SUFFIXES) if paths is None else paths
+        paths = [os.path.normpath(p) for p in paths]
+        for path in paths:
+            self.modules[path] = self.cache.module(path)
+        self.cache.prune(paths)
+        for path, info in self.modules.items():
+            edges = self.edges[path] = []
+            for spec, kind, names in info.imports:
+                what, target = self.resolver.resolve(spec, path)
+                if what == "file":
+                    target = os.path.normpath(target)
+                    if target in self.modules:
+                        edges.append((target, kind, names))
+                elif what == "package":
+                    edges.append(("pkg:" + target, kind, names))
+                else:
+                    self.missing.append((path, spec))
+        return self
+
+    def routes(self):
+        """``[(rota, página, [layouts da raiz até a página])]``"""
+        app_dir = os.path.normpath(os.path.join(self.root, "app"))
+        found = []
+        for path in self.modules:
+            if os.path.basename(path) not in PAGE_FILES or not path.startswith(app_dir + os.sep):
+                continue
+            directory = os.path.dirname(path)
+            rel = os.path.relpath(directory, app_dir)
+            segments = [s for s in rel.replace(os.sep, "/").split("/")
+                        if s != "." and not (s.startswith("(") and s.endswith(")"))]
+            layouts = []
+            while True:
+                for name in LAYOUT_FILES:
+                    layout = os.path.join(directory, name)
+                    if layout in self.modules:
+                        layouts.append(layout)
+                        break
+                if directory == app_dir:
+                    break
+                directory = os.path.dirname(directory)
+            found.append(("/" + "/".join(segments), path, layouts[::-1]))
+        return sorted(found)
+
+    def route_report(self, route, page, layouts):
+        """Módulos e pacotes do primeiro carregamento e dos chunks sob demanda de uma rota"""
+        entries = layouts + [page]
+        parents = {}
+        first_load = []
+        packages = {}
+        lazy_roots = []
+        # 1) imports estáticos a partir das entradas; server components não entram na conta
+        queue = deque((entry, self.modules[entry].client, None) for entry in entries)
+        seen = set()
+        while queue:
+            path, client, parent = queue.popleft()
+            if (path, client) in seen:
+                continue
+            seen.add((path, client))
+            if client and path not in parents:
+                parents[path] = parent
+                first_load.append(path)
+            for target, kind, names in self.edges[path]:
+                if target.startswith("pkg:"):
+                    if client and kind == STATIC:
+                        packages.setdefault(target[4:], (path, set()))[1].update(names)
+                    continue
+                target_client = client or self.modules[target].client
+                if kind == DYNAMIC:
+                    if target_client:
+                        lazy_roots.append((target, path))
+                    continue
+                queue.append((target, target_client, path))
+        # 2) chunks sob demanda: o que é alcançado só pelos import() dinâmicos
+        lazy = []
+        lazy_packages = {}
+        queue = deque(lazy_roots)
+        while queue:
+            path, parent = queue.popleft()
+            if path in parents:
+                continue
+            parents[path] = parent
+            lazy.append(path)
+            for target, kind, names in self.edges[path]:
+                if target.startswith("pkg:"):
+                    if target[4:] not in packages:
+                        lazy_packages.setdefault(target[4:], (path, set()))[1].update(names)
+                    continue
+                queue.append((target, path))
+        return RouteReport(self, route, page, layouts, first_load, packages, lazy, lazy_packages, parents)
+
+
+def package_bytes(name, names):
+    if name in FRAMEWORK_PACKAGES or name.startswith("next/"):
+        return 0
+    if name in ICON_PACKAGES or name.split("/")[0] in ICON_PACKAGES:
+        return ICON_BYTES * len(names)
+    return PACKAGE_BYTES.get(name, 0)
+
+
+class RouteReport:
+    """Peso de uma rota (bytes de fonte local + estimativa dos pacotes)"""
+
+    def __init__(self, graph, route, page, layouts, first_load, packages, lazy, lazy_packages, parents):
+        self.graph = graph
+        self.route = route
+        self.page = page
+        self.layouts = layouts
+        self.first_load = first_load
+        self.packages = {n: (importer, names) for n, (importer, names) in packages.items()
+                         if n not in FRAMEWORK_PACKAGES and not n.startswith("next/")}
+        self.lazy = lazy
+        self.lazy_packages = {n: v for n, v in lazy_packages.items()
+                              if n not in FRAMEWORK_PACKAGES and not n.startswith("next/")}
+        self.parents = parents
+
+    def _bytes(self, paths):
+        return sum(self.graph.modules[p].size for p in paths if self.graph.modules[p].runtime)
+
+    @property
+    def source_bytes(self):
+        return self._bytes(self.first_load)
+
+    @property
+    def package_bytes(self):
+        return sum(package_bytes(n, names) for n, (_, names) in self.packages.items())
+
+    @property
+    def lazy_bytes(self):
+        return self._bytes(self.lazy) + sum(package_bytes(n, names) for n, (_, names) in self.lazy_packages.items())
+
+    @property
+    def total_bytes(self):
+        return self.source_bytes + self.package_bytes
+
+    def chain(self, path):
+        """Caminho de imports da entrada da rota até ``path``"""
+        chain = []
+        while path is not None:
+            chain.append(path)
+            path = self.parents.get(path)
+        return chain[::-1]
+
+    def warnings(self):
+        """``[(mensagem, cadeia de imports)]`` para pacotes pesados e canvas no primeiro carregamento"""
+        found = []
+        for name, (importer, names) in sorted(self.packages.items()):
+            if name in HEAVY_PACKAGES or package_bytes(name, names) >= HEAVY_BYTES:
+                found.append((f"{name} (~{package_bytes(name, names) / 1000:.1f} KB) no primeiro carregamento",
+                              self.chain(importer) + [name]))
+        for path in self.first_load:
+            if self.graph.modules[path].canvas:
+                found.append((f"código de canvas no primeiro carregamento: {display_path(path)}",
+                              self.chain(path)))
+        return found
+
+    def as_dict(self):
+        return {
+            "route": self.route,
+            "page": display_path(self.page),
+            "layouts": [display_path(p) for p in self.layouts],
+            "first_load": {
+                "source_bytes": self.source_bytes,
+                "package_bytes": self.package_bytes,
+                "modules": [display_path(p) for p in self.first_load],
+                "packages": {n: package_bytes(n, names) for n, (_, names) in sorted(self.packages.items())},
+            },
+            "lazy": {
+                "bytes": self.lazy_bytes,
+                "modules": [display_path(p) for p in self.lazy],
+                "packages": sorted(self.lazy_packages),
+            },
+            "warnings": [{"message": m, "chain": [display_path(p) for p in c]} for m, c in self.warnings()],
+        }
+
+
+def display_path(path):
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def kb(value):
+    return f"{value / 1000:.1f} KB"
+
+
+def print_route(report):
+    print(f"🧭 {report.route}  ({display_path(report.page)}"
+          f"{f' + {len(report.layouts)} layout(s)' if report.layouts else ''})")
+    print(f"   primeiro carregamento: ~{kb(report.total_bytes)} = {kb(report.source_bytes)} de fonte em "
+          f"{len(report.first_load)} módulo(s) + ~{kb(report.package_bytes)} de pacotes")
+    if report.packages:
+        packages = ", ".join(f"{n} (~{kb(package_bytes(n, names))})" if package_bytes(n, names) else n
+                             for n, (_, names) in sorted(report.packages.items()))
+        print(f"   pacotes: {packages}")
+    if report.lazy:
+        print(f"   sob demanda: {', '.join(display_path(p) for p in report.lazy)} (~{kb(report.lazy_bytes)})")
+    for message, chain in report.warnings():
+        print(f"   ⚠️  {message}")
+        print(f"      {' -> '.join(display_path(p) for p in chain)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("routes", nargs="*", help="prefixos de rota a mostrar (padrão: todas)")
+    parser.add_argument("--root", default=FRONTEND_DIR, help="raiz do frontend")
+    parser.add_argument("--no-cache", action="store_true", help=f"ignora o {CACHE_FILE}")
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    args = parser.parse_args()
+
+    cache = GraphCache(args.root, enabled=not args.no_cache)
+    graph = ImportGraph(args.root, cache).build()
+    cache.save()
+
+    reports = [graph.route_report(*route) for route in graph.routes()
+               if not args.routes or any(route[0].startswith(prefix) for prefix in args.routes)]
+    reports.sort(key=lambda r: -r.total_bytes)
+
+    if args.json:
+        json.dump([r.as_dict() for r in reports], sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return 0
+
+    for report in reports:
+        print_route(report)
+        print()
+    for importer, spec in graph.missing:
+        print(f"❓ {display_path(importer)}: import não resolvido {spec!r}")
+    warned = sum(1 for r in reports if r.warnings())
+    print(f"📊 {len(graph.modules)} módulo(s), {len(reports)} rota(s), {warned} com aviso; "
+          f"{cache.parsed} arquivo(s) lido(s), {cache.hits} do cache")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
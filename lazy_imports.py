@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Troca imports estáticos de componentes por ``next/dynamic`` (carregamento sob demanda)
+
+``import QuizPlayer from '@/components/QuizPlayer';`` vira
+
+    const QuizPlayer = dynamic(() => import('@/components/QuizPlayer'), {
+      loading: () => <p className="...">Carregando...</p>,
+    });
+
+mantendo o mesmo nome local, então os usos no JSX (``<QuizPlayer ... />``)
+continuam iguais e o componente sai do bundle do primeiro carregamento da
+página. O import de ``next/dynamic`` entra no lugar do import removido
+quando ainda não existe. Rodar de novo num arquivo já convertido não muda
+nada.
+"""
+import re
+
+from tsx_index import build_index
+
+NEXT_DYNAMIC = "next/dynamic"
+DYNAMIC_IMPORT = "import dynamic from 'next/dynamic';"
+DEFAULT_LOADING = '<p className="py-4 text-center text-gray-600">Carregando...</p>'
+
+DEFAULT_IMPORT_RE = re.compile(r"import\s+([A-Za-z_$][\w$]*)\s+from\s+(['\"])(.+?)\2\s*;?")
+
+
+def dynamic_declaration(name, source, loading=DEFAULT_LOADING, ssr=True, dynamic="dynamic"):
+    """``const Nome = dynamic(() => import('fonte'), {...});``"""
+    options = [f"  loading: () => {loading},"]
+    if not ssr:
+        options.append("  ssr: false,")
+    return (f"const {name} = {dynamic}(() => import('{source}'), {{\n"
+            + "\n".join(options) + "\n});")
+
+
+def is_lazy(content, source):
+    """Indica se ``source`` já é importado com ``import()``"""
+    return f"import('{source}')" in content or f'import("{source}")' in content
+
+
+def has_component_import(content, name, source):
+    """Import estático ou declaração ``dynamic`` do componente já presentes"""
+    return f"import {name} from" in content or is_lazy(content, source)
+
+
+def _statement_span(text, start, end):
+    """Intervalo do import com a quebra de linha que o segue (para remover a linha inteira)"""
+    line_start = text.rfind("\n", 0, start) + 1
+    if text[line_start:start].strip():
+        return start, end
+    line_end = text.find("\n", end)
+    if line_end < 0 or text[end:line_end].strip():
+        return start, end
+    return line_start, line_end + 1
+
+
+def make_lazy(content, source, loading=DEFAULT_LOADING, ssr=True):
+    """Converte o import padrão de ``source`` em ``next/dynamic``.
+
+    Devolve o conteúdo intacto se já convertido e ``None`` se o arquivo não
+    importa ``source`` (ou o importa de um jeito que não dá para converter,
+    como ``import A, { b } from``).
+    """
+    if source not in content:
+        return None
+    if is_lazy(content, source):
+        return content
+    index = build_index(content)
+    imports = [s for s in index.symbols if s.kind == "import"]
+    target = next((s for s in imports if s.source == source), None)
+    if target is None:
+        return None
+    match = DEFAULT_IMPORT_RE.fullmatch(content[target.start:target.end])
+    if match is None:
+        return None
+    name = match.group(1)
+
+    dynamic_symbol = next((s for s in imports if s.source == NEXT_DYNAMIC), None)
+    dynamic = dynamic_symbol.name if dynamic_symbol else "dynamic"
+    start, end = _statement_span(content, target.start, target.end)
+    if dynamic_symbol is None:
+        # o import de next/dynamic ocupa o lugar do import removido
+        replacement = DYNAMIC_IMPORT + content[target.end:end]
+    else:
+        replacement = ""
+    content = content[:start] + replacement + content[end:]
+
+    # a declaração vai depois do último import (e de outros dynamic já declarados)
+    index = build_index(content)
+    insert_at = max(s.end for s in index.symbols if s.kind == "import")
+    declared = re.compile(rf"^const [\w$]+ = {re.escape(dynamic)}\(\(\) => import\(.*?^\}}\);", re.M | re.S)
+    for previous in declared.finditer(content, insert_at):
+        insert_at = previous.end()
+    declaration = dynamic_declaration(name, source, loading, ssr, dynamic)
+    return content[:insert_at] + "\n\n" + declaration + content[insert_at:]
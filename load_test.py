@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Gera carga na API repetindo as requisições que cada página faz ao abrir
+
+A sequência de cada rota vem do audit_fetching: as chamadas feitas ao
+abrir (layouts, página e componentes carregados no primeiro carregamento),
+na ordem do código. Chamadas da mesma função aguardadas com ``await`` vão
+em série, as de um mesmo ``Promise.all`` juntas, e funções diferentes
+disparadas pelo ``useEffect`` correm em paralelo, como no navegador
+(até 6 conexões por usuário virtual). Os parâmetros (``:id``,
+``:courseId``...) são preenchidos com ids de ``GET /api/__fixtures`` do
+mock_api, um curso/equipe/... sorteado por carregamento.
+
+``--concurrency`` usuários virtuais abrem as páginas em rodízio durante
+``--duration`` segundos (ou até ``--loads`` carregamentos). No fim sai,
+por página, o número de carregamentos e de requisições e os p50/p95/p99
+do carregamento inteiro e de cada requisição.
+
+Uso:
+    python mock_api.py --latency 50 --jitter 30 &
+    python load_test.py --concurrency 20 --duration 30
+    python load_test.py --mock --latency 50 /dashboard/courses   # sobe o mock no mesmo processo
+    python load_test.py --json > carga.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+from audit_fetching import audit_tree
+from codemod import FRONTEND_DIR
+from mock_api import API_PREFIX, DEFAULT_PORT, FIXTURES_PATH, TEXT_BYTES, Fixtures, MockApi
+
+DEFAULT_URL = f"http://127.0.0.1:{DEFAULT_PORT}{API_PREFIX}"
+BROWSER_CONNECTIONS = 6
+PERCENTILES = (50, 95, 99)
+
+# Parâmetro do caminho -> tipo de id das fixtures
+PARAM_RESOURCES = {
+    "courseId": "course", "teamId": "team", "userId": "user", "moduleId": "module", "modId": "module",
+    "lessonId": "lesson", "certificateId": "certificate",
+}
+# ``:id`` depois de ``/courses`` é um curso, e assim por diante
+SEGMENT_RESOURCES = {
+    "courses": "course", "teams": "team", "users": "user", "schedules": "schedule",
+    "announcements": "announcement",
+}
+
+
+class ConnectionPool:
+    """Conexões keep-alive de um usuário virtual (como as do navegador para um host)"""
+
+    def __init__(self, host, port, size=BROWSER_CONNECTIONS):
+        self.host = host
+        self.port = port
+        self.idle = []
+        self.slots = asyncio.Semaphore(size)
+
+    async def request(self, verb, target):
+        """``(status, corpo da resposta)``"""
+        async with self.slots:
+            reader, writer = self.idle.pop() if self.idle else await asyncio.open_connection(self.host, self.port)
+            try:
+                writer.write(f"{verb} {target} HTTP/1.1\r\nHost: {self.host}\r\n"
+                             "Accept: application/json\r\nContent-Length: 0\r\n\r\n".encode())
+                await writer.drain()
+                status = int((await reader.readline()).split()[1])
+                length = 0
+                keep_alive = True
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    name = name.strip().lower()
+                    if name == "content-length":
+                        length = int(value)
+                    elif name == "connection":
+                        keep_alive = value.strip().lower() != "close"
+                body = await reader.readexactly(length) if length else b""
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self.idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, body
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+def page_plan(route):
+    """Cadeias paralelas de etapas; cada etapa é uma lista de chamadas (lista de Endpoint) simultâneas"""
+    chains = {}
+    for audit in route.files:
+        if audit.path in route.lazy:
+            continue
+        for call in audit.mount_calls:
+            # chamada sem await nem Promise.all não segura as seguintes
+            key = (audit.path, call.context_start) if call.awaited or call.parallel else (audit.path, call.start)
+            stages = chains.setdefault(key, [])
+            if call.group is not None and stages and stages[-1][0] == call.group:
+                stages[-1][1].append(call.endpoints)
+            else:
+                stages.append((call.group, [call.endpoints]))
+    return [[calls for _, calls in stages] for stages in chains.values()]
+
+
+def plan_requests(plan):
+    return sum(len(endpoints) for chain in plan for calls in chain for endpoints in calls)
+
+
+class PageSample:
+    """Ids sorteados para um carregamento (o mesmo ``params.id`` em todas as chamadas)"""
+
+    def __init__(self, ids, rng):
+        course = rng.choice(ids["courses"])
+        module = rng.choice(course["modules"])
+        self.values = {
+            "course": course["_id"], "module": module["_id"], "lesson": rng.choice(module["lessons"]),
+            "team": rng.choice(ids["teams"]), "user": rng.choice(ids["users"]),
+            "schedule": rng.choice(ids["schedules"]), "announcement": rng.choice(ids["announcements"]),
+            "certificate": rng.choice(ids["certificates"]),
+        }
+
+    def fill(self, path):
+        segments = path.strip("/").split("/")
+        for n, segment in enumerate(segments):
+            if segment.startswith(":"):
+                name = segment[1:]
+                resource = PARAM_RESOURCES.get(name) or SEGMENT_RESOURCES.get(segments[n - 1] if n else "")
+                segments[n] = self.values.get(resource, name)
+        return "/" + "/".join(segments)
+
+
+class RouteStats:
+    """Tempos de uma rota (segundos)"""
+    __slots__ = ("route", "plan", "loads", "requests", "errors", "bytes")
+
+    def __init__(self, route, plan):
+        self.route = route
+        self.plan = plan
+        self.loads = []
+        self.requests = []
+        self.errors = 0
+        self.bytes = 0
+
+    def as_dict(self):
+        return {"route": self.route, "loads": len(self.loads), "requests": len(self.requests),
+                "requests_per_load": plan_requests(self.plan), "errors": self.errors, "bytes": self.bytes,
+                "load_ms": percentiles_ms(self.loads), "request_ms": percentiles_ms(self.requests)}
+
+
+def percentiles_ms(values):
+    if not values:
+        return {f"p{p}": None for p in PERCENTILES}
+    if len(values) == 1:
+        return {f"p{p}": round(values[0] * 1000, 2) for p in PERCENTILES}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{p}": round(cuts[p - 1] * 1000, 2) for p in PERCENTILES}
+
+
+class LoadTest:
+    """Usuários virtuais abrindo as páginas em rodízio"""
+
+    def __init__(self, url, stats, concurrency, duration, loads, seed=1):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.stats = stats
+        self.concurrency = concurrency
+        self.duration = duration
+        self.max_loads = loads
+        self.rng = random.Random(seed)
+        self.ids = None
+        self.started = 0
+        self.elapsed = 0.0
+
+    async def _call(self, pool, route_stats, sample, endpoints):
+        for endpoint in endpoints:
+            start = time.perf_counter()
+            try:
+                status, body = await pool.request(endpoint.verb.upper(), self.prefix + sample.fill(endpoint.path))
+            except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+                route_stats.errors += 1
+                continue
+            route_stats.requests.append(time.perf_counter() - start)
+            route_stats.bytes += len(body)
+            if status >= 400:
+                route_stats.errors += 1
+
+    async def _chain(self, pool, route_stats, sample, chain):
+        for calls in chain:
+            await asyncio.gather(*(self._call(pool, route_stats, sample, endpoints) for endpoints in calls))
+
+    async def _user(self, routes, deadline):
+        pool = ConnectionPool(self.host, self.port)
+        try:
+            while time.perf_counter() < deadline and (self.max_loads is None or self.started < self.max_loads):
+                self.started += 1
+                route_stats = next(routes)
+                sample = PageSample(self.ids, self.rng)
+                start = time.perf_counter()
+                await asyncio.gather(*(self._chain(pool, route_stats, sample, chain) for chain in route_stats.plan))
+                route_stats.loads.append(time.perf_counter() - start)
+        finally:
+            pool.close()
+
+    async def run(self):
+        pool = ConnectionPool(self.host, self.port, 1)
+        status, body = await pool.request("GET", self.prefix + FIXTURES_PATH)
+        pool.close()
+        if status != 200:
+            raise RuntimeError(f"{self.prefix}{FIXTURES_PATH} respondeu {status} (o servidor é o mock_api?)")
+        self.ids = json.loads(body)
+
+        routes = itertools.cycle([s for s in self.stats if s.plan])
+        start = time.perf_counter()
+        deadline = start + self.duration
+        await asyncio.gather(*(self._user(routes, deadline) for _ in range(self.concurrency)))
+        self.elapsed = time.perf_counter() - start
+
+
+async def run_with_mock(test, args):
+    fixtures = Fixtures(max(args.scale, 1), args.text_bytes, args.seed)
+    api = MockApi(fixtures, args.latency / 1000, args.jitter / 1000, args.per_kb / 1000, args.root, args.seed)
+    server = await asyncio.start_server(api.handle_connection, test.host, test.port)
+    async with server:
+        await test.run()
+
+
+def fmt(values):
+    return " / ".join("-" if v is None else f"{v:.1f}" for v in values.values())
+
+
+def print_stats(test):
+    total_requests = sum(len(s.requests) for s in test.stats)
+    total_loads = sum(len(s.loads) for s in test.stats)
+    print(f"{'rota':<34} {'cargas':>6} {'req':>7} {'req/c':>5} {'erros':>5}  "
+          f"{'carga p50/p95/p99 ms':>22}  {'req p50/p95/p99 ms':>20}")
+    for s in sorted(test.stats, key=lambda s: s.route):
+        if not s.plan:
+            print(f"{s.route:<34} {'-':>6} {'-':>7} {0:>5} {'-':>5}  (nenhuma requisição ao abrir)")
+            continue
+        d = s.as_dict()
+        print(f"{s.route:<34} {d['loads']:>6} {d['requests']:>7} {d['requests_per_load']:>5} {d['errors']:>5}  "
+              f"{fmt(d['load_ms']):>22}  {fmt(d['request_ms']):>20}")
+    all_requests = [v for s in test.stats for v in s.requests]
+    elapsed = test.elapsed or 1
+    print(f"\n📊 {total_loads} carregamento(s), {total_requests} requisição(ões) em {test.elapsed:.1f}s "
+          f"({total_requests / elapsed:.0f} req/s); requisições p50/p95/p99: {fmt(percentiles_ms(all_requests))} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("routes", nargs="*", help="prefixos de rota (padrão: todas)")
+    parser.add_argument("--url", default=DEFAULT_URL, help="base da API")
+    parser.add_argument("--concurrency", type=int, default=10, help="usuários virtuais")
+    parser.add_argument("--duration", type=float, default=10, help="segundos de carga")
+    parser.add_argument("--loads", type=int, help="para depois de N carregamentos")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--root", default=FRONTEND_DIR, help="raiz do frontend")
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    mock = parser.add_argument_group("mock no mesmo processo (--mock)")
+    mock.add_argument("--mock", action="store_true", help="sobe o mock_api no endereço de --url")
+    mock.add_argument("--latency", type=float, default=0, help="latência fixa (ms)")
+    mock.add_argument("--jitter", type=float, default=0, help="latência aleatória extra, até (ms)")
+    mock.add_argument("--per-kb", type=float, default=0, help="latência por KB de resposta (ms)")
+    mock.add_argument("--scale", type=int, default=1, help="multiplica o tamanho das listas")
+    mock.add_argument("--text-bytes", type=int, default=TEXT_BYTES, help="tamanho das descrições")
+    args = parser.parse_args()
+
+    _, _, routes = audit_tree(args.root)
+    stats = [RouteStats(r.route, page_plan(r)) for r in routes
+             if not args.routes or any(r.route.startswith(p) for p in args.routes)]
+    if not any(s.plan for s in stats):
+        print("❌ nenhuma rota com requisições ao abrir")
+        return 1
+
+    test = LoadTest(args.url, stats, max(args.concurrency, 1), args.duration, args.loads, args.seed)
+    try:
+        asyncio.run(run_with_mock(test, args) if args.mock else test.run())
+    except (OSError, RuntimeError) as e:
+        print(f"❌ {args.url}: {e}")
+        return 1
+
+    if args.json:
+        json.dump({"elapsed": round(test.elapsed, 3), "concurrency": test.concurrency,
+                   "routes": [s.as_dict() for s in stats]}, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_stats(test)
+    return 1 if any(s.errors for s in stats) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
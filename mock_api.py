@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""Backend falso (asyncio) com os endpoints usados por ``services/*.ts``
+
+Substitui o backend real em ``http://localhost:5000/api`` (o padrão de
+``NEXT_PUBLIC_API_URL`` em ``lib/api.ts``) para medir como o frontend
+carrega dados. As leituras respondem com fixtures no formato de
+``types/index.ts`` (``Course`` com ``Module``/``Lesson``, ``Progress``,
+``Team``, ``Schedule``, ``User``, ``Announcement``), geradas de forma
+determinística a partir da semente. As escritas dos serviços (lidas pelo
+audit_fetching) respondem ecoando o corpo, sem alterar as fixtures.
+
+Latência: ``--latency`` fixa + até ``--jitter`` aleatório + ``--per-kb``
+por KB de resposta. Tamanho: ``--scale`` multiplica as listas (usuários,
+cursos, aulas por módulo...) e ``--text-bytes`` define o tamanho das
+descrições. ``GET /api/__fixtures`` devolve os ids gerados (usado pelo
+load_test). Ao parar (Ctrl+C) mostra as requisições por endpoint.
+
+Uso:
+    python mock_api.py                            # porta 5000
+    python mock_api.py --latency 80 --jitter 40 --scale 4
+    NEXT_PUBLIC_API_URL=http://localhost:5000/api npm run dev
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from audit_fetching import load_services
+from codemod import FRONTEND_DIR
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5000
+API_PREFIX = "/api"
+FIXTURES_PATH = "/__fixtures"
+
+# Tamanhos com --scale 1
+USERS = 24
+TEAMS = 7
+COURSES = 6
+MODULES = 4
+LESSONS = 5
+QUESTIONS = 5
+SCHEDULES = 30
+ANNOUNCEMENTS = 12
+TEXT_BYTES = 200
+
+MAX_BODY = 10 * 1024 * 1024
+REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}
+CORS_HEADERS = (
+    "Access-Control-Allow-Origin: *\r\n"
+    "Access-Control-Allow-Headers: Authorization, Content-Type\r\n"
+    "Access-Control-Allow-Methods: GET, POST, PUT, PATCH, DELETE, OPTIONS\r\n"
+)
+
+WORDS = ("culto", "louvor", "diaconia", "serviço", "equipe", "acolhimento", "oração", "escala",
+         "comunhão", "ministério", "recepção", "cuidado", "igreja", "estudo", "liderança", "voluntário")
+DAYS = ("domingo", "segunda", "terça", "quarta", "quinta", "sexta", "sábado")
+SHIFTS = ("manhã", "tarde", "noite")
+LEVELS = ("iniciante", "intermediário", "avançado")
+PRIORITIES = ("baixa", "media", "alta", "urgente")
+EPOCH = 1_767_225_600  # 2026-01-01
+
+
+def object_id(kind, n):
+    """Id no formato do MongoDB, estável para (tipo, número)"""
+    return hashlib.md5(f"{kind}:{n}".encode()).hexdigest()[:24]
+
+
+def timestamp(seconds):
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(EPOCH + seconds))
+
+
+class Fixtures:
+    """Dados falsos no formato de ``types/index.ts``"""
+
+    def __init__(self, scale=1, text_bytes=TEXT_BYTES, seed=1):
+        self.rng = random.Random(seed)
+        self.text_bytes = text_bytes
+        self.users = [self._user(n) for n in range(USERS * scale)]
+        self.teams = [self._team(n) for n in range(TEAMS * scale)]
+        self.courses = [self._course(n, MODULES, LESSONS * scale) for n in range(COURSES * scale)]
+        self.progress = {c["_id"]: self._progress(n, c) for n, c in enumerate(self.courses)}
+        self.schedules = [self._schedule(n) for n in range(SCHEDULES * scale)]
+        self.announcements = [self._announcement(n) for n in range(ANNOUNCEMENTS * scale)]
+        self.certificates = {f"CERT-2026-{n:06d}": (self.users[n % len(self.users)], c)
+                             for n, c in enumerate(self.courses)}
+        self.by_id = {item["_id"]: item for items in (self.users, self.teams, self.courses,
+                                                       self.schedules, self.announcements)
+                      for item in items}
+
+    def text(self, size=None):
+        size = self.text_bytes if size is None else size
+        words = []
+        length = 0
+        while length < size:
+            word = self.rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words).capitalize()[:max(size, 1)]
+
+    def title(self):
+        return self.text(24).rstrip().title()
+
+    def _user(self, n):
+        role = "admin" if n == 0 else "professor" if n % 8 == 1 else "aluno"
+        return {"_id": object_id("user", n), "name": f"Pessoa {n + 1}", "email": f"pessoa{n + 1}@example.com",
+                "role": role, "phone": f"(11) 9{n:04d}-{n * 7 % 10000:04d}", "isActive": n % 11 != 10,
+                "team": object_id("team", n % TEAMS), "createdAt": timestamp(n * 3600)}
+
+    def _team(self, n):
+        members = [u for k, u in enumerate(self.users) if k % TEAMS == n % TEAMS][:8]
+        return {"_id": object_id("team", n), "name": f"Equipe {n + 1}", "dayOfWeek": DAYS[n % len(DAYS)],
+                "shift": SHIFTS[n % len(SHIFTS)], "teamNumber": n + 1, "description": self.text(),
+                "color": f"#{self.rng.randrange(0x1000000):06x}", "members": members, "isActive": True,
+                "createdAt": timestamp(n * 86400), "updatedAt": timestamp(n * 86400 + 3600)}
+
+    def _lesson(self, course, module, n):
+        return {"_id": object_id("lesson", f"{course}.{module}.{n}"), "title": self.title(),
+                "description": self.text(), "content": self.text(self.text_bytes * 4),
+                "videoUrl": f"https://videos.example.com/{course}/{module}/{n}.mp4",
+                "videoDuration": 300 + 60 * n, "order": n, "resources": [], "isPreview": n == 0,
+                "quiz": [self._question(k) for k in range(QUESTIONS)]}
+
+    def _question(self, n):
+        return {"question": self.text(60), "order": n,
+                "options": [{"text": self.text(30), "isCorrect": k == 0} for k in range(4)]}
+
+    def _course(self, n, modules, lessons):
+        return {"_id": object_id("course", n), "title": self.title(), "description": self.text(),
+                "thumbnail": f"https://images.example.com/course-{n}.jpg",
+                "instructor": self.users[1 % len(self.users)], "category": self.rng.choice(WORDS),
+                "status": "published" if n % 5 else "draft", "isActive": True,
+                "modules": [{"_id": object_id("module", f"{n}.{m}"), "title": self.title(),
+                             "description": self.text(), "order": m,
+                             "lessons": [self._lesson(n, m, k) for k in range(lessons)]}
+                            for m in range(modules)],
+                "enrolledStudents": [u["_id"] for u in self.users[2::3]],
+                "enrolledCount": len(self.users[2::3]), "duration": modules * lessons * 10,
+                "totalLessons": modules * lessons, "level": LEVELS[n % len(LEVELS)],
+                "certificateEnabled": True, "createdAt": timestamp(n * 7 * 86400)}
+
+    def _progress(self, n, course):
+        lessons = [(m, lesson) for m in course["modules"] for lesson in m["lessons"]]
+        done = lessons[:len(lessons) * (n % 4) // 3]
+        return {"_id": object_id("progress", n), "userId": self.users[0]["_id"], "courseId": course["_id"],
+                "enrolledAt": timestamp(n * 86400), "lastAccessedAt": timestamp(n * 86400 + 7200),
+                "completedLessons": [{"lessonId": lesson["_id"], "moduleId": m["_id"], "completed": True,
+                                      "completedAt": timestamp(n * 86400 + k * 600),
+                                      "watchedDuration": lesson["videoDuration"], "quizCompleted": True,
+                                      "quizScore": 80 + k % 3 * 10, "quizPassed": True, "quizAttempts": 1}
+                                     for k, (m, lesson) in enumerate(done)],
+                "progress": round(100 * len(done) / max(len(lessons), 1)), "completed": len(done) == len(lessons),
+                "certificateIssued": False}
+
+    def _schedule(self, n):
+        return {"_id": object_id("schedule", n), "title": f"Escala {n + 1}", "description": self.text(),
+                "date": timestamp(n * 86400)[:10], "time": "09:00", "location": "Templo",
+                "assignedTo": self.users[n % len(self.users)], "isConfirmed": n % 3 == 0,
+                "createdAt": timestamp(n * 3600)}
+
+    def _announcement(self, n):
+        return {"_id": object_id("announcement", n), "title": self.title(), "content": self.text(),
+                "author": self.users[0], "priority": PRIORITIES[n % len(PRIORITIES)], "attachments": [],
+                "isActive": True, "isPinned": n < 2, "viewedBy": [], "viewsCount": n * 3,
+                "createdAt": timestamp(n * 3600)}
+
+    def ids(self):
+        """Ids gerados, para montar URLs (``GET /api/__fixtures``)"""
+        return {
+            "courses": [{"_id": c["_id"], "modules": [{"_id": m["_id"], "lessons": [lesson["_id"] for lesson in m["lessons"]]}
+                                                      for m in c["modules"]]} for c in self.courses],
+            "teams": [t["_id"] for t in self.teams],
+            "users": [u["_id"] for u in self.users],
+            "schedules": [s["_id"] for s in self.schedules],
+            "announcements": [a["_id"] for a in self.announcements],
+            "certificates": list(self.certificates),
+        }
+
+
+def ok(data, **extra):
+    return 200, dict(success=True, data=data, **extra)
+
+
+def not_found(what):
+    return 404, {"success": False, "message": f"{what} não encontrado"}
+
+
+def bad_request(message):
+    return 400, {"success": False, "message": message}
+
+
+def query_int(query, name, default):
+    """Inteiro positivo da query string; valores inválidos ou menores que 1 viram ``default``"""
+    try:
+        value = int(query.get(name, default))
+    except ValueError:
+        return default
+    return value if value >= 1 else default
+
+
+class Route:
+    """Padrão de caminho (``/courses/:id``) e o handler que o atende"""
+    __slots__ = ("verb", "pattern", "segments", "handler")
+
+    def __init__(self, verb, pattern, handler):
+        self.verb = verb
+        self.pattern = pattern
+        self.segments = pattern.strip("/").split("/")
+        self.handler = handler
+
+    @property
+    def literals(self):
+        return sum(1 for s in self.segments if not s.startswith(":"))
+
+    def match(self, segments):
+        if len(segments) != len(self.segments):
+            return None
+        params = {}
+        for expected, actual in zip(self.segments, segments):
+            if expected.startswith(":"):
+                params[expected[1:]] = actual
+            elif expected != actual:
+                return None
+        return params
+
+
+class MockApi:
+    """Roteamento e handlers; ``serve`` sobe o servidor HTTP"""
+
+    def __init__(self, fixtures, latency=0.0, jitter=0.0, per_kb=0.0, root=FRONTEND_DIR, seed=1):
+        self.fixtures = fixtures
+        self.latency = latency      # segundos
+        self.jitter = jitter
+        self.per_kb = per_kb
+        self.rng = random.Random(seed)
+        self.routes = []
+        self.counts = {}            # (verbo, padrão) -> requisições
+        self._encoded = {}          # respostas de leitura já serializadas
+        self._register_reads()
+        self.missing = self._register_writes(root)
+
+    # -- rotas ---------------------------------------------------------------
+
+    def route(self, verb, pattern, handler):
+        self.routes.append(Route(verb, pattern, handler))
+        # caminhos mais literais primeiro: /users/stats antes de /users/:id
+        self.routes.sort(key=lambda r: -r.literals)
+
+    def _register_reads(self):
+        f = self.fixtures
+        self.route("GET", "/courses", self.list_courses)
+        self.route("GET", "/courses/:id", lambda p, q, b: self._find(p["id"], "Curso", lambda c: {"course": c}))
+        self.route("GET", "/progress/:courseId", self.course_progress)
+        self.route("GET", "/progress/:courseId/modules/:moduleId/lessons/:lessonId/access",
+                   lambda p, q, b: ok({"unlocked": True}))
+        self.route("GET", "/quiz/:courseId/:modId/:lessonId/questions", self.quiz_questions)
+        self.route("GET", "/quiz/:courseId/:lessonId/attempts", lambda p, q, b: ok([]))
+        self.route("GET", "/quiz/:courseId/:lessonId/best", lambda p, q, b: ok(None))
+        self.route("GET", "/teams", lambda p, q, b: ok(f.teams))
+        self.route("GET", "/teams/:id", lambda p, q, b: self._find(p["id"], "Equipe"))
+        self.route("GET", "/users", lambda p, q, b: ok(f.users))
+        self.route("GET", "/users/:id", lambda p, q, b: self._find(p["id"], "Usuário"))
+        self.route("GET", "/users/stats", self.user_stats)
+        self.route("GET", "/auth/me", lambda p, q, b: ok(f.users[0]))
+        self.route("GET", "/schedules", lambda p, q, b: ok(f.schedules))
+        self.route("GET", "/announcements", lambda p, q, b: ok(f.announcements))
+        self.route("GET", "/certificates/verify/:certificateId", self.verify_certificate)
+        self.route("GET", FIXTURES_PATH, lambda p, q, b: (200, f.ids()))
+
+    def _register_writes(self, root):
+        """Escritas dos serviços respondem ecoando o corpo; devolve as leituras sem fixture"""
+        known = {(r.verb, r.pattern) for r in self.routes}
+        services, _ = load_services(root)
+        missing = []
+        for methods in services.values():
+            for endpoints in methods.values():
+                for endpoint in endpoints:
+                    verb = endpoint.verb.upper()
+                    if (verb, endpoint.path) in known or not endpoint.path.startswith("/"):
+                        continue
+                    known.add((verb, endpoint.path))
+                    if endpoint.read:
+                        missing.append(str(endpoint))
+                    else:
+                        self.route(verb, endpoint.path, self.echo)
+        return missing
+
+    def resolve(self, verb, path):
+        segments = path.strip("/").split("/")
+        for route in self.routes:
+            if route.verb == verb:
+                params = route.match(segments)
+                if params is not None:
+                    return route, params
+        return None, None
+
+    # -- handlers ------------------------------------------------------------
+
+    def _find(self, item_id, what, wrap=None):
+        item = self.fixtures.by_id.get(item_id)
+        if item is None:
+            return not_found(what)
+        return ok(wrap(item) if wrap else item)
+
+    def list_courses(self, params, query, body):
+        courses = self.fixtures.courses
+        page = query_int(query, "page", 1)
+        limit = query_int(query, "limit", 10)
+        chunk = courses[(page - 1) * limit:page * limit]
+        return ok(chunk, pagination={"page": page, "limit": limit, "total": len(courses),
+                                     "pages": -(-len(courses) // limit)})
+
+    def course_progress(self, params, query, body):
+        progress = self.fixtures.progress.get(params["courseId"])
+        return ok(progress) if progress is not None else not_found("Progresso")
+
+    def quiz_questions(self, params, query, body):
+        course = self.fixtures.by_id.get(params["courseId"])
+        for module in (course or {}).get("modules", []):
+            for lesson in module["lessons"]:
+                if lesson["_id"] == params["lessonId"]:
+                    questions = [{"question": q["question"], "order": q["order"],
+                                  "options": [{"text": o["text"]} for o in q["options"]]}
+                                 for q in lesson["quiz"]]
+                    return 200, {"success": True, "questions": questions}
+        return not_found("Questionário")
+
+    def user_stats(self, params, query, body):
+        users = self.fixtures.users
+        return ok({"totalUsers": len(users), "totalAdmins": sum(u["role"] == "admin" for u in users),
+                   "totalStudents": sum(u["role"] == "aluno" for u in users),
+                   "activeUsers": sum(u["isActive"] for u in users)})
+
+    def verify_certificate(self, params, query, body):
+        found = self.fixtures.certificates.get(params["certificateId"])
+        if found is None:
+            return not_found("Certificado")
+        user, course = found
+        return ok({"studentName": user["name"], "studentEmail": user["email"], "courseName": course["title"],
+                   "courseCategory": course["category"], "completedAt": timestamp(30 * 86400),
+                   "certificateId": params["certificateId"], "valid": True})
+
+    def echo(self, params, query, body):
+        data = dict(body) if isinstance(body, dict) else {}
+        data.setdefault("_id", params.get("id") or object_id("new", self.rng.random()))
+        return ok(data)
+
+    # -- HTTP ----------------------------------------------------------------
+
+    def respond(self, verb, target, body):
+        """``(status, bytes do JSON)`` de uma requisição"""
+        url = urlsplit(target)
+        if not url.path.startswith(API_PREFIX):
+            return 404, json.dumps({"success": False, "message": "fora de /api"}).encode()
+        path = url.path[len(API_PREFIX):] or "/"
+        route, params = self.resolve(verb, path)
+        key = (verb, route.pattern if route else "?" + path)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if route is None:
+            status, data = not_found(f"{verb} {path}")
+            return status, json.dumps(data, ensure_ascii=False).encode()
+        if verb == "GET" and target in self._encoded:
+            return self._encoded[target]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return 400, json.dumps({"success": False, "message": "JSON inválido"}).encode()
+        try:
+            status, data = route.handler(params, query, payload)
+        except (ValueError, KeyError) as e:
+            status, data = bad_request(f"requisição inválida: {e}")
+        encoded = status, json.dumps(data, ensure_ascii=False).encode()
+        if verb == "GET" and status == 200:
+            self._encoded[target] = encoded
+        return encoded
+
+    def delay(self, size):
+        return self.latency + self.rng.uniform(0, self.jitter) + self.per_kb * size / 1024
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    verb, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    status, payload = 400, b'{"success":false}'
+                    body = b""
+                elif length > MAX_BODY:
+                    status, payload = 413, b'{"success":false}'
+                    body = b""
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    if verb == "OPTIONS":
+                        status, payload = 204, b""
+                    else:
+                        status, payload = self.respond(verb, target, body)
+                        await asyncio.sleep(self.delay(len(payload)))
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write((f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+                              "Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(payload)}\r\n"
+                              f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                              f"{CORS_HEADERS}\r\n").encode() + payload)
+                await writer.drain()
+                if not keep_alive or length < 0 or status == 413:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def print_counts(api):
+    total = sum(api.counts.values())
+    print(f"\n📊 {total} requisição(ões)")
+    for (verb, pattern), count in sorted(api.counts.items(), key=lambda item: -item[1]):
+        print(f"   {count:6d}  {verb} {pattern}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0, help="latência fixa por resposta (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="latência aleatória extra, até (ms)")
+    parser.add_argument("--per-kb", type=float, default=0, help="latência por KB de resposta (ms)")
+    parser.add_argument("--scale", type=int, default=1, help="multiplica o tamanho das listas")
+    parser.add_argument("--text-bytes", type=int, default=TEXT_BYTES, help="tamanho das descrições")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--root", default=FRONTEND_DIR, help="raiz do frontend (para ler services/)")
+    args = parser.parse_args()
+
+    fixtures = Fixtures(max(args.scale, 1), args.text_bytes, args.seed)
+    api = MockApi(fixtures, args.latency / 1000, args.jitter / 1000, args.per_kb / 1000, args.root, args.seed)
+    for endpoint in api.missing:
+        print(f"⚠️  {endpoint}: leitura sem fixture (responde 404)")
+    print(f"🚀 http://{args.host}:{args.port}{API_PREFIX}  ({len(api.routes)} rota(s), "
+          f"{len(fixtures.courses)} curso(s), {len(fixtures.users)} usuário(s); "
+          f"latência {args.latency:g}+{args.jitter:g} ms)")
+    try:
+        asyncio.run(api.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print_counts(api)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Manifesto em disco dos patches já aplicados, indexado pelo hash do conteúdo
+
+Para cada arquivo guarda o sha256 do conteúdo final, o mtime/tamanho e a
+versão + status de cada passo. Se o arquivo e as versões dos passos não
+mudaram desde a última execução, o resultado é reaproveitado sem rodar os
+patches (e, quando o stat bate, sem nem ler o arquivo).
+"""
+import json
+import os
+
+from codemod import FRONTEND_DIR, NOT_FOUND, UNCHANGED, FileResult, content_digest
+
+CACHE_FILE = ".codemod-cache.json"
+CACHE_FORMAT = 1
+
+
+class PatchCache:
+    """Manifesto ``caminho -> {sha256, mtime_ns, size, steps: {nome: [versão, status]}}``"""
+
+    def __init__(self, root=FRONTEND_DIR, filename=CACHE_FILE):
+        self.path = os.path.join(root, filename)
+        self.files = {}
+        self.dirty = False
+        self.hits = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") == CACHE_FORMAT:
+            self.files = data.get("files", {})
+
+    def save(self):
+        """Grava o manifesto de forma atômica (arquivo temporário + rename)"""
+        if not self.dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": CACHE_FORMAT, "files": self.files}, f,
+                      ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def lookup(self, path, rel_path, steps):
+        """Devolve o ``FileResult`` guardado se arquivo e passos não mudaram, senão ``None``"""
+        entry = self.files.get(rel_path)
+        if not entry:
+            return None
+        recorded = entry["steps"]
+        if len(recorded) != len(steps) or any(
+                recorded.get(s.name, [None])[0] != s.version for s in steps):
+            return None
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (entry["mtime_ns"], entry["size"]):
+            # Arquivo tocado: confere o conteúdo antes de invalidar
+            with open(path, "rb") as f:
+                if content_digest(f.read()) != entry["sha256"]:
+                    return None
+            entry["mtime_ns"], entry["size"] = st.st_mtime_ns, st.st_size
+            self.dirty = True
+
+        self.hits += 1
+        # Passos aplicados antes viram "sem alterações"; os não encontrados continuam assim
+        statuses = [(s.name, NOT_FOUND if recorded[s.name][1] == NOT_FOUND else UNCHANGED)
+                    for s in steps]
+        return FileResult(path, statuses, False, entry["sha256"])
+
+    def record(self, result, rel_path, steps):
+        """Registra o resultado de um arquivo que acabou de ser processado (e gravado)"""
+        try:
+            st = os.stat(result.path)
+        except OSError:
+            self.forget(rel_path)
+            return
+        versions = {s.name: s.version for s in steps}
+        self.files[rel_path] = {
+            "sha256": result.digest,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "steps": {name: [versions[name], status] for name, status in result.steps},
+        }
+        self.dirty = True
+
+    def forget(self, rel_path):
+        if self.files.pop(rel_path, None) is not None:
+            self.dirty = True
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Aplica o conjunto de patches em paralelo a todos os .tsx de app/ e components/
+
+Com --dry-run nada é gravado: o diff unificado de cada arquivo é impresso
+assim que o arquivo é processado (--summary mostra só as contagens de hunks).
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import profiling
+from codemod import (
+    CHANGED, FRONTEND_DIR, NOT_FOUND, STATUS_LABELS, UNCHANGED,
+    Transaction, compute_file, discover_files, load_patches, preview_file, steps_for,
+    to_rel_path,
+)
+from patch_cache import PatchCache
+
+# Passos carregados uma vez por processo do pool
+_worker_steps = None
+
+
+def _init_worker(step_names):
+    global _worker_steps
+    _worker_steps = load_patches(step_names)
+
+
+# Modos de execução
+WRITE = "write"
+DIFF = "diff"
+SUMMARY = "summary"
+
+
+def _patch_worker(job):
+    path, root, mode = job
+    rel_path = to_rel_path(path, root)
+    steps = steps_for(rel_path, _worker_steps)
+    if mode == WRITE:
+        # só calcula; a gravação em lote acontece no processo principal
+        return compute_file(path, steps)
+    return preview_file(path, steps, rel_path, summary=(mode == SUMMARY))
+
+
+def run_parallel(root=FRONTEND_DIR, step_names=None, jobs=None, mode=WRITE, cache=None,
+                 on_result=None):
+    """Descobre os arquivos, distribui entre os processos e devolve os resultados.
+
+    Arquivos que o ``cache`` reconhece como já processados nem chegam ao pool.
+    Os processos só calculam o conteúdo novo; a gravação é uma única
+    ``Transaction`` no final (tudo ou nada). ``on_result`` é chamado para cada arquivo assim que o resultado chega (na
+    ordem dos arquivos), o que permite imprimir diffs em streaming.
+    """
+    steps = load_patches(step_names)
+    write = mode == WRITE
+    results = []
+    work = []
+    for path in discover_files(root):
+        rel_path = to_rel_path(path, root)
+        file_steps = steps_for(rel_path, steps)
+        if not file_steps:
+            continue
+        cached = cache.lookup(path, rel_path, file_steps) if cache else None
+        if cached:
+            results.append(cached)
+            if on_result:
+                on_result(cached)
+        else:
+            work.append((path, root, mode))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(work) <= 1:
+        _init_worker(step_names)
+        patched = map(_patch_worker, work)
+        pool = None
+    else:
+        chunksize = max(1, len(work) // (jobs * 4))
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=(step_names,))
+        patched = pool.map(_patch_worker, work, chunksize=chunksize)
+
+    transaction = Transaction()
+    computed = []
+    try:
+        for result in patched:
+            if result.content is not None:
+                transaction.stage(result.path, result.content)
+                result.content = None
+            if on_result:
+                on_result(result)
+            # o diff já foi entregue; não fica acumulado na lista
+            result.diff = ""
+            computed.append(result)
+    finally:
+        if pool:
+            pool.shutdown()
+    if write:
+        transaction.commit()
+        if cache:
+            for result in computed:
+                rel_path = to_rel_path(result.path, root)
+                cache.record(result, rel_path, steps_for(rel_path, steps))
+            cache.save()
+    return results + computed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("steps", nargs="*", help="passos a aplicar (padrão: todos)")
+    parser.add_argument("--root", default=FRONTEND_DIR, help="raiz do frontend")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="número de processos (padrão: núcleos da máquina)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="mostra o status de cada passo")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignora o manifesto de patches já aplicados")
+    parser.add_argument("-n", "--dry-run", action="store_true",
+                        help="não grava nada; imprime o diff unificado de cada arquivo")
+    parser.add_argument("--summary", action="store_true",
+                        help="com --dry-run, mostra só as contagens de hunks por arquivo")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    if profiling.wants_profiling(args):
+        # a medição só enxerga o processo atual
+        args.jobs = 1
+
+    mode = (SUMMARY if args.summary else DIFF) if args.dry_run else WRITE
+    counts = {CHANGED: 0, UNCHANGED: 0, NOT_FOUND: 0}
+
+    def report(result):
+        counts[result.status] += 1
+        rel_path = to_rel_path(result.path, args.root)
+        if mode == DIFF:
+            # diff vai para stdout (pode ser redirecionado para um .patch); status para stderr
+            sys.stdout.write(result.diff)
+            sys.stdout.flush()
+            if result.status == NOT_FOUND:
+                print(f"{STATUS_LABELS[NOT_FOUND]}: {rel_path}", file=sys.stderr)
+            return
+        label = STATUS_LABELS[result.status]
+        if mode == SUMMARY and result.changed:
+            label += f" ({result.hunks} hunk(s), +{result.added} -{result.removed})"
+        print(f"{label}: {rel_path}")
+        if args.verbose or result.status == NOT_FOUND:
+            for name, status in result.steps:
+                if args.verbose or status == NOT_FOUND:
+                    print(f"   - {name}: {STATUS_LABELS[status]}")
+
+    out = sys.stderr if mode == DIFF else sys.stdout
+    print("🔍 Prévia dos patches (nada será gravado)...\n" if args.dry_run
+          else "🚀 Aplicando patches em paralelo...\n", file=out)
+    cache = None if args.no_cache else PatchCache(args.root)
+    try:
+        with profiling.from_args(args, out):
+            results = run_parallel(args.root, args.steps or None, args.jobs, mode, cache, report)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}", file=sys.stderr)
+        return 1
+
+    verb = "seria(m) alterado(s)" if args.dry_run else "alterado(s)"
+    print(f"\n📊 {len(results)} arquivo(s): {counts[CHANGED]} {verb}, "
+          f"{counts[UNCHANGED]} sem alterações, {counts[NOT_FOUND]} com padrão não encontrado",
+          file=out)
+    if cache and cache.hits:
+        print(f"⚡ {cache.hits} arquivo(s) reaproveitado(s) do cache", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
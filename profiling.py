@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""Instrumentação dos passos de patch, das regexes e dos verificadores
+
+Desligada por padrão (custo de uma chamada de função por trecho medido).
+Quando ligada, cada trecho registra tempo de parede, bytes percorridos e
+número de casamentos; as regexes de módulo (``*_RE``) podem ser trocadas
+por versões que contam chamadas. Também gera relatório cProfile/pstats e
+pilhas colapsadas (formato do flamegraph.pl / speedscope).
+
+Uso nos scripts:
+    profiling.add_arguments(parser)
+    ...
+    with profiling.from_args(args):
+        trabalho()
+
+Uso no código medido:
+    with profiling.span("step:" + name, len(content)) as span:
+        ...
+        span.matches += 1
+"""
+import contextlib
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+_active = None
+
+
+class Stat:
+    """Totais de um nome medido"""
+    __slots__ = ("calls", "seconds", "size", "matches")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.size = 0
+        self.matches = 0
+
+
+class Span:
+    """Trecho medido; ``size`` são os bytes percorridos e ``matches`` os casamentos"""
+    __slots__ = ("profiler", "name", "size", "matches", "_start")
+
+    def __init__(self, profiler, name, size=0):
+        self.profiler = profiler
+        self.name = name
+        self.size = size
+        self.matches = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter() - self._start, self.size, self.matches)
+        return False
+
+
+class _NullSpan:
+    """Trecho que não mede nada (instrumentação desligada)"""
+    __slots__ = ()
+
+    size = 0
+    matches = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Acumula os totais por nome (``step:...``, ``re:...``, ``check:...``)"""
+
+    def __init__(self):
+        self.stats = {}
+
+    def span(self, name, size=0):
+        return Span(self, name, size)
+
+    def record(self, name, seconds, size=0, matches=0):
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = Stat()
+        stat.calls += 1
+        stat.seconds += seconds
+        stat.size += size
+        stat.matches += matches
+
+    def report(self, out=None, limit=None):
+        """Tabela ordenada pelo tempo total (tempos incluem os trechos aninhados)"""
+        out = out or sys.stderr
+        rows = sorted(self.stats.items(), key=lambda item: item[1].seconds, reverse=True)
+        if limit:
+            rows = rows[:limit]
+        print(f"\n⏱️  {'trecho':<44} {'chamadas':>9} {'total ms':>10} {'média ms':>9} "
+              f"{'MB lidos':>9} {'MB/s':>8} {'casamentos':>10}", file=out)
+        for name, stat in rows:
+            mb = stat.size / 1e6
+            rate = f"{mb / stat.seconds:8.1f}" if stat.size and stat.seconds else f"{'-':>8}"
+            print(f"   {name:<44} {stat.calls:>9} {stat.seconds * 1000:>10.2f} "
+                  f"{stat.seconds * 1000 / stat.calls:>9.3f} {mb:>9.2f} {rate} {stat.matches:>10}",
+                  file=out)
+
+    def as_dict(self):
+        return {name: {"calls": s.calls, "seconds": s.seconds, "bytes": s.size, "matches": s.matches}
+                for name, s in self.stats.items()}
+
+
+def active():
+    """Profiler ligado no momento (ou ``None``)"""
+    return _active
+
+
+def span(name, size=0):
+    """Mede um trecho se a instrumentação estiver ligada"""
+    if _active is None:
+        return NULL_SPAN
+    return Span(_active, name, size)
+
+
+def enable(profiler=None):
+    global _active
+    _active = profiler or Profiler()
+    return _active
+
+
+def disable():
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+# ---------------------------------------------------------------------------
+# Regexes
+# ---------------------------------------------------------------------------
+
+class CountingPattern:
+    """Envolve um ``re.Pattern`` registrando tempo, bytes e casamentos de cada chamada"""
+
+    def __init__(self, pattern, name):
+        self.pattern = pattern
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(self.pattern, attr)
+
+    def _record(self, start, size, matches):
+        if _active is not None:
+            _active.record(self.name, time.perf_counter() - start, size, matches)
+
+    def _anchored(self, method, string, pos, endpos):
+        start = time.perf_counter()
+        m = method(string, pos, endpos)
+        self._record(start, (m.end() - pos) if m else 0, 1 if m else 0)
+        return m
+
+    def match(self, string, pos=0, endpos=sys.maxsize):
+        return self._anchored(self.pattern.match, string, pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=sys.maxsize):
+        return self._anchored(self.pattern.fullmatch, string, pos, endpos)
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        start = time.perf_counter()
+        m = self.pattern.search(string, pos, endpos)
+        self._record(start, (m.end() if m else min(endpos, len(string))) - pos, 1 if m else 0)
+        return m
+
+    def subn(self, repl, string, count=0):
+        start = time.perf_counter()
+        result = self.pattern.subn(repl, string, count)
+        self._record(start, len(string), result[1])
+        return result
+
+    def sub(self, repl, string, count=0):
+        return self.subn(repl, string, count)[0]
+
+    def findall(self, string, pos=0, endpos=sys.maxsize):
+        start = time.perf_counter()
+        found = self.pattern.findall(string, pos, endpos)
+        self._record(start, min(endpos, len(string)) - pos, len(found))
+        return found
+
+    def finditer(self, string, pos=0, endpos=sys.maxsize):
+        start = time.perf_counter()
+        found = list(self.pattern.finditer(string, pos, endpos))
+        self._record(start, min(endpos, len(string)) - pos, len(found))
+        return iter(found)
+
+    def split(self, string, maxsplit=0):
+        start = time.perf_counter()
+        parts = self.pattern.split(string, maxsplit)
+        self._record(start, len(string), len(parts) - 1)
+        return parts
+
+
+def instrument_regexes(*modules):
+    """Troca as regexes de módulo por ``CountingPattern``; devolve a função que desfaz"""
+    replaced = []
+    for module in modules:
+        for attr, value in list(vars(module).items()):
+            if isinstance(value, re.Pattern):
+                setattr(module, attr, CountingPattern(value, f"re:{module.__name__}.{attr}"))
+                replaced.append((module, attr, value))
+
+    def restore():
+        for module, attr, value in replaced:
+            setattr(module, attr, value)
+    return restore
+
+
+# ---------------------------------------------------------------------------
+# Pilhas colapsadas
+# ---------------------------------------------------------------------------
+
+class StackSampler:
+    """Amostra a pilha da thread principal a cada ``interval`` segundos.
+
+    Grava no formato colapsado (``a;b;c contagem``) aceito pelo
+    flamegraph.pl, speedscope e inferno.
+    """
+
+    def __init__(self, interval=0.002):
+        self.interval = interval
+        self.counts = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+
+# ---------------------------------------------------------------------------
+# Integração com os scripts
+# ---------------------------------------------------------------------------
+
+def add_arguments(parser):
+    """Opções --timings/--profile/--collapsed comuns aos scripts"""
+    group = parser.add_argument_group("medição")
+    group.add_argument("--timings", action="store_true",
+                       help="mostra tempo, bytes e casamentos por passo/regex/verificador")
+    group.add_argument("--profile", metavar="ARQ", help="grava o relatório cProfile (pstats)")
+    group.add_argument("--collapsed", metavar="ARQ",
+                       help="grava pilhas colapsadas para flamegraph")
+    return group
+
+
+def wants_profiling(args):
+    return bool(args.timings or args.profile or args.collapsed)
+
+
+@contextlib.contextmanager
+def from_args(args, out=None):
+    """Liga o que foi pedido na linha de comando durante o bloco e grava/imprime no final"""
+    if not wants_profiling(args):
+        yield None
+        return
+
+    import anchors
+    import tsx_lexer
+
+    profiler = enable()
+    restore = instrument_regexes(tsx_lexer, anchors)
+    profile = cProfile.Profile() if args.profile else None
+    sampler = StackSampler() if args.collapsed else None
+    if sampler:
+        sampler.start()
+    if profile:
+        profile.enable()
+    try:
+        yield profiler
+    finally:
+        if profile:
+            profile.disable()
+        if sampler:
+            sampler.stop()
+        restore()
+        disable()
+        out = out or sys.stderr
+        if args.timings:
+            profiler.report(out)
+        if profile:
+            profile.dump_stats(args.profile)
+            print(f"💾 cProfile em {args.profile} (python -m pstats {args.profile})", file=out)
+        if sampler:
+            sampler.write(args.collapsed)
+            print(f"💾 {sum(sampler.counts.values())} amostra(s) de pilha em {args.collapsed}",
+                  file=out)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""Passos de patch do sistema de questionário (antes espalhados em scripts avulsos)
+
+A ordem de registro é a ordem de aplicação: todos os passos de um arquivo
+rodam sobre o mesmo buffer em memória, com uma leitura e uma escrita.
+"""
+from anchors import insert_at_anchor
+from codemod import patch
+from lazy_imports import has_component_import, make_lazy
+from replace_reload import replace_reloads
+from schedule_config import SCHEDULE_PAGE
+
+EDIT_PAGE = "app/dashboard/courses/[id]/edit/page.tsx"
+VIEW_PAGE = "app/dashboard/courses/[id]/page.tsx"
+
+QUIZ_EDITOR_MODULE = "@/components/QuizEditor"
+QUIZ_PLAYER_MODULE = "@/components/QuizPlayer"
+
+
+def replace_once(content, old, new, marker=None):
+    """Troca a primeira ocorrência de ``old`` por ``new``.
+
+    Devolve o conteúdo intacto se ``marker`` (por padrão ``new``) já existe
+    e ``None`` se ``old`` não foi encontrado.
+    """
+    if (new if marker is None else marker) in content:
+        return content
+    if old not in content:
+        return None
+    return content.replace(old, new, 1)
+
+
+# ---------------------------------------------------------------------------
+# Página de edição (fix_edit_page.py / add_quiz_editor_jsx.py)
+# ---------------------------------------------------------------------------
+
+@patch("edit_import_quiz_editor", EDIT_PAGE, version=3)
+def edit_import_quiz_editor(content):
+    """Adiciona import do QuizEditor"""
+    if has_component_import(content, "QuizEditor", QUIZ_EDITOR_MODULE):
+        return content
+    quiz_import = f"\nimport QuizEditor from '{QUIZ_EDITOR_MODULE}';"
+    return insert_at_anchor(content, "after_last_import", quiz_import)
+
+
+@patch("edit_lesson_quiz_type", EDIT_PAGE)
+def edit_lesson_quiz_type(content):
+    """Adiciona quiz no tipo do formData lessons"""
+    fields = 'title: string; description: string; videoUrl: string; duration: number; order: number'
+    return replace_once(content, fields, fields + '; quiz?: any[]')
+
+
+@patch("edit_lesson_quiz_mapping", EDIT_PAGE)
+def edit_lesson_quiz_mapping(content):
+    """Adiciona quiz no mapeamento de lessons"""
+    return replace_once(
+        content,
+        'order: lesson.order || 0,',
+        'order: lesson.order || 0,\n          quiz: lesson.quiz || [],',
+        marker='quiz: lesson.quiz',
+    )
+
+
+QUIZ_EDITOR_JSX = '''
+
+                    <div>
+                      <label className="block text-sm font-medium text-gray-700 mb-2">
+                        Questionário (5 perguntas obrigatórias)
+                      </label>
+                      <QuizEditor
+                        quiz={lesson.quiz || []}
+                        onChange={(quiz) => {
+                          const newLessons = [...formData.lessons];
+                          newLessons[index] = {
+                            ...lesson,
+                            quiz: quiz
+                          };
+                          setFormData({ ...formData, lessons: newLessons });
+                        }}
+                      />
+                    </div>'''
+
+
+@patch("edit_quiz_editor_jsx", EDIT_PAGE, version=2)
+def edit_quiz_editor_jsx(content):
+    """Adiciona o QuizEditor após o campo de duração"""
+    if '<QuizEditor' in content:
+        return content
+    return insert_at_anchor(content, "after_duration_field", QUIZ_EDITOR_JSX)
+
+
+# ---------------------------------------------------------------------------
+# Página de visualização (integrate_properly.py / integrate_quiz.py)
+# ---------------------------------------------------------------------------
+
+@patch("view_use_memo_import", VIEW_PAGE)
+def view_use_memo_import(content):
+    """Adiciona useMemo no import do React"""
+    return replace_once(
+        content,
+        "import { useState, useEffect } from 'react';",
+        "import { useState, useEffect, useMemo } from 'react';",
+    )
+
+
+@patch("view_import_quiz_player", VIEW_PAGE, version=2)
+def view_import_quiz_player(content):
+    """Adiciona import do QuizPlayer"""
+    if has_component_import(content, "QuizPlayer", QUIZ_PLAYER_MODULE):
+        return content
+    types_import = "import { Course, Progress, Module, Lesson } from '@/types';"
+    return replace_once(content, types_import, types_import + f"\nimport QuizPlayer from '{QUIZ_PLAYER_MODULE}';")
+
+
+@patch("view_quiz_state", VIEW_PAGE, version=2)
+def view_quiz_state(content):
+    """Adiciona estados do quiz após o último useState"""
+    if "const [showQuiz, setShowQuiz]" in content:
+        return content
+    return insert_at_anchor(content, "after_last_use_state", """
+
+  const [showQuiz, setShowQuiz] = useState(false);
+  const [videoCompleted, setVideoCompleted] = useState(false);""")
+
+
+@patch("view_effective_modules_memo", VIEW_PAGE)
+def view_effective_modules_memo(content):
+    """Move effectiveModules para useMemo antes dos useEffects"""
+    old_use_effect = """  useEffect(() => {
+    loadCourseAndProgress();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);"""
+
+    new_code = """  // Calcular effectiveModules baseado no course
+  const effectiveModules = useMemo(() => {
+    if (!course) return [];
+    return course.modules && course.modules.length > 0
+      ? course.modules
+      : course.lessons && course.lessons.length > 0
+      ? [{ _id: 'default', title: course.title, description: '', order: 1, lessons: course.lessons }]
+      : [];
+  }, [course]);
+
+  useEffect(() => {
+    loadCourseAndProgress();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
+
+  // Resetar quiz ao mudar de aula
+  useEffect(() => {
+    setShowQuiz(false);
+    setVideoCompleted(false);
+  }, [selectedModule, selectedLesson]);"""
+
+    return replace_once(content, old_use_effect, new_code,
+                        marker="const effectiveModules = useMemo(")
+
+
+@patch("view_complete_lesson_quiz", VIEW_PAGE)
+def view_complete_lesson_quiz(content):
+    """Atualiza handleCompleteLesson para usar effectiveModules e mostrar o quiz"""
+    old_handle_complete = """  const handleCompleteLesson = async () => {
+    if (!course?.modules || completing) return;
+
+    const courseModule = course.modules[selectedModule];
+    const lesson = courseModule.lessons[selectedLesson];
+
+    if (!courseModule._id || !lesson._id) return;
+
+    setCompleting(true);"""
+
+    new_handle_complete = """  const handleCompleteLesson = async () => {
+    if (!effectiveModules.length || completing) return;
+
+    const courseModule = effectiveModules[selectedModule];
+    const lesson = courseModule.lessons[selectedLesson];
+
+    if (!courseModule._id || !lesson._id) return;
+
+    // Se a aula tem quiz, mostrar o quiz ao invés de marcar como concluída
+    if (lesson.quiz && lesson.quiz.length === 5) {
+      setShowQuiz(true);
+      setVideoCompleted(true);
+      toast.info('Responda o questionário para concluir a aula');
+      return;
+    }
+
+    // Se não tem quiz, marcar como concluída diretamente
+    setCompleting(true);"""
+
+    return replace_once(content, old_handle_complete, new_handle_complete,
+                        marker="setShowQuiz(true);")
+
+
+@patch("view_remove_inline_effective_modules", VIEW_PAGE)
+def view_remove_inline_effective_modules(content):
+    """Remove o effectiveModules antigo e adiciona validação"""
+    old_effective = """  // Se não houver módulos, criar um módulo virtual com as lessons
+  const effectiveModules = course.modules && course.modules.length > 0
+    ? course.modules
+    : course.lessons && course.lessons.length > 0
+    ? [{ _id: 'default', title: course.title, description: '', order: 1, lessons: course.lessons }]
+    : [];
+
+  const currentModule = effectiveModules[selectedModule];"""
+
+    new_effective = """  if (!effectiveModules.length || !effectiveModules[selectedModule]) {
+    return (
+      <div className="text-center py-12">
+        <p className="text-gray-500">Este curso não possui módulos ou aulas.</p>
+        <Link href="/dashboard/courses" className="btn-primary mt-4">
+          Voltar
+        </Link>
+      </div>
+    );
+  }
+
+  const currentModule = effectiveModules[selectedModule];"""
+
+    return replace_once(content, old_effective, new_effective,
+                        marker="if (!effectiveModules.length || !effectiveModules[selectedModule])")
+
+
+QUIZ_PLAYER_JSX = '''
+
+          {/* Quiz Player */}
+          {showQuiz && currentLesson?.quiz && currentLesson.quiz.length === 5 && (
+            <div className="mt-6">
+              <QuizPlayer
+                courseId={course._id}
+                moduleId={currentModule?._id || null}
+                lessonId={currentLesson._id!}
+                onComplete={(passed) => {
+                  setShowQuiz(false);
+                  if (passed) {
+                    window.location.reload();
+                  }
+                }}
+              />
+            </div>
+          )}'''
+
+
+@patch("view_quiz_player_jsx", VIEW_PAGE, version=2)
+def view_quiz_player_jsx(content):
+    """Renderiza o QuizPlayer após o link do certificado"""
+    if "<QuizPlayer" in content:
+        return content
+    return insert_at_anchor(content, "after_certificate_link", QUIZ_PLAYER_JSX)
+
+
+@patch("replace_window_reload", "app/**/*.tsx")
+def replace_window_reload(content):
+    """Troca window.location.reload() por recarga do progresso (ou da página) no estado"""
+    return replace_reloads(content)
+
+
+# ---------------------------------------------------------------------------
+# Página de escalas (fix_preencher.py)
+# ---------------------------------------------------------------------------
+
+@patch("schedule_preencher_dash_variants", SCHEDULE_PAGE)
+def schedule_preencher_dash_variants(content):
+    """Aceita travessão (–) e hífen (-) em preencherConfirmados"""
+    old_function = '''  const preencherConfirmados = () => {
+    const linhas = listaParticipantes.split('\\n').filter(l => l.trim());
+    const confirmados: string[] = [];
+
+    linhas.forEach(linha => {
+      const parts = linha.split('-').map(p => p.trim());
+      if (parts.length < 2) return;
+      const nome = parts[0];
+      const status = parts.slice(1).join('-');
+
+      if (isConfirmado(status) && !coordenadores.some(c => normalizeStr(c) === normalizeStr(nome))) {
+        confirmados.push(nome);
+      }
+    });'''
+
+    new_function = '''  const preencherConfirmados = () => {
+    console.log('🔵 preencherConfirmados chamada');
+    console.log('📝 Lista completa:', listaParticipantes);
+
+    const linhas = listaParticipantes.split('\\n').filter(l => l.trim());
+    console.log('📋 Linhas processadas:', linhas.length);
+
+    const confirmados: string[] = [];
+
+    linhas.forEach(linha => {
+      const parts = linha.split('–').map(p => p.trim()); // Usar travessão (–) ao invés de hífen (-)
+      if (parts.length < 2) {
+        // Tentar com hífen normal também
+        const parts2 = linha.split('-').map(p => p.trim());
+        if (parts2.length >= 2) {
+          const nome = parts2[0];
+          const status = parts2.slice(1).join('-');
+
+          if (isConfirmado(status) && !coordenadores.some(c => normalizeStr(c) === normalizeStr(nome))) {
+            confirmados.push(nome);
+          }
+        }
+        return;
+      }
+
+      const nome = parts[0];
+      const status = parts.slice(1).join('–');
+
+      if (isConfirmado(status) && !coordenadores.some(c => normalizeStr(c) === normalizeStr(nome))) {
+        confirmados.push(nome);
+      }
+    });
+
+    console.log('✅ Confirmados encontrados:', confirmados.length, confirmados);'''
+
+    return replace_once(content, old_function, new_function, marker="linha.split('–')")
+
+
+# ---------------------------------------------------------------------------
+# Carregamento sob demanda (todas as páginas)
+# ---------------------------------------------------------------------------
+
+# Componentes que só aparecem depois de uma ação do usuário (quiz aberto,
+# aula em edição) e não precisam estar no bundle inicial da página
+LAZY_COMPONENTS = (
+    (QUIZ_PLAYER_MODULE, '<p className="py-4 text-center text-gray-600">Carregando questionário...</p>'),
+    (QUIZ_EDITOR_MODULE, '<p className="py-4 text-center text-gray-600">Carregando editor do questionário...</p>'),
+)
+
+
+@patch("lazy_quiz_components", "app/**/*.tsx")
+def lazy_quiz_components(content):
+    """Carrega QuizPlayer e QuizEditor com next/dynamic"""
+    for source, loading in LAZY_COMPONENTS:
+        content = make_lazy(content, source, loading) or content
+    return content
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Valida e normaliza os questionários (Lesson.quiz) de uma exportação de cursos
+
+A entrada é JSON Lines, um curso por linha (formato de ``Course`` em
+types/index.ts, com ``modules[].lessons[]`` e/ou ``lessons[]``). Cada linha
+é lida, validada e descartada antes da próxima, então a memória não cresce
+com o tamanho da exportação.
+
+Regras (as mesmas da página do curso e do QuizEditor):
+  - exatamente 5 perguntas por questionário
+  - cada pergunta com texto e pelo menos uma opção correta
+  - valores de ``order`` únicos dentro do questionário
+
+A saída é JSON Lines compacto, uma aula com questionário por linha, pronta
+para importação via quizService:
+    {"courseId":"…","moduleId":"…"|null,"lessonId":"…","quiz":[{"question":"…","order":1,"options":[{"text":"…","isCorrect":true}]}]}
+
+Uso:
+    python quiz_validator.py export.jsonl -o quizzes.jsonl
+    cat export.jsonl | python quiz_validator.py - > quizzes.jsonl
+"""
+import argparse
+import json
+import sys
+
+QUIZ_QUESTIONS = 5
+
+
+class QuizError:
+    """Problema encontrado em um questionário"""
+    __slots__ = ("line", "course", "lesson", "question", "message")
+
+    def __init__(self, line, course, lesson, question, message):
+        self.line = line
+        self.course = course
+        self.lesson = lesson
+        self.question = question
+        self.message = message
+
+    def __str__(self):
+        where = f"linha {self.line}, curso {self.course}"
+        if self.lesson is not None:
+            where += f", aula {self.lesson}"
+        if self.question is not None:
+            where += f", pergunta {self.question + 1}"
+        return f"{where}: {self.message}"
+
+
+def iter_lessons(course, on_invalid=None):
+    """(moduleId, aula) de todas as aulas do curso, dos módulos e das aulas soltas.
+
+    Módulos e aulas que não são objetos são pulados e passados (com a
+    mensagem) para ``on_invalid``.
+    """
+    def items(value, what):
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            if on_invalid:
+                on_invalid(f"{what} não é uma lista")
+            return []
+        return value
+
+    for index, module in enumerate(items(course.get("modules"), "modules")):
+        if not isinstance(module, dict):
+            if on_invalid:
+                on_invalid(f"módulo {index + 1} não é um objeto")
+            continue
+        for lesson_index, lesson in enumerate(items(module.get("lessons"), f"lessons do módulo {index + 1}")):
+            if not isinstance(lesson, dict):
+                if on_invalid:
+                    on_invalid(f"aula {lesson_index + 1} do módulo {index + 1} não é um objeto")
+                continue
+            yield module.get("_id"), lesson
+    for lesson_index, lesson in enumerate(items(course.get("lessons"), "lessons")):
+        if not isinstance(lesson, dict):
+            if on_invalid:
+                on_invalid(f"aula {lesson_index + 1} não é um objeto")
+            continue
+        yield None, lesson
+
+
+def _text(value):
+    return value.strip() if isinstance(value, str) else ""
+
+
+def normalize_quiz(quiz):
+    """Forma canônica: textos aparados, ``isCorrect`` sempre booleano, perguntas por ``order``"""
+    questions = []
+    for question in quiz:
+        questions.append({
+            "question": _text(question.get("question")),
+            "order": question.get("order"),
+            "options": [{"text": _text(option.get("text")), "isCorrect": option.get("isCorrect") is True}
+                        for option in question.get("options") or [] if isinstance(option, dict)],
+        })
+    questions.sort(key=lambda q: q["order"] if isinstance(q["order"], (int, float)) else float("inf"))
+    return questions
+
+
+def validate_quiz(quiz):
+    """Mensagens de erro do questionário: ``[(índice da pergunta ou None, mensagem)]``"""
+    if not isinstance(quiz, list):
+        return [(None, "quiz não é uma lista")]
+    errors = []
+    if len(quiz) != QUIZ_QUESTIONS:
+        errors.append((None, f"{len(quiz)} pergunta(s); são obrigatórias {QUIZ_QUESTIONS}"))
+    seen_orders = {}
+    for index, question in enumerate(quiz):
+        if not isinstance(question, dict):
+            errors.append((index, "pergunta não é um objeto"))
+            continue
+        if not _text(question.get("question")):
+            errors.append((index, "pergunta sem texto"))
+        order = question.get("order")
+        if not isinstance(order, int) or isinstance(order, bool):
+            errors.append((index, f"order inválido: {order!r}"))
+        elif order in seen_orders:
+            errors.append((index, f"order {order} repetido (pergunta {seen_orders[order] + 1})"))
+        else:
+            seen_orders[order] = index
+        options = question.get("options")
+        if not isinstance(options, list) or not options:
+            errors.append((index, "pergunta sem opções"))
+            continue
+        if any(not isinstance(o, dict) or not _text(o.get("text")) for o in options):
+            errors.append((index, "opção sem texto"))
+        if not any(isinstance(o, dict) and o.get("isCorrect") is True for o in options):
+            errors.append((index, "nenhuma opção correta"))
+    return errors
+
+
+def validate_stream(lines, on_error=None):
+    """Valida um fluxo JSONL de cursos, gerando os registros normalizados das aulas válidas.
+
+    ``on_error`` recebe cada ``QuizError``; o gerador nunca guarda mais de um curso.
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            course = json.loads(line)
+        except ValueError as e:
+            if on_error:
+                on_error(QuizError(line_number, "?", None, None, f"JSON inválido: {e}"))
+            continue
+        if not isinstance(course, dict):
+            if on_error:
+                on_error(QuizError(line_number, "?", None, None, "curso não é um objeto"))
+            continue
+        course_id = course.get("_id") or "?"
+
+        def invalid(message):
+            if on_error:
+                on_error(QuizError(line_number, course_id, None, None, message))
+
+        for module_id, lesson in iter_lessons(course, invalid):
+            quiz = lesson.get("quiz")
+            if not quiz:
+                continue  # questionário é opcional
+            lesson_id = lesson.get("_id") or lesson.get("title") or "?"
+            errors = validate_quiz(quiz)
+            if errors:
+                if on_error:
+                    for question, message in errors:
+                        on_error(QuizError(line_number, course_id, lesson_id, question, message))
+                continue
+            yield {"courseId": course_id, "moduleId": module_id, "lessonId": lesson_id,
+                   "quiz": normalize_quiz(quiz)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="exportação JSONL ('-' para stdin)")
+    parser.add_argument("-o", "--output", help="JSONL normalizado (padrão: stdout)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="não lista cada erro")
+    args = parser.parse_args()
+
+    counts = {"errors": 0, "lessons": 0}
+
+    def report(error):
+        counts["errors"] += 1
+        if not args.quiet:
+            print(f"❌ {error}", file=sys.stderr)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    target = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for record in validate_stream(source, report):
+            target.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            target.write("\n")
+            counts["lessons"] += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(f"\n📊 {counts['lessons']} questionário(s) válido(s), {counts['errors']} erro(s)",
+          file=sys.stderr)
+    return 1 if counts["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Gera as imagens das escalas (croqui + nomes) em lote, fora do navegador
+
+Reproduz o ``desenharCanvas`` da página de escala: o croqui é desenhado em
+500x600 e cada nome é escrito em ``posicoesTexto[idx]`` com o ``wrapText``
+da página (10px Arial, largura máxima 12, altura de linha 12). O croqui é
+decodificado e redimensionado uma única vez por processo, as posições vêm
+da própria página e a quebra de linha de cada nome fica em cache; as
+imagens de todas as equipes/datas são geradas em paralelo.
+
+Requer Pillow (``pip install Pillow``). O croqui usado pela página está em
+https://i.imgur.com/fhNiX9k.png; baixe-o e passe com ``--template``.
+
+Entrada: JSON Lines com ``{"team", "event", "campos"}`` (saída do schedule_solver.py).
+
+Uso:
+    python render_schedules.py escalas.jsonl --template croqui.png -o imagens/
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from schedule_config import load_schedule_config
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # dependência opcional
+    Image = ImageDraw = ImageFont = None
+
+CANVAS_SIZE = (500, 600)
+FONT_SIZE = 10
+MAX_WIDTH = 12
+LINE_HEIGHT = 12
+FONT_CANDIDATES = ("arial.ttf", "Arial.ttf", "LiberationSans-Regular.ttf", "DejaVuSans.ttf")
+
+
+def wrap_text(text, measure, max_width=MAX_WIDTH):
+    """Linhas do ``wrapText`` da página (cada linha mantém o espaço final, como no canvas)"""
+    words = text.split(" ")
+    lines = []
+    line = ""
+    for i, word in enumerate(words):
+        test_line = line + word + " "
+        if measure(test_line) > max_width and i > 0:
+            lines.append(line)
+            line = word + " "
+        else:
+            line = test_line
+    lines.append(line)
+    return lines
+
+
+class Layout:
+    """Posições dos campos e a quebra de linha de cada nome (em cache)"""
+
+    def __init__(self, positions, measure):
+        self.positions = [tuple(p) for p in positions]
+        self._wrap = lru_cache(maxsize=4096)(lambda text: tuple(wrap_text(text, measure)))
+
+    def lines(self, campos):
+        """``[(x, y, texto)]`` de todos os campos preenchidos"""
+        result = []
+        for idx, (x, y) in enumerate(self.positions):
+            nome = campos.get(f"campo{idx}")
+            if nome:
+                for n, line in enumerate(self._wrap(nome)):
+                    result.append((x, y + n * LINE_HEIGHT, line))
+        return result
+
+
+def load_font(path=None):
+    for candidate in ((path,) if path else FONT_CANDIDATES):
+        try:
+            return ImageFont.truetype(candidate, FONT_SIZE)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def slugify(value):
+    value = unicodedata.normalize("NFKD", str(value)).encode("ascii", "ignore").decode()
+    return re.sub(r"[^\w-]+", "-", value).strip("-").lower() or "escala"
+
+
+# Estado de cada processo do pool: croqui já decodificado, fonte e layout
+_template = None
+_font = None
+_layout = None
+
+
+def _init_worker(template_path, font_path, positions):
+    global _template, _font, _layout
+    with Image.open(template_path) as image:
+        _template = image.convert("RGBA").resize(CANVAS_SIZE)
+    _font = load_font(font_path)
+    _layout = Layout(positions, _font.getlength)
+
+
+def _render(job):
+    team, event, campos, output = job
+    image = _template.copy()
+    draw = ImageDraw.Draw(image)
+    for x, y, line in _layout.lines(campos):
+        # canvas usa a linha de base (textBaseline = 'alphabetic')
+        draw.text((x, y), line, font=_font, fill="black", anchor="ls")
+    image.save(output, "PNG")
+    return team, event, output
+
+
+def iter_jobs(stream, out_dir):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        entry = json.loads(line)
+        team = entry.get("team", "")
+        event = entry.get("event", "")
+        name = f"escala-{slugify(team)}-{slugify(event)}.png"
+        yield team, event, entry.get("campos", {}), os.path.join(out_dir, name)
+
+
+def render_all(jobs, template_path, positions, font_path=None, workers=None, on_done=None):
+    """Gera as imagens em paralelo; devolve quantas foram geradas"""
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker(template_path, font_path, positions)
+        results = map(_render, jobs)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(template_path, font_path, positions))
+        results = pool.map(_render, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+    try:
+        for result in results:
+            count += 1
+            if on_done:
+                on_done(*result)
+    finally:
+        if pool:
+            pool.shutdown()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="escalas em JSONL ('-' para stdin)")
+    parser.add_argument("--template", required=True, help="imagem do croqui")
+    parser.add_argument("-o", "--output", default="escalas", help="pasta de saída")
+    parser.add_argument("--font", help="fonte TrueType (padrão: Arial, se existir)")
+    parser.add_argument("--page", help="página de escala de onde ler posicoesTexto")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="número de processos")
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow não está instalado: pip install Pillow", file=sys.stderr)
+        return 1
+
+    config = load_schedule_config(args.page) if args.page else load_schedule_config()
+    os.makedirs(args.output, exist_ok=True)
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    try:
+        jobs = list(iter_jobs(source, args.output))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    def done(team, event, output):
+        print(f"🖼️  {team} {event}: {output}")
+
+    count = render_all(jobs, args.template, config.text_positions, args.font, args.jobs, done)
+    print(f"\n✅ {count} imagem(ns) em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
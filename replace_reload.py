@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Troca ``window.location.reload()`` por uma atualização só do estado necessário
+
+Recarregar a página baixa de novo o curso, todo o JS/CSS e remonta todos os
+módulos e aulas só para marcar uma aula como concluída. Para cada chamada,
+dentro do componente que a contém, a troca preferida é buscar só o
+progresso (``progressService.getCourseProgress(<id>)`` -> ``setProgress``,
+com o mesmo argumento que a página já usa); sem isso, a função de carga da
+página (``loadCourseAndProgress`` ou outra ``load*/fetch*/refresh*`` sem
+parâmetros). Chamadas sem alternativa ficam como estão e são listadas.
+
+A troca é feita pelo passo ``replace_window_reload`` (quiz_patches);
+rodado direto, este script só lista as chamadas em app/ e o que cada uma
+viraria.
+
+Uso:
+    python replace_reload.py              # lista as chamadas em app/
+    python patch_runner.py -n replace_window_reload
+"""
+import os
+import re
+import sys
+
+from codemod import FRONTEND_DIR, discover_files, read_file
+from tsx_index import build_index
+from tsx_lexer import IDENT, PUNCT
+
+RELOAD_CALLS = (("window", "location", "reload"), ("location", "reload"))
+PREFERRED_LOADER = "loadCourseAndProgress"
+LOADER_RE = re.compile(r"(?:load|fetch|refresh)[A-Z]\w*")
+NO_ARGS_RE = re.compile(r"[^=]*=\s*(?:async\s*)?\(\s*\)\s*=>|\s*(?:async\s+)?function\s+\w+\s*\(\s*\)")
+
+PROGRESS_SERVICE = "progressService"
+PROGRESS_FETCH = "getCourseProgress"
+PROGRESS_SETTER = "setProgress"
+
+# Estratégias
+PROGRESS = "progress"
+LOADER = "loader"
+
+
+class ReloadSite:
+    """Chamada de reload e a troca proposta (``replacement`` é ``None`` sem alternativa)"""
+    __slots__ = ("start", "end", "line", "component", "replacement", "strategy")
+
+    def __init__(self, start, end, line, component, replacement=None, strategy=None):
+        self.start = start
+        self.end = end
+        self.line = line
+        self.component = component
+        self.replacement = replacement
+        self.strategy = strategy
+
+
+def _is(tok, kind, values):
+    return tok.kind == kind and tok.value in values
+
+
+def _match_call(tokens, i):
+    """Índice do ``)`` se ``tokens[i:]`` é ``[window.]location.reload()``"""
+    for names in RELOAD_CALLS:
+        k = i
+        for n, name in enumerate(names):
+            if n:
+                if k >= len(tokens) or not _is(tokens[k], PUNCT, (".", "?.")):
+                    break
+                k += 1
+            if k >= len(tokens) or not _is(tokens[k], IDENT, (name,)):
+                break
+            k += 1
+        else:
+            if k + 1 < len(tokens) and _is(tokens[k], PUNCT, ("(",)) and _is(tokens[k + 1], PUNCT, (")",)):
+                return k + 1
+    return None
+
+
+def _progress_argument(index, component):
+    """Texto do argumento de ``progressService.getCourseProgress(...)`` já usado no componente"""
+    tokens = index.lexer.tokens
+    text = index.text
+    for i, tok in enumerate(tokens[:-3]):
+        if not (component.start <= tok.start < component.end):
+            continue
+        if tok.kind == IDENT and tok.value == PROGRESS_SERVICE and tokens[i + 1].value == "." \
+                and tokens[i + 2].value == PROGRESS_FETCH and tokens[i + 3].value == "(":
+            close = index.lexer.pairs.get(tokens[i + 3].start)
+            if close is not None:
+                argument = text[tokens[i + 3].end:close].strip()
+                if argument:
+                    return argument
+    return None
+
+
+def _loader(index, component):
+    """Função de carga sem parâmetros declarada no componente"""
+    candidates = [s for s in index.component_symbols(component.name)
+                  if s.kind == "function" and LOADER_RE.fullmatch(s.name)
+                  and NO_ARGS_RE.match(index.text, s.start)]
+    candidates.sort(key=lambda s: s.name != PREFERRED_LOADER)
+    return candidates[0].name if candidates else None
+
+
+def _replacement(index, component):
+    if component is None:
+        return None, None
+    names = {n for s in index.component_symbols(component.name) for n in s.names}
+    imported = index.definition(PROGRESS_SERVICE)
+    if PROGRESS_SETTER in names and imported is not None and imported.kind == "import":
+        argument = _progress_argument(index, component)
+        if argument is not None:
+            return (f"{PROGRESS_SERVICE}.{PROGRESS_FETCH}({argument})"
+                    f".then({PROGRESS_SETTER}).catch(console.error)"), PROGRESS
+    loader = _loader(index, component)
+    if loader is not None:
+        return f"{loader}()", LOADER
+    return None, None
+
+
+def find_reload_sites(content, jsx=True):
+    """Chamadas de reload do arquivo, com a troca proposta para cada uma"""
+    if "reload" not in content:
+        return []
+    index = build_index(content, jsx=jsx)
+    tokens = index.lexer.tokens
+    sites = []
+    i = 0
+    while i < len(tokens) - 4:
+        tok = tokens[i]
+        prev = tokens[i - 1] if i else None
+        if tok.kind != IDENT or (prev is not None and prev.kind == PUNCT and prev.value in (".", "?.")):
+            i += 1
+            continue
+        close = _match_call(tokens, i)
+        if close is None:
+            i += 1
+            continue
+        component = next((c for c in index.components if c.start <= tok.start < c.end), None)
+        replacement, strategy = _replacement(index, component)
+        sites.append(ReloadSite(tok.start, tokens[close].end, index.lines.line_of(tok.start),
+                                component.name if component else None, replacement, strategy))
+        i = close + 1
+    return sites
+
+
+def replace_reloads(content, jsx=True):
+    """Aplica as trocas possíveis; devolve o conteúdo (intacto se não há o que trocar)"""
+    for site in reversed(find_reload_sites(content, jsx)):
+        if site.replacement is not None:
+            content = content[:site.start] + site.replacement + content[site.end:]
+    return content
+
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else FRONTEND_DIR
+    total = pending = 0
+    for path in discover_files(root, ("app",), (".tsx", ".ts")):
+        content = read_file(path)
+        display = os.path.relpath(path, root).replace(os.sep, "/")
+        for site in find_reload_sites(content, jsx=not path.endswith(".ts")):
+            total += 1
+            call = content[site.start:site.end]
+            if site.replacement is None:
+                pending += 1
+                print(f"⚠️  {display}:{site.line} {call}: nenhuma alternativa em {site.component or 'módulo'}")
+            else:
+                print(f"🔄 {display}:{site.line} {call} -> {site.replacement}")
+    print(f"\n📊 {total} chamada(s) de reload, {total - pending} com troca, {pending} sem alternativa")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
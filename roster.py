@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Processa em lote as listas de presença (coladas do WhatsApp) de várias equipes
+
+Mesma regra do ``preencherConfirmados`` da página de escala: cada linha é
+"Nome – status" (travessão, ou hífen como alternativa), confirmados são os
+com ✅/✔, "confirm...", "ok", "presença" ou "presente", e coordenadores
+ficam de fora. A diferença é que coordenadores e nomes femininos são
+normalizados uma única vez em conjuntos (consulta O(1) por participante),
+e a entrada é lida em uma passada só, equipe por equipe.
+
+Entrada: um arquivo por equipe (o nome do arquivo é a equipe) ou um fluxo
+com várias equipes separadas por linhas "# Nome da equipe".
+Saída: JSON Lines, uma equipe por linha.
+
+Uso:
+    python roster.py listas/*.txt > confirmados.jsonl
+    cat todas.txt | python roster.py -
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import unicodedata
+from dataclasses import asdict, dataclass, field
+
+from schedule_config import load_schedule_config
+
+# Espaços removidos pelo String.prototype.trim() do JavaScript
+JS_WHITESPACE = ("\t\n\v\f\r \u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+                 "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff")
+# Mesma faixa do /[\u0300-\u036f]/g da página (marcas diacríticas combinantes)
+COMBINING_RE = re.compile("[\u0300-\u036f]")
+CONFIRM_RE = re.compile(r"^confirm")
+CONFIRMED_WORDS = frozenset({"ok", "presenca", "presente"})
+TEAM_HEADER = "#"
+
+
+def normalize_str(s):
+    """``normalizeStr`` da página: NFD, sem acentos, minúsculas e aparado"""
+    return COMBINING_RE.sub("", unicodedata.normalize("NFD", s)).lower().strip(JS_WHITESPACE)
+
+
+def is_confirmado(status):
+    """``isConfirmado`` da página"""
+    if "✅" in status or "✔" in status:
+        return True
+    st = normalize_str(status)
+    return bool(CONFIRM_RE.match(st)) or st in CONFIRMED_WORDS
+
+
+def split_line(linha):
+    """``(nome, status)`` de uma linha "Nome – status" / "Nome - status", ou ``None``"""
+    for dash in ("–", "-"):
+        parts = [p.strip(JS_WHITESPACE) for p in linha.split(dash)]
+        if len(parts) >= 2:
+            return parts[0], dash.join(parts[1:])
+    return None
+
+
+class RosterRules:
+    """Coordenadores e nomes femininos já normalizados"""
+
+    def __init__(self, coordinators, female_names):
+        self.coordinators = frozenset(normalize_str(c) for c in coordinators)
+        self.female_names = frozenset(normalize_str(n) for n in female_names)
+
+    @classmethod
+    def from_page(cls, path=None):
+        """Lê ``coordenadores`` e ``femaleNames`` da página de escala"""
+        config = load_schedule_config(path) if path else load_schedule_config()
+        return cls(config.coordinators, config.female_names)
+
+    def is_coordinator(self, name):
+        return normalize_str(name) in self.coordinators
+
+    def is_female_name(self, name):
+        """``isFemaleName`` da página: nome conhecido ou terminado em "a" """
+        return self.is_female_key(normalize_str(name))
+
+    def is_female_key(self, key):
+        """``is_female_name`` para um nome já normalizado"""
+        return key in self.female_names or key.endswith("a")
+
+
+@dataclass
+class Roster:
+    """Resultado de uma equipe, na ordem da lista"""
+    team: str
+    confirmados: list = field(default_factory=list)
+    femininos: list = field(default_factory=list)
+    masculinos: list = field(default_factory=list)
+    linhas: int = 0
+    ignoradas: int = 0          # linhas sem "nome - status"
+    coordenadores: int = 0      # confirmados que são coordenadores (ficam de fora)
+
+
+def parse_roster(team, lines, rules):
+    """Aplica as regras do ``preencherConfirmados`` às linhas de uma equipe"""
+    roster = Roster(team)
+    for linha in lines:
+        if not linha.strip(JS_WHITESPACE):
+            continue
+        roster.linhas += 1
+        parsed = split_line(linha)
+        if parsed is None:
+            roster.ignoradas += 1
+            continue
+        nome, status = parsed
+        if not is_confirmado(status):
+            continue
+        key = normalize_str(nome)  # uma normalização por participante
+        if key in rules.coordinators:
+            roster.coordenadores += 1
+            continue
+        roster.confirmados.append(nome)
+        (roster.femininos if rules.is_female_key(key) else roster.masculinos).append(nome)
+    return roster
+
+
+def iter_teams(stream, default_team):
+    """Divide um fluxo de linhas em ``(equipe, linhas)`` nos cabeçalhos "# Equipe" """
+    team = default_team
+    lines = []
+    for line in stream:
+        line = line.rstrip("\r\n")
+        if line.startswith(TEAM_HEADER):
+            if lines or team != default_team:
+                yield team, lines
+            team = line[len(TEAM_HEADER):].strip() or default_team
+            lines = []
+        else:
+            lines.append(line)
+    if lines or team != default_team:
+        yield team, lines
+
+
+def parse_streams(paths, rules):
+    """Gera um ``Roster`` por equipe, lendo os arquivos um de cada vez"""
+    for path in paths:
+        if path == "-":
+            yield from (parse_roster(team, lines, rules) for team, lines in iter_teams(sys.stdin, "stdin"))
+            continue
+        default_team = os.path.splitext(os.path.basename(path))[0]
+        with open(path, "r", encoding="utf-8") as f:
+            for team, lines in iter_teams(f, default_team):
+                yield parse_roster(team, lines, rules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="listas de presença ('-' para stdin)")
+    parser.add_argument("--page", help="página de escala de onde ler coordenadores/nomes")
+    args = parser.parse_args()
+
+    rules = RosterRules.from_page(args.page)
+    teams = confirmed = 0
+    for roster in parse_streams(args.paths, rules):
+        sys.stdout.write(json.dumps(asdict(roster), ensure_ascii=False) + "\n")
+        teams += 1
+        confirmed += len(roster.confirmados)
+    print(f"📊 {teams} equipe(s), {confirmed} confirmado(s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
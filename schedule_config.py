@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Configuração da página de escalas (posições, coordenadores, nomes...) lida do próprio TSX
+
+Os arrays ``const`` da página de escala da equipe são a fonte da verdade;
+as ferramentas em Python leem os literais direto do arquivo (via
+tokenizador), em vez de manter uma cópia que sai de sincronia.
+"""
+import ast
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from tsx_lexer import IDENT, NUMBER, PUNCT, STRING, declarations, tokenize_file
+
+SCHEDULE_PAGE = "app/dashboard/schedules/[teamId]/page.tsx"
+
+# nome no TSX -> campo de ScheduleConfig
+ARRAYS = {
+    "nomesCampos": "field_names",
+    "camposSemInput": "fields_without_input",
+    "posicoesTexto": "text_positions",
+    "coordenadores": "coordinators",
+    "femaleNames": "female_names",
+    "femalePrefer": "female_prefer",
+    "malePrefer": "male_prefer",
+}
+
+
+@dataclass
+class ScheduleConfig:
+    """Arrays de dados da página de escala (mesmos nomes, em snake_case)"""
+    field_names: list
+    fields_without_input: list
+    text_positions: list
+    coordinators: list
+    female_names: list
+    female_prefer: list
+    male_prefer: list
+
+
+class LiteralError(ValueError):
+    """O inicializador não é um literal simples (strings, números e arrays)"""
+
+
+def parse_literal(tokens, index):
+    """Converte o literal que começa em ``tokens[index]``; devolve ``(valor, próximo índice)``"""
+    tok = tokens[index]
+    if tok.kind == STRING:
+        return ast.literal_eval(tok.value), index + 1
+    if tok.kind == NUMBER:
+        return ast.literal_eval(tok.value.replace("_", "")), index + 1
+    if tok.kind == PUNCT and tok.value == "-" and tokens[index + 1].kind == NUMBER:
+        value, index = parse_literal(tokens, index + 1)
+        return -value, index
+    if tok.kind == IDENT and tok.value in ("true", "false", "null"):
+        return {"true": True, "false": False, "null": None}[tok.value], index + 1
+    if tok.kind == PUNCT and tok.value == "[":
+        items = []
+        index += 1
+        while not (tokens[index].kind == PUNCT and tokens[index].value == "]"):
+            value, index = parse_literal(tokens, index)
+            items.append(value)
+            if tokens[index].kind == PUNCT and tokens[index].value == ",":
+                index += 1
+        return items, index + 1
+    raise LiteralError(f"literal não suportado: {tok.value!r}")
+
+
+def read_arrays(lexer, names):
+    """Valores dos ``const nome = [...]`` do arquivo (a primeira declaração de cada nome)"""
+    tokens = lexer.tokens
+    starts = [t.start for t in tokens]
+    found = {}
+    for decl in declarations(lexer):
+        if decl.name not in names or decl.name in found:
+            continue
+        # primeiro token depois do "=" da declaração
+        i = bisect_left(starts, decl.start)
+        while not (tokens[i].kind == PUNCT and tokens[i].value == "="):
+            i += 1
+        found[decl.name], _ = parse_literal(tokens, i + 1)
+    return found
+
+
+def load_schedule_config(path=SCHEDULE_PAGE):
+    """Lê os arrays de configuração da página de escala"""
+    arrays = read_arrays(tokenize_file(path), set(ARRAYS))
+    missing = set(ARRAYS) - set(arrays)
+    if missing:
+        raise KeyError(f"{path}: arrays não encontrados: {', '.join(sorted(missing))}")
+    return ScheduleConfig(**{field: arrays[name] for name, field in ARRAYS.items()})
+
+
+if __name__ == "__main__":
+    config = load_schedule_config()
+    for name, field in ARRAYS.items():
+        print(f"{name}: {getattr(config, field)}")
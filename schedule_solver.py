@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Monta as escalas do mês inteiro (todas as equipes) por emparelhamento de custo mínimo
+
+Segue as regras do ``preencherConfirmados``/``pegarNomePreferencial`` da
+página de escala: recepção, controle, staff, aux. pastores e auxiliar
+preferem mulheres; escada e porta de emergência preferem homens; as demais
+posições vêm depois, e coordenadores nunca entram. Em vez de tirar nomes de
+listas com ``shift()``, cada evento é um problema de atribuição
+(posições x voluntários) resolvido pelo algoritmo húngaro, com custo que
+inclui a preferência de gênero e a justiça ao longo do mês: quem já serviu
+mais vezes (ou já ficou naquela posição) custa mais. Posições que ficariam
+vazias custam mais ainda, na ordem de prioridade da página.
+
+Entrada: JSON Lines com um evento por linha, ``{"team", "event", "confirmados"}``
+(a saída do roster.py serve, com um ``event``/``date`` opcional).
+Saída: JSON Lines com os ``campos`` (campo0..campo24) de cada evento.
+
+Uso:
+    python schedule_solver.py eventos.jsonl > escalas.jsonl
+"""
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
+
+from roster import RosterRules, normalize_str
+
+# Posições na ordem em que a página as preenche (índices de nomesCampos)
+FEMALE_SLOTS = (14, 15, 16, 24, 17, 18, 3, 21)
+MALE_SLOTS = (2, 20)
+OTHER_SLOTS = (0, 4, 6, 7, 9, 10, 11, 12, 13)
+SLOTS = FEMALE_SLOTS + MALE_SLOTS + OTHER_SLOTS
+
+# Custos
+EMPTY_COST = 10000          # posição vazia (mais a prioridade da posição)
+GENDER_PENALTY = 50         # posição com preferência de gênero ocupada pelo outro gênero
+OTHER_GENDER_PENALTY = 5    # demais posições: a página também põe homens primeiro
+FAIRNESS_WEIGHT = 10        # por escala já feita no mês
+REPEAT_WEIGHT = 4           # por vez que já ficou nesta mesma posição
+
+
+def hungarian(cost):
+    """Atribuição de custo mínimo (linhas <= colunas): coluna escolhida para cada linha.
+
+    Versão O(n²·m) com potenciais (Kuhn-Munkres / Jonker-Volgenant).
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    if n > m:
+        raise ValueError("a matriz precisa ter pelo menos tantas colunas quanto linhas")
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)          # p[j] = linha (1..n) atribuída à coluna j
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    assignment = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assignment[p[j] - 1] = j - 1
+    return assignment
+
+
+def slot_preference(slot):
+    """``"f"``, ``"m"`` ou ``None`` para as demais posições"""
+    if slot in FEMALE_SLOTS:
+        return "f"
+    if slot in MALE_SLOTS:
+        return "m"
+    return None
+
+
+class MonthSolver:
+    """Resolve os eventos em ordem, acumulando quantas vezes cada pessoa serviu"""
+
+    def __init__(self, rules, slots=SLOTS, fairness_weight=FAIRNESS_WEIGHT):
+        self.rules = rules
+        self.slots = slots
+        self.fairness_weight = fairness_weight
+        self.served = Counter()              # (equipe, nome normalizado) -> escalas no mês
+        self.held = defaultdict(Counter)     # (equipe, nome normalizado) -> posição -> vezes
+
+    def _people(self, confirmados):
+        """Voluntários elegíveis, sem repetidos nem coordenadores: ``[(nome, chave, feminino)]``"""
+        seen = set()
+        people = []
+        for nome in confirmados:
+            key = normalize_str(nome)
+            if not key or key in seen or key in self.rules.coordinators:
+                continue
+            seen.add(key)
+            people.append((nome, key, self.rules.is_female_key(key)))
+        return people
+
+    def cost_matrix(self, team, people):
+        """Linhas = posições; colunas = voluntários + uma coluna "vazia" por posição"""
+        slots = self.slots
+        empty = [EMPTY_COST + (len(slots) - rank) * 100 for rank in range(len(slots))]
+        matrix = []
+        for rank, slot in enumerate(slots):
+            preference = slot_preference(slot)
+            row = []
+            for _, key, female in people:
+                cost = self.fairness_weight * self.served[team, key] \
+                    + REPEAT_WEIGHT * self.held[team, key][slot]
+                if preference == "f" and not female or preference == "m" and female:
+                    cost += GENDER_PENALTY
+                elif preference is None and female:
+                    cost += OTHER_GENDER_PENALTY
+                row.append(cost)
+            row.extend([empty[rank]] * len(slots))
+            matrix.append(row)
+        return matrix
+
+    def solve_event(self, team, confirmados):
+        """``(campos, custo)`` de um evento; atualiza as contagens do mês"""
+        people = self._people(confirmados)
+        matrix = self.cost_matrix(team, people)
+        assignment = hungarian(matrix)
+        campos = {}
+        total = 0
+        for rank, column in enumerate(assignment):
+            slot = self.slots[rank]
+            total += matrix[rank][column]
+            if column < len(people):
+                nome, key, _ = people[column]
+                campos[f"campo{slot}"] = nome
+                self.served[team, key] += 1
+                self.held[team, key][slot] += 1
+            else:
+                campos[f"campo{slot}"] = ""
+        return campos, total
+
+    def load(self, team):
+        """Escalas por pessoa da equipe no mês"""
+        return {key: count for (t, key), count in self.served.items() if t == team}
+
+
+def iter_events(stream):
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if line:
+            event = json.loads(line)
+            event.setdefault("event", event.get("date") or f"#{line_number}")
+            yield event
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="eventos em JSONL ('-' para stdin)")
+    parser.add_argument("--page", help="página de escala de onde ler coordenadores/nomes")
+    parser.add_argument("--fairness", type=float, default=FAIRNESS_WEIGHT,
+                        help=f"peso de cada escala anterior no mês (padrão: {FAIRNESS_WEIGHT})")
+    args = parser.parse_args()
+
+    solver = MonthSolver(RosterRules.from_page(args.page), fairness_weight=args.fairness)
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    events = 0
+    empty = 0
+    teams = set()
+    try:
+        # ordem cronológica (estável para eventos sem data): a justiça é acumulada nessa ordem
+        ordered = sorted(iter_events(source), key=lambda e: str(e.get("date") or ""))
+        for event in ordered:
+            team = event.get("team", "")
+            campos, cost = solver.solve_event(team, event.get("confirmados", []))
+            empty += sum(1 for name in campos.values() if not name)
+            events += 1
+            teams.add(team)
+            sys.stdout.write(json.dumps({"team": team, "event": event["event"], "campos": campos,
+                                         "cost": cost}, ensure_ascii=False) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    print(f"📊 {events} evento(s) de {len(teams)} equipe(s), {empty} posição(ões) vazia(s)",
+          file=sys.stderr)
+    for team in sorted(teams):
+        load = solver.load(team)
+        if load:
+            print(f"   {team}: {len(load)} voluntário(s), entre {min(load.values())} e "
+                  f"{max(load.values())} escala(s) por pessoa", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Índice de declarações e referências de um componente TSX, montado em uma passada
+
+Mapeia cada declaração de topo (imports, const/let/function/class do módulo
+e const/funções/hooks do corpo dos componentes) para seu intervalo de
+offsets e de linhas, junto com os identificadores que ela referencia.
+Consultas como "onde X é definido" são O(1) e "X é usado antes de ser
+definido" é O(log n), sem reler o arquivo. Nomes do corpo de um componente
+são resolvidos dentro dele: dois componentes podem declarar o mesmo
+``data`` ou ``loadX`` sem que um seja atribuído ao outro.
+"""
+from bisect import bisect_left, bisect_right
+
+import profiling
+from tsx_lexer import IDENT, JSX_OPEN, PUNCT, STRING, declarations, tokenize, tokenize_file
+
+# Palavras reservadas que nunca são referências
+KEYWORDS = frozenset({
+    "abstract", "any", "as", "async", "await", "boolean", "break", "case", "catch", "class",
+    "const", "continue", "debugger", "declare", "default", "delete", "do", "else", "enum",
+    "export", "extends", "false", "finally", "for", "from", "function", "get", "if",
+    "implements", "import", "in", "instanceof", "interface", "keyof", "let", "new", "null",
+    "number", "of", "private", "protected", "public", "readonly", "return", "set", "static",
+    "string", "super", "switch", "this", "throw", "true", "try", "type", "typeof",
+    "undefined", "var", "void", "while", "with", "yield",
+})
+
+
+class Symbol:
+    """Declaração indexada"""
+    __slots__ = ("name", "names", "kind", "start", "end", "first_line", "last_line",
+                 "scope", "depth", "body_start", "source", "refs")
+
+    def __init__(self, name, names, kind, start, end, lines, scope, depth,
+                 body_start=None, source=None):
+        self.name = name
+        self.names = names
+        self.kind = kind              # import | function | hook | class | value
+        self.start = start
+        self.end = end
+        self.first_line = lines.line_of(start)
+        self.last_line = lines.line_of(max(start, end - 1))
+        self.scope = scope            # None no módulo, nome do componente no corpo
+        self.depth = depth
+        self.body_start = body_start
+        self.source = source          # módulo de origem dos imports
+        self.refs = set()             # identificadores referenciados no intervalo
+
+    def __repr__(self):
+        return f"<Symbol {self.kind} {self.name} L{self.first_line}-{self.last_line}>"
+
+
+class Reference:
+    """Uso de um identificador; ``deferred`` indica que está dentro de uma função aninhada"""
+    __slots__ = ("name", "offset", "line", "deferred")
+
+    def __init__(self, name, offset, line, deferred):
+        self.name = name
+        self.offset = offset
+        self.line = line
+        self.deferred = deferred
+
+
+class TsxIndex:
+    """Índice de um arquivo já tokenizado (veja ``build_index``/``index_file``)"""
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.text = lexer.text
+        self.lines = lexer.lines
+        self.symbols = []          # todas as declarações indexadas, por offset
+        self.by_name = {}          # (componente ou None, nome) -> primeira declaração
+        self.components = []       # funções de componente (nome com maiúscula, no módulo)
+        self.returns = {}          # componente -> offsets dos "return" do corpo (o último é o render)
+        self.early_returns = {}    # componente -> os mesmos, sem o último
+        self._ref_offsets = {}     # nome -> offsets ordenados das referências
+        self._refs = {}            # nome -> [Reference] na mesma ordem
+        self._function_ranges = []
+        with profiling.span("index:build", len(self.text)) as span:
+            self._build()
+            span.matches = len(self.symbols)
+
+    # -- construção ----------------------------------------------------------
+
+    def _build(self):
+        lexer = self.lexer
+        tokens = lexer.tokens
+        lines = self.lines
+
+        for name, names, start, end, source in _imports(tokens):
+            self._add(Symbol(name, names, "import", start, end, lines, None, 0, source=source))
+
+        decls = declarations(lexer)
+        component_bodies = []
+        for decl in decls:
+            if decl.depth != 0:
+                continue
+            self._add(Symbol(decl.name, decl.names, decl.kind, decl.start, decl.end, lines,
+                             None, 0, decl.body_start))
+            if decl.kind == "function" and decl.body_start is not None and decl.name[:1].isupper():
+                body_end = lexer.pairs.get(decl.body_start, decl.end)
+                component_bodies.append((decl.name, decl.body_start, body_end))
+                self.components.append(self.by_name[None, decl.name])
+
+        for decl in decls:
+            if decl.depth != 1:
+                continue
+            for component, body_start, body_end in component_bodies:
+                if body_start < decl.start < body_end:
+                    self._add(Symbol(decl.name, decl.names, decl.kind, decl.start, decl.end,
+                                     lines, component, 1, decl.body_start))
+                    break
+
+        self.symbols.sort(key=lambda s: s.start)
+        # Um nível não se sobrepõe: busca binária separada para módulo e corpos
+        self._levels = []
+        for level in (1, 0):
+            symbols = [s for s in self.symbols if s.depth == level]
+            self._levels.append(([s.start for s in symbols], symbols))
+        self._function_ranges = _function_ranges(lexer)
+        self._sweep_references(tokens)
+
+    def _add(self, symbol):
+        self.symbols.append(symbol)
+        for name in symbol.names:
+            self.by_name.setdefault((symbol.scope, name), symbol)
+
+    def _sweep_references(self, tokens):
+        """Passada única pelos tokens registrando referências e ligando-as aos símbolos"""
+        symbols = self.symbols
+        lines = self.lines
+        ranges = self._function_ranges
+        range_index = 0
+        open_ranges = []
+        active = []          # símbolos que contêm a posição atual (módulo > corpo)
+        next_symbol = 0
+        unbound = {}         # símbolo -> nomes cujo sítio de declaração ainda não passou
+        count = len(tokens)
+
+        components = set(self.components)
+        returns = {c.name: [] for c in self.components}
+
+        for i, tok in enumerate(tokens):
+            start = tok.start
+            while active and start >= active[-1].end:
+                active.pop()
+            while next_symbol < len(symbols) and symbols[next_symbol].start <= start:
+                symbol = symbols[next_symbol]
+                while active and symbol.start >= active[-1].end:
+                    active.pop()
+                active.append(symbol)
+                unbound[symbol] = set(symbol.names)
+                next_symbol += 1
+            if open_ranges and min(open_ranges) <= start:
+                open_ranges = [end for end in open_ranges if end > start]
+            while range_index < len(ranges) and ranges[range_index][0] <= start:
+                if ranges[range_index][1] > start:
+                    open_ranges.append(ranges[range_index][1])
+                range_index += 1
+
+            # No corpo de um componente, o próprio corpo já é um dos intervalos abertos
+            in_component = bool(active) and active[0] in components
+            nested = len(open_ranges) > (1 if in_component else 0)
+
+            if tok.kind == IDENT and tok.value == "return" and in_component and not nested:
+                returns[active[0].name].append(start)
+                continue
+            if tok.kind == JSX_OPEN:
+                name = tok.value.split(".")[0]
+                if not name or not name[0].isupper():
+                    continue
+            elif tok.kind != IDENT or tok.value in KEYWORDS:
+                continue
+            else:
+                name = tok.value
+                prev = tokens[i - 1] if i else None
+                if prev is not None and prev.kind == PUNCT and prev.value in (".", "?."):
+                    continue
+                nxt = tokens[i + 1] if i + 1 < count else None
+                if (nxt is not None and nxt.kind == PUNCT and nxt.value == ":" and prev is not None
+                        and prev.kind == PUNCT and prev.value in ("{", ",")):
+                    continue  # chave de objeto literal (ou parâmetro tipado)
+
+            owner = active[-1] if active else None
+            if owner is not None:
+                if owner.kind == "import":
+                    continue
+                # sítio da própria declaração
+                if name in unbound[owner]:
+                    unbound[owner].discard(name)
+                    continue
+
+            for symbol in active:
+                symbol.refs.add(name)
+            self._ref_offsets.setdefault(name, []).append(start)
+            self._refs.setdefault(name, []).append(
+                Reference(name, start, lines.line_of(start), nested))
+
+        # o último return do corpo é o render; os anteriores são antecipados
+        self.returns = returns
+        self.early_returns = {name: offsets[:-1] for name, offsets in returns.items()}
+
+    # -- consultas -----------------------------------------------------------
+
+    def definition(self, name, component=None):
+        """Declaração de ``name`` vista de ``component`` (ou ``None``) - O(1).
+
+        Sem ``component``, vale a do módulo ou, se não houver, a do primeiro
+        componente que declara o nome.
+        """
+        symbol = self.by_name.get((component, name))
+        if symbol is None and component is not None:
+            symbol = self.by_name.get((None, name))
+        if symbol is None and component is None:
+            symbol = next((self.by_name[c.name, name] for c in self.components
+                           if (c.name, name) in self.by_name), None)
+        return symbol
+
+    def references(self, name):
+        """Usos de ``name`` em ordem de offset"""
+        return self._refs.get(name, [])
+
+    def references_between(self, name, start, end):
+        """Usos de ``name`` em [start, end) - O(log n)"""
+        offsets = self._ref_offsets.get(name, [])
+        lo, hi = bisect_left(offsets, start), bisect_left(offsets, end)
+        return self._refs[name][lo:hi] if hi > lo else []
+
+    def used_before_definition(self, name, component=None):
+        """Usos de ``name`` antes da declaração - O(log n).
+
+        Para declarações do corpo de um componente, só contam os usos dentro
+        dele. Usos em funções aninhadas (``deferred``) só rodam depois; os
+        demais acontecem durante o render e são erro de TDZ.
+        """
+        symbol = self.definition(name, component)
+        if symbol is None:
+            return []
+        start = self.by_name[None, symbol.scope].start if symbol.scope else 0
+        return self.references_between(name, start, symbol.start)
+
+    def defined_after_early_return(self, name, component=None):
+        """Offset do primeiro ``return`` antecipado que vem antes da declaração, se houver"""
+        symbol = self.definition(name, component)
+        if symbol is None or symbol.scope is None:
+            return None
+        returns = self.early_returns.get(symbol.scope, [])
+        index = bisect_right(returns, symbol.start)
+        return returns[0] if index else None
+
+    def symbol_at(self, offset):
+        """Declaração de topo mais interna que contém ``offset`` - O(log n)"""
+        for starts, symbols in self._levels:
+            index = bisect_right(starts, offset) - 1
+            if index >= 0 and offset < symbols[index].end:
+                return symbols[index]
+        return None
+
+    def component_symbols(self, component):
+        """Declarações do corpo de um componente, em ordem"""
+        return [s for s in self.symbols if s.scope == component]
+
+
+def _imports(tokens):
+    """``import ... from 'x'`` no topo: (nome, nomes, início, fim, módulo)"""
+    result = []
+    count = len(tokens)
+    i = 0
+    while i < count:
+        tok = tokens[i]
+        if not (tok.kind == IDENT and tok.value == "import" and tok.depth == 0):
+            i += 1
+            continue
+        names = []
+        k = i + 1
+        source = None
+        while k < count:
+            cur = tokens[k]
+            if cur.kind == STRING and cur.depth == 0:
+                source = cur.value[1:-1]
+                break
+            if cur.kind == IDENT and cur.value not in ("type", "from", "as") and cur.value != "*":
+                nxt = tokens[k + 1] if k + 1 < count else None
+                if not (nxt and nxt.kind == IDENT and nxt.value == "as"):
+                    names.append(cur.value)
+            k += 1
+        end_index = k + 1 if k + 1 < count and tokens[k + 1].kind == PUNCT and tokens[k + 1].value == ";" else k
+        if source is not None and names:
+            end = tokens[min(end_index, count - 1)].end
+            result.append((names[0], names, tok.start, end, source))
+        i = k + 1
+    return result
+
+
+def _function_ranges(lexer):
+    """Intervalos (início, fim) do corpo de cada função/arrow, ordenados pelo início"""
+    tokens = lexer.tokens
+    pairs = lexer.pairs
+    count = len(tokens)
+    ranges = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != PUNCT or tok.value != "=>":
+            if tok.kind == IDENT and tok.value == "function":
+                for k in range(i + 1, count):
+                    cur = tokens[k]
+                    if cur.kind == PUNCT and cur.value == "{" and cur.depth == tok.depth:
+                        ranges.append((cur.start, pairs.get(cur.start, len(lexer.text))))
+                        break
+                    if cur.depth < tok.depth:
+                        break
+            continue
+        nxt = tokens[i + 1] if i + 1 < count else None
+        if nxt is None:
+            continue
+        if nxt.kind == PUNCT and nxt.value == "{":
+            ranges.append((nxt.start, pairs.get(nxt.start, len(lexer.text))))
+            continue
+        # corpo de expressão: até a vírgula/fechamento na mesma profundidade
+        end = len(lexer.text)
+        for k in range(i + 1, count):
+            cur = tokens[k]
+            if cur.depth < tok.depth or (cur.depth == tok.depth and cur.kind == PUNCT
+                                         and cur.value in (",", ";", ")", "]", "}")):
+                end = cur.start
+                break
+        ranges.append((nxt.start, end))
+    ranges.sort()
+    return ranges
+
+
+def build_index(text, jsx=True):
+    """Tokeniza e indexa um texto"""
+    return TsxIndex(tokenize(text, jsx=jsx))
+
+
+def index_file(path):
+    """Tokeniza e indexa um arquivo"""
+    return TsxIndex(tokenize_file(path))
@@ -0,0 +1,785 @@
+#!/usr/bin/env python3
+"""Tokenizador TSX de passada única, ciente de strings, comentários, templates e JSX
+
+Mantém uma pilha de delimitadores abertos (``{ ( [``, template literals e
+tags JSX); o modo de leitura é sempre definido pelo topo da pilha. Assim
+chaves dentro de strings, comentários, texto JSX ou templates não contam,
+e cada delimitador sem par é reportado com linha e coluna exatas.
+
+A cada ~2 KB o lexer guarda um checkpoint do seu estado; ``relex`` usa o
+último checkpoint antes do primeiro byte alterado para retokenizar só o
+trecho editado em diante.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+import profiling
+
+# Tipos de token
+IDENT = "ident"
+NUMBER = "number"
+STRING = "string"
+TEMPLATE = "template"
+REGEX = "regex"
+PUNCT = "punct"
+COMMENT = "comment"
+JSX_OPEN = "jsx_open"            # <Nome  (value = nome da tag, '' para fragment)
+JSX_ATTR = "jsx_attr"            # nome de atributo
+JSX_TAG_END = "jsx_tag_end"      # > que fecha a tag de abertura
+JSX_SELF_CLOSE = "jsx_self_close"  # />
+JSX_CLOSE = "jsx_close"          # </Nome>
+JSX_TEXT = "jsx_text"
+
+ERROR = "error"
+HINT = "hint"
+
+# depth = tamanho da pilha de delimitadores quando o token começa
+# (um "{" e o "}" que o fecha têm a mesma profundidade)
+Token = namedtuple("Token", "kind value start end depth")
+Diagnostic = namedtuple("Diagnostic", "offset level message")
+
+OPENERS = {"{": "}", "(": ")", "[": "]"}
+CLOSERS = {"}": "{", ")": "(", "]": "["}
+
+# Palavras após as quais "/" inicia regex e "<" inicia JSX
+EXPR_KEYWORDS = frozenset({
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await", "default",
+})
+
+CODE_RE = re.compile(r"""
+ (?P<ws>[\s\ufeff]+)
+|(?P<line_comment>//[^\n]*)
+|(?P<block_comment>/\*[\s\S]*?(?:\*/|\Z))
+|(?P<string>'(?:[^'\\\n]|\\[\s\S])*'?|"(?:[^"\\\n]|\\[\s\S])*"?)
+|(?P<ident>[^\W\d][\w$]*|\$[\w$]*)
+|(?P<number>0[xXbBoO][\da-fA-F_]+n?|\d[\d_]*(?:\.[\d_]*)?(?:[eE][+-]?\d+)?n?|\.\d[\d_]*(?:[eE][+-]?\d+)?)
+|(?P<punct>=>|\.\.\.|\?\.(?!\d)|\?\?=?|[=!]==?|&&=?|\|\|=?|\*\*=?|\+\+|--|<<=?|>>>?=?|[-+*%&|^<>/]=?|[{}()\[\];,.:?~@#`!=])
+""", re.X)
+
+TEMPLATE_RE = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*")
+REGEX_BODY_RE = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*")
+
+# Em .tsx, ``<T,`` / ``<T extends U`` / ``<T = U`` abrem parâmetros de tipo
+# (arrow function genérica), não uma tag; mesma regra do compilador do TypeScript
+TYPE_PARAMS_RE = re.compile(r"<\s*(?:const\s+)?(?:[^\W\d][\w$]*|\$[\w$]*)\s*(?:[,=]|extends\b(?=\s*([^\s=>/])))")
+JSX_NAME_RE = re.compile(r"\s*([^\W\d][\w$.:-]*|\$[\w$.:-]*)?")
+JSX_CLOSE_RE = re.compile(r"</\s*([^\W\d][\w$.:-]*|\$[\w$.:-]*)?\s*>")
+JSX_TEXT_RE = re.compile(r"[^{<]+")
+JSX_TAG_RE = re.compile(r"""
+ (?P<ws>\s+)
+|(?P<attr>[^\W\d][\w$.:-]*|\$[\w$.:-]*)
+|(?P<string>"[^"]*"?|'[^']*'?)
+|(?P<self_close>/>)
+|(?P<tag_end>>)
+|(?P<eq>=)
+|(?P<brace>\{)
+|(?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+""", re.X)
+
+# Estados de um frame de tag JSX
+TAG = "tag"
+CHILDREN = "children"
+
+# Distância mínima (em caracteres) entre checkpoints
+CHECKPOINT_INTERVAL = 2048
+
+
+class Frame:
+    """Delimitador aberto na pilha"""
+    __slots__ = ("char", "start", "state", "element", "attr")
+
+    def __init__(self, char, start, state=None, element=None):
+        self.char = char
+        self.start = start
+        self.state = state
+        self.element = element
+        self.attr = None
+
+
+class JsxElement:
+    """Elemento JSX com seus offsets: ``<tag ...>`` em [start, tag_end) e ``</tag>`` em [close_start, end)"""
+    __slots__ = ("name", "start", "tag_end", "close_start", "end", "parent", "attrs", "depth")
+
+    def __init__(self, name, start, parent, depth):
+        self.name = name
+        self.start = start
+        self.tag_end = None
+        self.close_start = None
+        self.end = None
+        self.parent = parent
+        self.attrs = {}
+        self.depth = depth
+
+    def __repr__(self):
+        return f"<JsxElement {self.name!r} {self.start}-{self.end}>"
+
+
+class Checkpoint:
+    """Estado do lexer numa fronteira de token, para retomar a partir dali"""
+    __slots__ = ("pos", "tokens", "log", "elements", "frames", "open_elements", "prev")
+
+    def __init__(self, lexer):
+        self.pos = lexer.pos
+        self.tokens = len(lexer.tokens)
+        self.log = len(lexer._log)
+        self.elements = len(lexer.elements)
+        self.frames = tuple((f.char, f.start, f.state, f.element, f.attr) for f in lexer.stack)
+        # elementos abertos ainda vão receber tag_end/atributos/fechamento
+        self.open_elements = tuple((e, e.tag_end, dict(e.attrs)) for e in lexer.open_elements)
+        self.prev = lexer.prev
+
+    def restore(self, lexer):
+        lexer.pos = self.pos
+        lexer.stack = []
+        for char, start, state, element, attr in self.frames:
+            frame = Frame(char, start, state, element)
+            frame.attr = attr
+            lexer.stack.append(frame)
+        lexer.open_elements = []
+        for element, tag_end, attrs in self.open_elements:
+            element.tag_end = tag_end
+            element.attrs = dict(attrs)
+            element.close_start = element.end = None
+            lexer.open_elements.append(element)
+        lexer.prev = self.prev
+
+
+class LineIndex:
+    """Converte offsets em (linha, coluna), ambos a partir de 1"""
+
+    def __init__(self, text):
+        self.starts = [0] + [m.end() for m in re.finditer("\n", text)]
+
+    def position(self, offset):
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+    def line_of(self, offset):
+        return bisect_right(self.starts, offset)
+
+
+class TsxLexer:
+    """Tokenizador com pilha de delimitadores; ``jsx=False`` para arquivos .ts"""
+
+    def __init__(self, text, jsx=True, keep_comments=False):
+        self.text = text
+        self.jsx = jsx
+        self.keep_comments = keep_comments
+        self.tokens = []
+        self.diagnostics = []
+        self._log = []         # diagnósticos na ordem em que foram emitidos
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        self.resumed_from = None  # offset de onde ``relex`` retomou (None: do zero)
+        self.pairs = {}        # offset de abertura -> offset do fechamento
+        self.elements = []     # JsxElement na ordem de abertura
+        self.stack = []
+        self.open_elements = []
+        self.pos = 0
+        self.prev = (None, None)  # (tipo, valor) do último token significativo
+        self._lines = None
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = LineIndex(self.text)
+        return self._lines
+
+    def position(self, offset):
+        return self.lines.position(offset)
+
+    # -- laço principal ------------------------------------------------------
+
+    def run(self):
+        n = len(self.text)
+        while self.pos < n:
+            if self.pos >= self._next_checkpoint:
+                self._checkpoint()
+            top = self.stack[-1] if self.stack else None
+            if top is None or top.char in OPENERS:
+                self._lex_code()
+            elif top.char == "`":
+                self._lex_template(top)
+            elif top.state == TAG:
+                self._lex_jsx_tag(top)
+            else:
+                self._lex_jsx_children(top)
+        self._finish()
+        return self
+
+    def _emit(self, kind, value, start, end):
+        self.tokens.append(Token(kind, value, start, end, len(self.stack)))
+
+    def _error(self, offset, message, level=ERROR):
+        self._log.append(Diagnostic(offset, level, message))
+
+    def _checkpoint(self):
+        self.checkpoints.append(Checkpoint(self))
+        self._next_checkpoint = self.pos + CHECKPOINT_INTERVAL
+
+    def _describe(self, frame):
+        line, col = self.position(frame.start)
+        if frame.char == "<":
+            return f"tag <{frame.element.name}> de {line}:{col}"
+        if frame.char == "`":
+            return f"template literal de {line}:{col}"
+        return f"'{frame.char}' de {line}:{col}"
+
+    def _expr_allowed(self):
+        kind, value = self.prev
+        if kind is None:
+            return True
+        if kind == PUNCT:
+            return value not in (")", "]")
+        if kind == IDENT:
+            return value in EXPR_KEYWORDS
+        return False
+
+    # -- código --------------------------------------------------------------
+
+    def _lex_code(self):
+        text = self.text
+        n = len(text)
+        match_code = CODE_RE.match
+        emit = self._emit
+        while self.pos < n:
+            pos = self.pos
+            if pos >= self._next_checkpoint:
+                self._checkpoint()
+            m = match_code(text, pos)
+            if m is None:
+                # Caractere solto (ex.: "\"): vira pontuação de 1 caractere
+                emit(PUNCT, text[pos], pos, pos + 1)
+                self.prev = (PUNCT, text[pos])
+                self.pos = pos + 1
+                continue
+            group = m.lastgroup
+            end = m.end()
+            if group == "ws":
+                self.pos = end
+            elif group == "ident":
+                value = m.group()
+                emit(IDENT, value, pos, end)
+                self.prev = (IDENT, value)
+                self.pos = end
+            elif group == "punct":
+                value = m.group()
+                if value in OPENERS:
+                    emit(PUNCT, value, pos, end)
+                    self.stack.append(Frame(value, pos))
+                    self.prev = (PUNCT, value)
+                    self.pos = end
+                elif value in CLOSERS:
+                    self.pos = end
+                    self._close(value, pos)
+                    self.prev = (PUNCT, value)
+                    if self.stack and self.stack[-1].char not in OPENERS:
+                        return
+                elif value == "`":
+                    self.stack.append(Frame("`", pos))
+                    self.pos = end
+                    return
+                elif value[0] == "/" and self._expr_allowed():
+                    self._lex_regex(pos)
+                elif value[0] == "<" and self.jsx and self._expr_allowed() and not self._type_params(pos) \
+                        and self._jsx_start(pos):
+                    return
+                else:
+                    emit(PUNCT, value, pos, end)
+                    self.prev = (PUNCT, value)
+                    self.pos = end
+            elif group == "string":
+                value = m.group()
+                if len(value) < 2 or value[-1] != value[0]:
+                    self._error(pos, "string não terminada")
+                emit(STRING, value, pos, end)
+                self.prev = (STRING, value)
+                self.pos = end
+            elif group == "number":
+                emit(NUMBER, m.group(), pos, end)
+                self.prev = (NUMBER, m.group())
+                self.pos = end
+            else:
+                if group == "block_comment" and not m.group().endswith("*/"):
+                    self._error(pos, "comentário /* não terminado")
+                if self.keep_comments:
+                    emit(COMMENT, m.group(), pos, end)
+                self.pos = end
+
+    def _lex_regex(self, pos):
+        m = REGEX_BODY_RE.match(self.text, pos)
+        if m is None:
+            # Não era regex: divisão
+            value = "/=" if self.text.startswith("/=", pos) else "/"
+            self._emit(PUNCT, value, pos, pos + len(value))
+            self.prev = (PUNCT, value)
+            self.pos = pos + len(value)
+            return
+        self._emit(REGEX, m.group(), pos, m.end())
+        self.prev = (REGEX, m.group())
+        self.pos = m.end()
+
+    def _close(self, char, pos):
+        """Fecha o delimitador do topo; em caso de erro reporta e tenta se recuperar"""
+        opener = CLOSERS[char]
+        stack = self.stack
+        if stack and stack[-1].char == opener:
+            frame = stack.pop()
+            self.pairs[frame.start] = pos
+            self._emit(PUNCT, char, pos, pos + 1)
+            return
+
+        # Procura o par mais abaixo, sem atravessar templates ou tags JSX
+        index = len(stack) - 1
+        while index >= 0 and stack[index].char in OPENERS and stack[index].char != opener:
+            index -= 1
+        line, col = self.position(pos)
+        if index < 0 or stack[index].char != opener:
+            expected = f" (esperado '{OPENERS[stack[-1].char]}')" if stack and stack[-1].char in OPENERS else ""
+            self._error(pos, f"'{char}' em {line}:{col} sem abertura correspondente{expected}")
+            self._emit(PUNCT, char, pos, pos + 1)
+            return
+        while len(stack) - 1 > index:
+            frame = stack.pop()
+            self._error(frame.start, f"{self._describe(frame)} sem fechamento antes de '{char}' em {line}:{col}")
+        frame = stack.pop()
+        self.pairs[frame.start] = pos
+        self._emit(PUNCT, char, pos, pos + 1)
+
+    # -- template literals ---------------------------------------------------
+
+    def _lex_template(self, frame):
+        text = self.text
+        start = self.pos
+        end = TEMPLATE_RE.match(text, start).end()
+        if end > start:
+            self._emit(TEMPLATE, text[start:end], start, end)
+        if end >= len(text):
+            self.pos = end
+            return
+        if text[end] == "`":
+            self.stack.pop()
+            self.pairs[frame.start] = end
+            self.prev = (TEMPLATE, "`")
+            self.pos = end + 1
+        else:  # "${"
+            self._emit(PUNCT, "${", end, end + 2)
+            self.stack.append(Frame("{", end + 1))
+            self.prev = (PUNCT, "${")
+            self.pos = end + 2
+
+    # -- JSX -----------------------------------------------------------------
+
+    def _type_params(self, pos):
+        """``<`` em ``pos`` abre parâmetros de tipo de uma arrow function genérica"""
+        m = TYPE_PARAMS_RE.match(self.text, pos)
+        if m is None:
+            return False
+        # a decisão olhou até o caractere depois de ``extends``: nenhum checkpoint
+        # no meio, senão ``relex`` retomaria depois do "<" sem refazê-la
+        self._next_checkpoint = max(self._next_checkpoint, m.end(1) if m.group(1) else m.end())
+        return True
+
+    def _jsx_start(self, pos):
+        """Abre uma tag JSX em ``pos`` ("<"); devolve False se não parece JSX"""
+        text = self.text
+        m = JSX_NAME_RE.match(text, pos + 1)
+        name = m.group(1)
+        after = m.end()
+        if name is None and not text.startswith(">", after):
+            return False
+        parent = self.open_elements[-1] if self.open_elements else None
+        element = JsxElement(name or "", pos, parent, len(self.stack))
+        self.elements.append(element)
+        self._emit(JSX_OPEN, element.name, pos, after)
+        frame = Frame("<", pos, TAG, element)
+        self.stack.append(frame)
+        self.open_elements.append(element)
+        self.pos = after
+        if name is None:  # fragment <>
+            frame.state = CHILDREN
+            element.tag_end = after + 1
+            self._emit(JSX_TAG_END, ">", after, after + 1)
+            self.pos = after + 1
+        return True
+
+    def _end_element(self, frame, close_start, end):
+        self.stack.pop()
+        self.open_elements.pop()
+        element = frame.element
+        element.close_start = close_start
+        element.end = end
+        self.pairs[frame.start] = close_start
+        # O elemento inteiro é um valor para o código ao redor
+        self.prev = (PUNCT, ")")
+
+    def _lex_jsx_tag(self, frame):
+        text = self.text
+        pos = self.pos
+        m = JSX_TAG_RE.match(text, pos)
+        if m is None:
+            line, col = self.position(pos)
+            self._error(pos, f"caractere inesperado {text[pos]!r} na tag <{frame.element.name}> em {line}:{col}")
+            self.pos = pos + 1
+            return
+        group = m.lastgroup
+        end = m.end()
+        self.pos = end
+        element = frame.element
+        if group == "attr":
+            frame.attr = m.group()
+            element.attrs[frame.attr] = True
+            self._emit(JSX_ATTR, frame.attr, pos, end)
+        elif group == "string":
+            value = m.group()
+            if len(value) < 2 or value[-1] != value[0]:
+                self._error(pos, "string não terminada em atributo JSX")
+            if frame.attr and self.tokens[-1].value == "=":
+                element.attrs[frame.attr] = value[1:-1]
+            self._emit(STRING, value, pos, end)
+        elif group == "brace":
+            if frame.attr and self.tokens[-1].value == "=":
+                element.attrs[frame.attr] = None
+            frame.attr = None
+            self._emit(PUNCT, "{", pos, end)
+            self.stack.append(Frame("{", pos))
+            self.prev = (PUNCT, "{")
+        elif group == "tag_end":
+            frame.state = CHILDREN
+            element.tag_end = end
+            self._emit(JSX_TAG_END, ">", pos, end)
+        elif group == "self_close":
+            element.tag_end = end
+            self._emit(JSX_SELF_CLOSE, "/>", pos, end)
+            self._end_element(frame, pos, end)
+        elif group == "eq":
+            self._emit(PUNCT, "=", pos, end)
+        elif group == "comment" and self.keep_comments:
+            self._emit(COMMENT, m.group(), pos, end)
+
+    def _lex_jsx_children(self, frame):
+        text = self.text
+        pos = self.pos
+        char = text[pos]
+        if char == "{":
+            self._emit(PUNCT, "{", pos, pos + 1)
+            self.stack.append(Frame("{", pos))
+            self.prev = (PUNCT, "{")
+            self.pos = pos + 1
+        elif char == "<":
+            if text.startswith("</", pos):
+                m = JSX_CLOSE_RE.match(text, pos)
+                if m is None:
+                    line, col = self.position(pos)
+                    self._error(pos, f"tag de fechamento malformada em {line}:{col}")
+                    self.pos = pos + 2
+                    return
+                name = m.group(1) or ""
+                self._emit(JSX_CLOSE, name, pos, m.end())
+                self.pos = m.end()
+                if name == frame.element.name:
+                    self._end_element(frame, pos, m.end())
+                    return
+                line, col = self.position(pos)
+                # Fecha até a tag correspondente, se ela estiver aberta mais abaixo
+                depth = len(self.stack) - 1
+                while depth >= 0 and not (self.stack[depth].char == "<" and
+                                          self.stack[depth].element.name == name):
+                    if self.stack[depth].char != "<":
+                        depth = -1
+                        break
+                    depth -= 1
+                if depth < 0:
+                    self._error(pos, f"</{name}> em {line}:{col} não corresponde a {self._describe(frame)}")
+                    return
+                while len(self.stack) - 1 > depth:
+                    unclosed = self.stack[-1]
+                    self._error(unclosed.start, f"{self._describe(unclosed)} sem fechamento antes de </{name}> em {line}:{col}")
+                    self._end_element(unclosed, pos, pos)
+                self._end_element(self.stack[-1], pos, m.end())
+            elif not self._jsx_start(pos):
+                self._emit(JSX_TEXT, "<", pos, pos + 1)
+                self.pos = pos + 1
+        else:
+            m = JSX_TEXT_RE.match(text, pos)
+            value = m.group()
+            if value.strip():
+                self._emit(JSX_TEXT, value, pos, m.end())
+            self.pos = m.end()
+
+    # -- fim do arquivo ------------------------------------------------------
+
+    def _finish(self):
+        for frame in self.stack:
+            self._error(frame.start, f"{self._describe(frame)} sem fechamento até o fim do arquivo")
+        self.diagnostics = sorted(self._log, key=lambda d: d.offset)
+
+    # -- consultas -----------------------------------------------------------
+
+    @property
+    def errors(self):
+        return [d for d in self.diagnostics if d.level == ERROR]
+
+    def indentation_mismatch(self, open_at):
+        """Mensagem se o "{" em ``open_at`` fecha com indentação diferente da abertura"""
+        close_at = self.pairs.get(open_at)
+        if close_at is None or self.text[open_at] != "{":
+            return None
+        lines = self.lines
+        open_line, close_line = lines.line_of(open_at), lines.line_of(close_at)
+        if open_line == close_line:
+            return None
+        open_indent = _indent(self.text, lines.starts[open_line - 1])
+        close_indent = _indent(self.text, lines.starts[close_line - 1])
+        if open_indent == close_indent:
+            return None
+        return (f"'{{' da linha {open_line} (indentação {open_indent}) fecha na linha "
+                f"{close_line} (indentação {close_indent})")
+
+    def indentation_hints(self, limit=3):
+        """Pares de chaves cuja indentação do fechamento difere da abertura.
+
+        Quando falta ou sobra uma chave, o primeiro par "torto" costuma
+        apontar o lugar real do erro (o delimitador sem par fica no fim).
+        """
+        hints = []
+        for open_at in sorted(self.pairs):
+            message = self.indentation_mismatch(open_at)
+            if message:
+                hints.append(Diagnostic(open_at, HINT, message))
+                if len(hints) >= limit:
+                    break
+        return hints
+
+
+def _indent(text, line_start):
+    end = line_start
+    while end < len(text) and text[end] in " \t":
+        end += 1
+    return end - line_start
+
+
+def tokenize(text, jsx=True, keep_comments=False):
+    """Tokeniza o texto e devolve o lexer (tokens, pares, elementos e diagnósticos)"""
+    with profiling.span("lexer:tokenize", len(text)) as span:
+        lexer = TsxLexer(text, jsx=jsx, keep_comments=keep_comments).run()
+        span.matches = len(lexer.tokens)
+    return lexer
+
+
+def common_prefix(a, b):
+    """Tamanho do maior prefixo comum de duas strings (comparações em blocos)"""
+    limit = min(len(a), len(b))
+    lo = 0
+    block = 4096
+    while lo + block <= limit and a[lo:lo + block] == b[lo:lo + block]:
+        lo += block
+    hi = min(lo + block, limit)
+    # busca binária no último bloco: a[:lo] == b[:lo] é sempre verdade
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def relex(lexer, text, changed_at=None):
+    """Tokeniza ``text`` reaproveitando o prefixo já tokenizado de ``lexer``.
+
+    Retoma do último checkpoint antes do primeiro caractere alterado
+    (``changed_at``, calculado se omitido). Os ``JsxElement`` são
+    compartilhados com o lexer antigo, que não deve mais ser usado.
+    """
+    if changed_at is None:
+        changed_at = common_prefix(lexer.text, text)
+    with profiling.span("lexer:relex", len(text)) as span:
+        # o checkpoint precisa estar antes do caractere alterado (o token anterior
+        # pode ter olhado um caractere adiante)
+        index = bisect_left([c.pos for c in lexer.checkpoints], changed_at) - 1
+        fresh = TsxLexer(text, jsx=lexer.jsx, keep_comments=lexer.keep_comments)
+        if index >= 0:
+            checkpoint = lexer.checkpoints[index]
+            fresh.tokens = lexer.tokens[:checkpoint.tokens]
+            fresh._log = lexer._log[:checkpoint.log]
+            fresh.elements = lexer.elements[:checkpoint.elements]
+            fresh.pairs = {start: end for start, end in lexer.pairs.items() if end < checkpoint.pos}
+            fresh.checkpoints = lexer.checkpoints[:index + 1]
+            fresh._next_checkpoint = checkpoint.pos + CHECKPOINT_INTERVAL
+            fresh.resumed_from = checkpoint.pos
+            checkpoint.restore(fresh)
+        fresh.run()
+        span.matches = len(fresh.tokens) - (lexer.checkpoints[index].tokens if index >= 0 else 0)
+    return fresh
+
+
+def tokenize_file(path, keep_comments=False):
+    """Tokeniza um arquivo; JSX só é reconhecido em .tsx/.jsx"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+    return tokenize(text, jsx=not path.endswith((".ts", ".js")), keep_comments=keep_comments)
+
+
+# ---------------------------------------------------------------------------
+# Declarações (const/let/var/function/class) a partir da sequência de tokens
+# ---------------------------------------------------------------------------
+
+DECL_KEYWORDS = frozenset({"const", "let", "var", "function", "class"})
+STATEMENT_KEYWORDS = DECL_KEYWORDS | {"return", "if", "for", "while", "export", "import", "switch", "try", "throw"}
+
+Declaration = namedtuple("Declaration", "name names kind start end depth body_start")
+
+
+def declarations(lexer):
+    """Lista as declarações do arquivo, em ordem, com seus intervalos de offsets.
+
+    ``kind`` é 'function' (função/arrow), 'hook' (inicializador ``useX(...)``),
+    'class' ou 'value'. ``body_start`` é o offset do ``{`` do corpo da função
+    (ou ``None``).
+    """
+    tokens = lexer.tokens
+    count = len(tokens)
+    result = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != IDENT or tok.value not in DECL_KEYWORDS:
+            continue
+        if i and tokens[i - 1].kind == PUNCT and tokens[i - 1].value in (".", "?."):
+            continue
+        depth = tok.depth
+        start = tok.start
+        # export / export default / async antes da palavra-chave
+        j = i - 1
+        while j >= 0 and tokens[j].kind == IDENT and tokens[j].value in ("export", "default", "async") \
+                and tokens[j].depth == depth:
+            start = tokens[j].start
+            j -= 1
+
+        if tok.value in ("function", "class"):
+            k = i + 1
+            if k < count and tokens[k].kind == PUNCT and tokens[k].value == "*":
+                k += 1
+            if k >= count or tokens[k].kind != IDENT:
+                continue
+            names = [tokens[k].value]
+            body = _next_brace(tokens, k + 1, depth)
+            if body is None:
+                continue
+            end = lexer.pairs.get(tokens[body].start)
+            end = len(lexer.text) if end is None else end + 1
+            kind = "function" if tok.value == "function" else "class"
+            result.append(Declaration(names[0], names, kind, start, end, depth, tokens[body].start))
+            continue
+
+        names, k = _binding_names(tokens, i + 1)
+        if not names:
+            continue
+        end_index = _statement_end(tokens, k, depth)
+        end = tokens[end_index].end if end_index < count else len(lexer.text)
+        kind, body_start = _initializer_kind(tokens, k, end_index, depth)
+        result.append(Declaration(names[0], names, kind, start, end, depth, body_start))
+    return result
+
+
+def _next_brace(tokens, index, depth):
+    for k in range(index, len(tokens)):
+        tok = tokens[k]
+        if tok.depth == depth and tok.kind == PUNCT:
+            if tok.value == "{":
+                return k
+            if tok.value in (";", "}"):
+                return None
+        elif tok.depth < depth:
+            return None
+    return None
+
+
+def _binding_names(tokens, index):
+    """Nomes ligados por ``const X`` / ``const [a, b]`` / ``const { a, b: c }``"""
+    if index >= len(tokens):
+        return [], index
+    tok = tokens[index]
+    if tok.kind == IDENT:
+        return [tok.value], index + 1
+    if tok.kind != PUNCT or tok.value not in ("[", "{"):
+        return [], index
+    depth = tok.depth
+    names = []
+    k = index + 1
+    while k < len(tokens) and tokens[k].depth > depth:
+        cur = tokens[k]
+        nxt = tokens[k + 1] if k + 1 < len(tokens) else None
+        if cur.kind == IDENT and not (nxt and nxt.kind == PUNCT and nxt.value == ":"
+                                      and tok.value == "{" and nxt.depth == cur.depth):
+            prev = tokens[k - 1]
+            # pula valores padrão (a = 1) e tipos
+            if not (prev.kind == PUNCT and prev.value in ("=", ".")):
+                names.append(cur.value)
+        k += 1
+    return names, k + 1
+
+
+def _statement_end(tokens, index, depth):
+    """Índice do token que encerra a declaração iniciada antes de ``index``"""
+    count = len(tokens)
+    k = index
+    prev = None
+    while k < count:
+        tok = tokens[k]
+        if tok.depth < depth:
+            return k - 1
+        if tok.depth == depth:
+            if tok.kind == PUNCT and tok.value in (";", ","):
+                if tok.value == ";":
+                    return k
+                # const a = 1, b = 2: a vírgula só encerra fora de parênteses
+            elif (tok.kind == IDENT and tok.value in STATEMENT_KEYWORDS and prev is not None
+                  and prev.kind in (PUNCT, IDENT, STRING, NUMBER, TEMPLATE)
+                  and not (prev.kind == PUNCT and prev.value not in (")", "]", "}"))):
+                # ASI: nova instrução sem ";" na mesma profundidade
+                return k - 1
+            prev = tok
+        k += 1
+    return count - 1
+
+
+def _initializer_kind(tokens, index, end_index, depth):
+    """Classifica o inicializador (tokens entre ``=`` e o fim da declaração)"""
+    k = index
+    count = min(end_index + 1, len(tokens))
+    # pula a anotação de tipo até o "="
+    while k < count and not (tokens[k].depth == depth and tokens[k].kind == PUNCT and tokens[k].value == "="):
+        k += 1
+    k += 1
+    if k >= count:
+        return "value", None
+    first = tokens[k]
+    if first.kind == IDENT and first.value == "await":
+        k += 1
+        if k >= count:
+            return "value", None
+        first = tokens[k]
+    if first.kind == IDENT and first.value == "async":
+        k += 1
+    head = tokens[k] if k < count else first
+    if head.kind == IDENT and head.value == "function":
+        body = _next_brace(tokens, k + 1, depth)
+        return "function", tokens[body].start if body is not None else None
+    # (params) => ... ou x => ...
+    for m in range(k, count):
+        tok = tokens[m]
+        if tok.depth == depth and tok.kind == PUNCT:
+            if tok.value == "=>":
+                nxt = tokens[m + 1] if m + 1 < len(tokens) else None
+                body = nxt.start if nxt and nxt.kind == PUNCT and nxt.value == "{" else None
+                return "function", body
+            if tok.value not in ("(", ")", ":", ",", "<", ">", "|", "[", "]", "?", "."):
+                break
+        elif tok.depth == depth and tok.kind != IDENT:
+            break
+    if head.kind == IDENT and head.value.startswith("use") and k + 1 < count \
+            and tokens[k + 1].kind == PUNCT and tokens[k + 1].value in ("(", "<"):
+        return "hook", None
+    return "value", None
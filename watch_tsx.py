@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Modo watch: roda os verificadores TSX de novo só nos arquivos alterados
+
+Na partida analisa app/ e components/ inteiros e guarda, por arquivo, o
+texto e o lexer (com seus checkpoints). A cada alteração só o arquivo
+tocado é relido, e o tokenizador retoma do último checkpoint antes do
+primeiro caractere alterado; os demais arquivos continuam em memória.
+Usa inotify (Linux, via ctypes) e cai para polling de mtime/tamanho onde
+ele não existir.
+
+Uso:
+    python watch_tsx.py                 # app/ e components/
+    python watch_tsx.py --index         # também usos antes da definição/hooks (check_page)
+    python watch_tsx.py --poll 0.5 app  # força polling
+"""
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from check_page import find_problems
+from check_syntax import DEFAULT_DIRS, SUFFIXES, collect_paths, print_report
+from codemod import read_file
+from tsx_index import TsxIndex
+from tsx_lexer import relex, tokenize
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
+
+# Editores gravam em várias etapas; espera um pouco para juntar os eventos
+SETTLE_SECONDS = 0.02
+
+
+class InotifyWatcher:
+    """Observa as pastas (recursivamente) com inotify"""
+
+    def __init__(self, roots, suffixes):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify indisponível")
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falhou")
+        self.suffixes = suffixes
+        self.dirs = {}
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root):
+        """Adiciona a pasta e as subpastas; devolve os arquivos encontrados (pasta nova)"""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd >= 0:
+                self.dirs[wd] = dirpath
+            found.extend(os.path.join(dirpath, f) for f in filenames if f.endswith(self.suffixes))
+        return found
+
+    def _read_events(self):
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            yield wd, mask, name
+
+    def wait(self, timeout):
+        """Bloqueia até haver eventos; devolve ``(alterados, removidos)``"""
+        changed, removed = set(), set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed, removed
+        time.sleep(SETTLE_SECONDS)
+        for wd, mask, name in self._read_events():
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_DELETE_SELF:
+                del self.dirs[wd]
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    changed.update(self._add_tree(path))
+                continue
+            if not name.endswith(self.suffixes):
+                continue
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                removed.add(path)
+                changed.discard(path)
+            else:
+                changed.add(path)
+                removed.discard(path)
+        return changed, removed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Alternativa sem inotify: compara mtime/tamanho a cada ``interval`` segundos"""
+
+    def __init__(self, roots, suffixes, interval=0.5):
+        self.roots = roots
+        self.suffixes = suffixes
+        self.interval = interval
+        self.stats = self._scan()
+
+    def _scan(self):
+        stats = {}
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                for filename in filenames:
+                    if filename.endswith(self.suffixes):
+                        path = os.path.join(dirpath, filename)
+                        try:
+                            st = os.stat(path)
+                        except OSError:
+                            continue
+                        stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def wait(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        stats = self._scan()
+        changed = {p for p, st in stats.items() if self.stats.get(p) != st}
+        removed = set(self.stats) - set(stats)
+        self.stats = stats
+        return changed, removed
+
+    def close(self):
+        pass
+
+
+class FileState:
+    """Resultado em cache de um arquivo"""
+    __slots__ = ("text", "lexer", "errors", "hints", "problems")
+
+    def __init__(self, text, lexer, errors, hints, problems):
+        self.text = text
+        self.lexer = lexer
+        self.errors = errors
+        self.hints = hints
+        self.problems = problems
+
+
+class Analyzer:
+    """Mantém a análise de cada arquivo e refaz só o que mudou"""
+
+    def __init__(self, show_functions=False, check_index=False):
+        self.show_functions = show_functions
+        self.check_index = check_index
+        self.files = {}
+
+    def update(self, path):
+        """Reanalisa ``path``; devolve ``(estado, offset de retomada ou None)`` ou ``None`` se nada mudou"""
+        path = os.path.normpath(path)
+        try:
+            text = read_file(path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        old = self.files.get(path)
+        if old is not None and old.text == text:
+            return None
+        jsx = not path.endswith(".ts")
+        lexer = relex(old.lexer, text) if old is not None else tokenize(text, jsx=jsx)
+        errors = lexer.errors
+        hints = lexer.indentation_hints() if errors else []
+        problems = find_problems(TsxIndex(lexer)) if self.check_index and jsx and not errors else []
+        state = self.files[path] = FileState(text, lexer, errors, hints, problems)
+        return state, lexer.resumed_from
+
+    def remove(self, path):
+        self.files.pop(os.path.normpath(path), None)
+
+    def report(self, path, state):
+        print_report(path, state.lexer, state.errors, state.hints, self.show_functions)
+        for line, message in state.problems:
+            print(f"   ❌ linha {line}: {message}")
+
+    def totals(self):
+        errors = sum(len(s.errors) + len(s.problems) for s in self.files.values())
+        failing = sum(1 for s in self.files.values() if s.errors or s.problems)
+        return errors, failing
+
+
+def make_watcher(roots, poll=None):
+    if poll is None:
+        try:
+            return InotifyWatcher(roots, SUFFIXES)
+        except OSError as e:
+            print(f"ℹ️  inotify indisponível ({e}); usando polling", file=sys.stderr)
+            poll = 0.5
+    return PollingWatcher(roots, SUFFIXES, poll)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="pastas a observar (padrão: app/ e components/)")
+    parser.add_argument("-f", "--functions", action="store_true",
+                        help="mostra o balanceamento de cada função")
+    parser.add_argument("--index", action="store_true",
+                        help="também aponta usos antes da definição e hooks após return antecipado")
+    parser.add_argument("--poll", type=float, metavar="SEG",
+                        help="usa polling com esse intervalo em vez de inotify")
+    args = parser.parse_args()
+
+    roots = [p for p in (args.paths or DEFAULT_DIRS) if os.path.isdir(p)]
+    analyzer = Analyzer(args.functions, args.index)
+    started = time.perf_counter()
+    for path in collect_paths(roots):
+        result = analyzer.update(path)
+        if result and (result[0].errors or result[0].problems):
+            analyzer.report(path, result[0])
+    errors, failing = analyzer.totals()
+    print(f"👀 {len(analyzer.files)} arquivo(s) em {(time.perf_counter() - started) * 1000:.0f} ms; "
+          f"{errors} erro(s) em {failing} arquivo(s). Observando {', '.join(roots)}... (Ctrl+C para sair)")
+
+    watcher = make_watcher(roots, args.poll)
+    try:
+        while True:
+            changed, removed = watcher.wait(1.0)
+            for path in sorted(removed):
+                analyzer.remove(path)
+                print(f"🗑️  {os.path.normpath(path)}")
+            for path in sorted(changed):
+                start = time.perf_counter()
+                result = analyzer.update(path)
+                if result is None:
+                    continue
+                state, resumed_at = result
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"\n🔄 {time.strftime('%H:%M:%S')} {os.path.normpath(path)} "
+                      f"({elapsed:.1f} ms{'' if resumed_at is None else f', retomado do offset {resumed_at}'})")
+                analyzer.report(path, state)
+            if changed or removed:
+                errors, failing = analyzer.totals()
+                print(f"📊 {errors} erro(s) em {failing} arquivo(s)")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())